@@ -0,0 +1,96 @@
+"""Time the Parquet job archive on three weeks of hourly cycles against the hourly CSV files it replaced
+
+The synthetic jobs are saved in the hour they were posted, one append per cycle, then the finished days are
+compacted. Reports compaction, a full load, a two-day two-source three-column query and disk use; the CSV baseline
+writes each cycle as a file and loads them all with pandas. Needs pyarrow. Run from the repository root:
+
+    python -m benchmarks.bench_archive [--count 100000]
+"""
+import argparse
+import contextlib
+import csv
+import os
+import tempfile
+import time
+from datetime import timedelta
+from itertools import groupby
+import pandas as pd
+from benchmarks.synthetic import START, synthetic_jobs
+from src.utils.config import Config
+from src.utils.job_archive import JobArchive
+from src.utils.logger import Logger
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:36} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def disk_usage(directory: str, suffix: str):
+    """Number and total MB of the files with the given suffix under a directory"""
+    sizes = [
+        os.path.getsize(os.path.join(path, name))
+        for path, _, names in os.walk(directory) for name in names if name.endswith(suffix)
+    ]
+    return len(sizes), sum(sizes) / 2 ** 20
+
+
+def read_csvs(directory: str) -> pd.DataFrame:
+    return pd.concat([pd.read_csv(os.path.join(directory, name)) for name in sorted(os.listdir(directory))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    if not JobArchive.available():
+        raise SystemExit('pyarrow is not installed')
+    with tempfile.TemporaryDirectory() as directory:
+        with contextlib.chdir(directory):
+            Logger()  # the run's log file goes to the temporary directory, not the repository's logs/
+        jobs = sorted(synthetic_jobs(args.count), key=lambda job: job.posted_time)
+        cycles = [
+            list(group) for _, group in groupby(jobs, key=lambda job: job.posted_time.replace(minute=0, second=0))
+        ]
+        Config().settings['archive'] = {'dir': os.path.join(directory, 'archive')}
+        archive = JobArchive()
+        csv_dir = os.path.join(directory, 'jobs')
+        os.makedirs(csv_dir)
+        print(f"{len(jobs)} synthetic jobs in {len(cycles)} hourly cycles")
+
+        def append_cycles():
+            for cycle in cycles:
+                archive.append(cycle, saved=cycle[0].posted_time.date())
+
+        def write_csvs():
+            for cycle in cycles:
+                with open(os.path.join(csv_dir, f"jobs_{cycle[0].posted_time:%Y%m%d_%H%M%S}.csv"), 'w', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(cycle[0].to_dict()))
+                    writer.writeheader()
+                    writer.writerows(job.to_dict() for job in cycle)
+
+        timed('archive appends', append_cycles)
+        before = disk_usage(archive.archive_dir, '.parquet')[0]
+        timed('compaction', archive.compact)
+        files, parquet_mb = disk_usage(archive.archive_dir, '.parquet')
+        print(f"  {'files before and after compaction':36} {before} -> {files}")
+        frame = timed('archive full load', archive.query)
+        assert len(frame) == len(jobs)
+        start = START + timedelta(days=10)
+        timed('archive 2 days, 2 sources, 3 columns', lambda: archive.query(
+            start=start, end=start + timedelta(days=2), sources=['Dice', 'BuiltIn'],
+            columns=['title', 'company', 'link']
+        ))
+
+        timed('hourly CSVs write', write_csvs)
+        frame = timed('hourly CSVs full load (pandas)', lambda: read_csvs(csv_dir))
+        assert len(frame) == len(jobs)
+        csv_mb = disk_usage(csv_dir, '.csv')[1]
+        print(f"  {'disk, archive and CSV':36} {parquet_mb:.1f} MB, {csv_mb:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare the memory held by 100k jobs in each in-memory layout
+
+Builds the same synthetic jobs as a list of plain (unslotted, uninterned) dataclasses, the way Job was defined
+before slots, as a list of Job, and as a JobBatch, and reports the traced memory each keeps alive and its pickled
+size, which is what crosses a process pool. Run from the repository root:
+
+    python -m benchmarks.bench_memory [--count 100000]
+"""
+import argparse
+import pickle
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+from benchmarks.synthetic import synthetic_rows
+from src.models.job import Job
+from src.models.job_batch import JobBatch
+
+
+@dataclass
+class PlainJob:
+    title: str
+    company: str
+    link: str
+    posted_time: datetime
+    source: str
+    location: Optional[str] = None
+    is_remote: bool = False
+    match_score: Optional[float] = None
+    matched_title: Optional[str] = None
+
+
+def retained(build: Callable[[], object]):
+    """Build a layout and return it with the traced memory still held once building is done"""
+    tracemalloc.start()
+    layout = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return layout, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    layouts = {
+        'plain dataclass': lambda: [PlainJob(**row) for row in synthetic_rows(args.count)],
+        'Job (slots, interned)': lambda: [Job(**row) for row in synthetic_rows(args.count)],
+        'JobBatch': lambda: JobBatch(Job(**row) for row in synthetic_rows(args.count))
+    }
+    print(f"{args.count} synthetic jobs")
+    for name, build in layouts.items():
+        layout, current = retained(build)
+        pickled = len(pickle.dumps(layout, protocol=pickle.HIGHEST_PROTOCOL))
+        print(f"  {name:22} {current / 2 ** 20:7.1f} MB held  {pickled / 2 ** 20:7.1f} MB pickled")
+        del layout
+
+
+if __name__ == '__main__':
+    main()
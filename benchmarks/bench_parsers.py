@@ -0,0 +1,82 @@
+"""Time each HTML parser backend on the saved search pages
+
+Parses every page in benchmarks/pages with its source's spec and reports milliseconds per page (parse plus
+extraction), then checks that every backend extracted the same jobs. The heavy page is also parsed with and without
+parse_only, reporting time and peak traced memory. Run from the repository root:
+
+    python -m benchmarks.bench_parsers [--runs 5]
+"""
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+from benchmarks.make_pages import BOARD_PAGES, HEAVY_PAGE, PAGES_DIR
+from src.scrapers.spec_scraper import SpecScraper, load_source_specs
+from src.utils.html_parser import PARSER_BACKENDS, ParseOnly, _available
+
+
+def read_page(filename: str) -> str:
+    with open(os.path.join(PAGES_DIR, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def extract(scraper: SpecScraper, html: str) -> List[Tuple[str, str, str, str]]:
+    """Parse a page and reduce its jobs to the fields every backend must agree on"""
+    return [(job.title, job.company, job.link, job.location) for job in scraper._parse_rows(html, {})]
+
+
+def time_parse(scraper: SpecScraper, html: str, backend: str, parse_only: ParseOnly, runs: int) -> float:
+    """Average milliseconds to parse and extract a page"""
+    scraper.parser_backend, scraper.parse_only = backend, parse_only
+    extract(scraper, html)  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(runs):
+        extract(scraper, html)
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def peak_kb(scraper: SpecScraper, html: str) -> float:
+    """Peak traced memory of one parse in KB"""
+    tracemalloc.start()
+    extract(scraper, html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    backends = [backend for backend in PARSER_BACKENDS if _available(backend)]
+    specs = {spec.name: spec for spec in load_source_specs()}
+    print(f"ms per page, full parse, average of {args.runs} runs")
+    for name, filename in BOARD_PAGES.items():
+        scraper = SpecScraper(specs[name])
+        html = read_page(filename)
+        timings = '  '.join(
+            f"{backend} {time_parse(scraper, html, backend, None, args.runs):6.1f}" for backend in backends
+        )
+        results: Dict[str, list] = {}
+        for backend in backends:
+            scraper.parser_backend = backend
+            results[backend] = extract(scraper, html)
+        identical = len({tuple(jobs) for jobs in results.values()}) == 1
+        print(f"  {name:11} {len(html) // 1024:3} KB  {timings}  identical={identical}")
+
+    scraper = SpecScraper(specs['Dice'])
+    html = read_page(HEAVY_PAGE)
+    card_only = (scraper.spec.card.name, scraper.spec.card.class_)
+    print(f"\n{HEAVY_PAGE} ({len(html) // 1024} KB), full parse vs parse_only={card_only}")
+    for backend in backends:
+        rows = []
+        for label, parse_only in (('full', None), ('partial', card_only)):
+            ms = time_parse(scraper, html, backend, parse_only, args.runs)
+            rows.append(f"{label} {ms:6.1f} ms {peak_kb(scraper, html):8.0f} KB peak")
+        print(f"  {backend:11} {'  '.join(rows)}")
+
+
+if __name__ == '__main__':
+    main()
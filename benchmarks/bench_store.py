@@ -0,0 +1,79 @@
+"""Time saving and reading synthetic jobs with JobStore against the hourly CSV files it replaced
+
+Upserts the jobs into a fresh jobs.db in one cycle, upserts them again (every row conflicts), and reads them back
+sorted, in full and for one source over the last day. The CSV baseline writes the same jobs as hourly files and
+reads them back the way the GUI did, with pandas concatenating every file and sorting. Works in a temporary
+directory. Run from the repository root:
+
+    python -m benchmarks.bench_store [--count 20000]
+"""
+import argparse
+import contextlib
+import csv
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+import pandas as pd
+from benchmarks.synthetic import START, synthetic_jobs
+from src.utils.job_store import JobStore
+from src.utils.logger import Logger
+
+CSV_FIELDS = ['title', 'company', 'link', 'posted_time', 'source', 'location', 'is_remote']
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:34} {(time.perf_counter() - start) * 1000:7.1f} ms")
+    return result
+
+
+def write_csvs(directory: str, jobs, per_file: int):
+    for start in range(0, len(jobs), per_file):
+        with open(os.path.join(directory, f'jobs_{start:08d}.csv'), 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for job in jobs[start:start + per_file]:
+                writer.writerow({field: value for field, value in job.to_dict().items() if field in CSV_FIELDS})
+
+
+def read_csvs(directory: str) -> pd.DataFrame:
+    frames = [pd.read_csv(os.path.join(directory, name)) for name in sorted(os.listdir(directory))]
+    return pd.concat(frames, ignore_index=True).sort_values('posted_time', ascending=False)
+
+
+def filter_csvs(directory: str, source: str, since: datetime) -> pd.DataFrame:
+    frame = read_csvs(directory)
+    return frame[(frame['source'] == source) & (frame['posted_time'] >= since.isoformat())]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--per-file', type=int, default=1000, help='jobs per hourly CSV file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        with contextlib.chdir(directory):
+            Logger()  # the run's log file goes to the temporary directory, not the repository's logs/
+        jobs = list(synthetic_jobs(args.count))
+        store = JobStore(os.path.join(directory, 'jobs.db'))
+        print(f"{args.count} synthetic jobs")
+        timed('JobStore upsert (new rows)', lambda: store.save_jobs(jobs))
+        timed('JobStore upsert (existing rows)', lambda: store.save_jobs(jobs))
+        read = timed('JobStore read sorted', store.jobs)
+        assert len(read) == args.count
+        since = START + timedelta(days=20)
+        timed('JobStore one source, last day', lambda: store.jobs(since=since, source='Dice'))
+
+        csv_dir = os.path.join(directory, 'jobs')
+        os.makedirs(csv_dir)
+        timed(f'hourly CSVs write ({args.per_file} per file)', lambda: write_csvs(csv_dir, jobs, args.per_file))
+        frame = timed('hourly CSVs read sorted (pandas)', lambda: read_csvs(csv_dir))
+        assert len(frame) == args.count
+        timed('hourly CSVs one source, last day', lambda: filter_csvs(csv_dir, 'Dice', since))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Regenerate the saved search pages in benchmarks/pages
+
+The pages are committed so timings are comparable between runs; this script only documents how they were built.
+Each page uses the card and field selectors of its source in config/sources.yaml, surrounded by the navigation,
+script and footer noise real search pages carry. Run from the repository root:
+
+    python -m benchmarks.make_pages
+"""
+import os
+from typing import Dict
+from src.scrapers.spec_scraper import SourceSpec, load_source_specs
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pages')
+
+# Field text per card; {index} makes every card distinct, entities and markup exercise text extraction
+FIELD_TEXT = {
+    'title': 'Software Engineer {index} &amp; Platform',
+    'company': 'Acme <b>{index}</b>',
+    'location': 'Remote, US',
+    'posted_time': '10 minutes ago'
+}
+
+# Saved page of each source compared across parser backends
+BOARD_PAGES = {'Dice': 'dice.html', 'BuiltIn': 'builtin.html', 'Levels.fyi': 'levels.html'}
+
+# Dice page dominated by markup outside the cards, compared with and without partial parsing
+HEAVY_PAGE = 'dice_heavy.html'
+
+
+def noise() -> str:
+    """A script that mentions card markup and a long navigation list"""
+    links = ''.join(f'<li><a href="/nav/{index}">Category &amp; {index}</a></li>' for index in range(300))
+    return f'<script>var template = "<div class=card>";</script><nav><ul>{links}</ul></nav>'
+
+
+def card(spec: SourceSpec, index: int) -> str:
+    """One job card in a source's markup"""
+    parts = []
+    for name, selector in spec.fields.items():
+        if name == 'link':
+            parts.append(f'<{selector.name} class="{selector.class_}" href="/jobs/{index}">apply</{selector.name}>')
+        else:
+            text = FIELD_TEXT[name].format(index=index)
+            parts.append(f'<{selector.name} class="{selector.class_}"> {text} </{selector.name}>')
+    return f'<{spec.card.name} class="{spec.card.class_} featured"><!-- card -->{"".join(parts)}</{spec.card.name}>'
+
+
+def board_page(spec: SourceSpec, cards: int = 200) -> str:
+    """A search page of the given number of cards between navigation and footer noise"""
+    body = ''.join(card(spec, index) for index in range(cards))
+    return (
+        f'<html><head><title>{spec.name} jobs</title></head><body>{noise()}'
+        f'<main><div class="results">{body}</div></main><footer>{noise()}</footer></body></html>'
+    )
+
+
+def heavy_page(spec: SourceSpec, cards: int = 100) -> str:
+    """A page dominated by inline script, style and nested navigation, as large search pages are"""
+    nav = ''.join(
+        f'<li><a href="/c/{index}">Category {index}</a><ul>'
+        + ''.join(f'<li><a href="/c/{index}/{sub}">Sub {sub}</a></li>' for sub in range(10))
+        + '</ul></li>'
+        for index in range(150)
+    )
+    script = '<script>' + 'var x=1;' * 20000 + '</script>'
+    style = '<style>' + 'a{}' * 5000 + '</style>'
+    body = ''.join(card(spec, index) for index in range(cards))
+    return (
+        f'<html><head>{script}{style}</head><body><nav><ul>{nav}</ul></nav>'
+        f'<div class="results">{body}</div><footer><ul>{nav}</ul></footer></body></html>'
+    )
+
+
+def main():
+    specs: Dict[str, SourceSpec] = {spec.name: spec for spec in load_source_specs()}
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    pages = {filename: board_page(specs[name]) for name, filename in BOARD_PAGES.items()}
+    pages[HEAVY_PAGE] = heavy_page(specs['Dice'])
+    for filename, html in pages.items():
+        with open(os.path.join(PAGES_DIR, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"{filename}: {len(html) // 1024} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Synthetic jobs for the memory and storage benchmarks
+
+Jobs are generated from a seed, so every run sees the same data. Each row gets freshly built strings, as jobs
+parsed from separate pages do, so string sharing in the code under test is measured rather than assumed.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Iterator
+from src.models.job import Job
+from src.scrapers.spec_scraper import load_source_specs
+
+TITLE_WORDS = [
+    'Senior', 'Staff', 'Lead', 'Principal', 'Software', 'Backend', 'Frontend', 'Full Stack', 'Data', 'Platform',
+    'Machine Learning', 'Python', 'Cloud', 'Security', 'Mobile', 'Engineer', 'Developer', 'Scientist', 'Manager'
+]
+
+CITIES = [
+    'New York', 'San Francisco', 'Seattle', 'Austin', 'Boston', 'Chicago', 'Denver', 'Atlanta', 'Miami', 'Portland',
+    'Los Angeles', 'San Diego', 'Dallas', 'Houston', 'Phoenix', 'Philadelphia', 'Pittsburgh', 'Raleigh', 'Nashville',
+    'Minneapolis', 'Detroit', 'Columbus', 'Salt Lake City', 'Toronto', 'London', 'Berlin', 'Remote'
+]
+
+REGIONS = ['NY', 'CA', 'WA', 'TX', 'MA', 'IL', 'CO', 'GA', 'US']
+
+START = datetime(2026, 3, 1)
+
+
+def synthetic_rows(count: int = 100000, seed: int = 1, companies: int = 5000, days: int = 21) -> Iterator[dict]:
+    """Yield count job fields from 13 sources, ~240 locations and the given number of companies over the given days"""
+    rng = random.Random(seed)
+    sources = [spec.name for spec in load_source_specs()]
+    locations = [f'{city}, {region}' for city in CITIES for region in REGIONS]
+    span = days * 24 * 3600
+    for index in range(count):
+        source = sources[index % len(sources)]
+        location = rng.choice(locations)
+        yield {
+            'title': ' '.join(rng.sample(TITLE_WORDS, rng.randint(2, 4))),
+            'company': f'Company {rng.randrange(companies)}',
+            'link': f'https://example.com/{source.lower().replace(" ", "-")}/jobs/{index}',
+            'posted_time': START + timedelta(seconds=rng.randrange(span)),
+            'source': ''.join(source),  # a new object per row, as parsed text is
+            'location': ''.join(location),
+            'is_remote': location.startswith('Remote')
+        }
+
+
+def synthetic_jobs(count: int = 100000, **options) -> Iterator[Job]:
+    """Yield count synthetic jobs"""
+    return (Job(**row) for row in synthetic_rows(count, **options))
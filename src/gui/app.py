@@ -3,8 +3,6 @@ from tkinter import ttk, messagebox, scrolledtext
 from typing import List, Callable
 import threading
 from datetime import datetime
-import pandas as pd
-import os
 from src.utils.file_manager import FileManager
 from src.utils.job_matcher import JobMatcher
 from src.utils.logger import Logger
@@ -90,7 +88,7 @@ class JobScraperGUI:
     def _setup_jobs_tab(self):
         """Setup the jobs viewer tab"""
         # Create treeview
-        self.tree = ttk.Treeview(self.jobs_tab, columns=("Title", "Company", "Location", "Posted", "Source", "Remote"), show="headings")
+        self.tree = ttk.Treeview(self.jobs_tab, columns=("Title", "Company", "Location", "Posted", "Source", "Also On", "Remote", "Match"), show="headings")
         
         # Configure columns
         self.tree.heading("Title", text="Title", command=lambda: self._sort_jobs("Title"))
@@ -98,7 +96,9 @@ class JobScraperGUI:
         self.tree.heading("Location", text="Location", command=lambda: self._sort_jobs("Location"))
         self.tree.heading("Posted", text="Posted", command=lambda: self._sort_jobs("Posted"))
         self.tree.heading("Source", text="Source", command=lambda: self._sort_jobs("Source"))
+        self.tree.heading("Also On", text="Also On", command=lambda: self._sort_jobs("Also On"))
         self.tree.heading("Remote", text="Remote", command=lambda: self._sort_jobs("Remote"))
+        self.tree.heading("Match", text="Match", command=lambda: self._sort_jobs("Match"))
         
         # Set column widths
         self.tree.column("Title", width=200)
@@ -106,7 +106,9 @@ class JobScraperGUI:
         self.tree.column("Location", width=100)
         self.tree.column("Posted", width=100)
         self.tree.column("Source", width=100)
+        self.tree.column("Also On", width=100)
         self.tree.column("Remote", width=50)
+        self.tree.column("Match", width=50)
         
         # Add scrollbars
         yscroll = ttk.Scrollbar(self.jobs_tab, orient=tk.VERTICAL, command=self.tree.yview)
@@ -127,48 +129,37 @@ class JobScraperGUI:
         refresh_button.grid(row=2, column=0, pady=5)
     
     def _load_jobs(self):
-        """Load jobs from CSV files into the treeview"""
+        """Load stored jobs into the treeview, best title matches first"""
         # Clear existing items
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Get all CSV files in the jobs directory
-        jobs_dir = "data/jobs"
-        if not os.path.exists(jobs_dir):
+        try:
+            jobs = self.file_manager.load_jobs()
+        except Exception as e:
+            self.logger.error(f"Error reading jobs: {str(e)}")
             return
         
-        all_jobs = []
-        for filename in os.listdir(jobs_dir):
-            if filename.endswith(".csv"):
-                filepath = os.path.join(jobs_dir, filename)
-                try:
-                    df = pd.read_csv(filepath)
-                    all_jobs.append(df)
-                except Exception as e:
-                    self.logger.error(f"Error reading {filename}: {str(e)}")
-        
-        if all_jobs:
-            # Combine all jobs
-            combined_df = pd.concat(all_jobs, ignore_index=True)
-            
-            # Sort by posted time (newest first)
-            combined_df = combined_df.sort_values("Posted", ascending=False)
-            
-            # Add to treeview
-            for _, row in combined_df.iterrows():
-                self.tree.insert("", "end", values=(
-                    row["Title"],
-                    row["Company"],
-                    row["Location"],
-                    row["Posted"],
-                    row["Source"],
-                    "Yes" if row["Is Remote"] else "No"
-                ))
+        for job in jobs:
+            self.tree.insert("", "end", values=(
+                job.title,
+                job.company,
+                job.location or "",
+                job.posted_time.isoformat(),
+                job.source,
+                ", ".join(source for source in job.sources if source != job.source),
+                "Yes" if job.is_remote else "No",
+                "" if job.match_score is None else f"{job.match_score:.0f}"
+            ))
     
     def _sort_jobs(self, column):
         """Sort jobs by the specified column"""
         items = [(self.tree.set(item, column), item) for item in self.tree.get_children("")]
-        items.sort()
+        if column == "Match":
+            # Numeric, best first, unscored last
+            items.sort(key=lambda entry: float(entry[0]) if entry[0] else -1, reverse=True)
+        else:
+            items.sort()
         
         for index, (_, item) in enumerate(items):
             self.tree.move(item, "", index)
@@ -200,15 +191,17 @@ class JobScraperGUI:
         # Save titles
         self.file_manager.save_job_titles(titles)
         
+        # Start scraping
+        if not self.on_start(titles):
+            messagebox.showinfo("Busy", "The previous run is still finishing its cycle. Try again in a moment.")
+            return
+        self.logger.info(f"Started scraping with titles: {titles}")
+        
         # Update UI
         self.status_var.set("Running")
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.is_running = True
-        
-        # Start scraping
-        self.on_start(titles)
-        self.logger.info(f"Started scraping with titles: {titles}")
     
     def _stop_scraping(self):
         """Stop the job scraping process"""
@@ -2,27 +2,35 @@ import asyncio
 import schedule
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import threading
 import os
 import sys
 import signal
+from src.utils.config import Config
+from src.utils.content_hash_store import ContentHashStore
 from src.utils.file_manager import FileManager
+from src.utils.http_client import HttpClient
 from src.utils.job_matcher import JobMatcher
 from src.utils.logger import Logger
-from src.scrapers.builtin_scraper import BuiltInScraper
-from src.scrapers.levels_scraper import LevelsScraper
-from src.scrapers.hiring_cafe_scraper import HiringCafeScraper
-from src.scrapers.ycombinator_scraper import YCombinatorScraper
-from src.scrapers.wellfound_scraper import WellfoundScraper
-from src.scrapers.stackoverflow_scraper import StackOverflowScraper
-from src.scrapers.dice_scraper import DiceScraper
-from src.scrapers.crunchbase_scraper import CrunchbaseScraper
-from src.scrapers.venturefizz_scraper import VentureFizzScraper
-from src.scrapers.techcrunch_scraper import TechCrunchScraper
-from src.scrapers.venturebeat_scraper import VentureBeatScraper
+from src.utils.near_duplicates import NearDuplicateIndex
+from src.utils.parse_pool import ParsePool
+from src.utils.request_planner import RequestPlanner
+from src.utils.seen_index import SeenIndex
+from src.utils.title_match_cache import TitleMatchCache
+from src.scrapers.linkedin_scraper import LinkedInScraper
+from src.scrapers.simplify_scraper import SimplifyScraper
+from src.scrapers.spec_scraper import SpecScraper, load_source_specs
+from src.scrapers.welcome_to_jungle_scraper import WelcomeToJungleScraper
 from src.models.job import Job
 
+# JSON API scrapers, each enabled by its flag under api_sources in config.yaml
+API_SCRAPERS = {
+    'linkedin': LinkedInScraper,
+    'simplify': SimplifyScraper,
+    'welcome_to_jungle': WelcomeToJungleScraper
+}
+
 class JobScraper:
     def __init__(self):
         self.file_manager = FileManager()
@@ -32,27 +40,34 @@ class JobScraper:
         self.job_titles: List[str] = []
         self.matcher: Optional[JobMatcher] = None
         self.pid_file = "job_scraper.pid"
+        self.http_client = HttpClient()
+        self.content_hashes = ContentHashStore()
+        self.request_planner = RequestPlanner()
+        self.parse_pool = ParsePool()
+        self.title_cache = TitleMatchCache()
+        self.seen_jobs = SeenIndex()
+        self.near_duplicates = NearDuplicateIndex()
+        self.max_concurrent_sources = Config().get('scraping', 'max_concurrent_sources', 6)
+        self.retention_hours = Config().get('files', 'file_retention_hours', 24)
         
-        # Initialize scrapers (only non-API sites)
-        self.scrapers = [
-            BuiltInScraper(),        # Web scraping
-            LevelsScraper(),         # Web scraping
-            HiringCafeScraper(),     # Web scraping
-            YCombinatorScraper(),    # Web scraping
-            WellfoundScraper(),      # Web scraping
-            StackOverflowScraper(),  # Web scraping
-            DiceScraper(),           # Web scraping
-            CrunchbaseScraper(),     # Web scraping
-            VentureFizzScraper(),    # Web scraping
-            TechCrunchScraper(),     # Web scraping
-            VentureBeatScraper()     # Web scraping
+        # One spec-driven scraper per enabled HTML job board in config/sources.yaml
+        self.scrapers = [SpecScraper(spec) for spec in load_source_specs() if spec.enabled]
+        self.scrapers += [
+            scraper() for name, scraper in API_SCRAPERS.items() if Config().get('api_sources', name, False)
         ]
         
+        # All scrapers borrow the same pooled HTTP client, page hash store, request planner and parse pool
+        for scraper in self.scrapers:
+            scraper.http_client = self.http_client
+            scraper.content_hashes = self.content_hashes
+            scraper.request_planner = self.request_planner
+            scraper.parse_pool = self.parse_pool
+        
         # Load saved job titles if they exist
         saved_titles = self.file_manager.load_job_titles()
         if saved_titles:
             self.job_titles = saved_titles
-            self.matcher = JobMatcher(saved_titles)
+            self.matcher = JobMatcher(saved_titles, cache=self.title_cache)
             self.is_running = True
             self._start_scraping_thread()
     
@@ -77,62 +92,135 @@ class JobScraper:
         current_hour = datetime.now().hour
         return 7 <= current_hour or current_hour < 1
     
+    def _unique_titles(self) -> List[str]:
+        """Drop titles that differ only in case or spacing so each search runs once"""
+        titles = []
+        seen = set()
+        for title in self.job_titles:
+            key = ' '.join(title.lower().split())
+            if key not in seen:
+                seen.add(key)
+                titles.append(title)
+        return titles
+    
     async def _scrape_jobs(self):
         """Scrape jobs from all sources"""
         if not self.matcher:
             return
         
         all_jobs: List[Job] = []
+        await self.http_client.start()
+        self.request_planner.begin_cycle()
+        job_titles = self._unique_titles()
         
-        # Run scrapers with delay between each
-        for scraper in self.scrapers:
-            try:
-                jobs = await scraper.scrape_jobs(self.job_titles)
-                all_jobs.extend(jobs)
-                
-                # Add delay between scrapers to avoid overwhelming servers
-                await asyncio.sleep(5)
-                
-            except Exception as e:
-                self.logger.error(f"Error in {scraper.__class__.__name__}: {str(e)}")
-                continue
-        
-        # Filter jobs based on titles and location
-        filtered_jobs = self.matcher.filter_jobs(all_jobs)
-        filtered_jobs = [
-            job for job in filtered_jobs
-            if job.is_remote or self.matcher.is_valid_location(job.location)
-        ]
+        # Run scrapers concurrently; politeness is enforced per host by the HTTP client
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
+        
+        async def run_scraper(scraper) -> List[Job]:
+            async with semaphore:
+                try:
+                    return await scraper.scrape_jobs(job_titles)
+                except Exception as e:
+                    self.logger.error(f"Error in {scraper.source_name}: {str(e)}")
+                    return []
+        
+        results = await asyncio.gather(*(run_scraper(scraper) for scraper in self.scrapers))
+        
+        # Pages shared between duplicate requests yield the same jobs more than once
+        seen_links = set()
+        for jobs in results:
+            for job in jobs:
+                if (job.source, job.link) not in seen_links:
+                    seen_links.add((job.source, job.link))
+                    all_jobs.append(job)
+        
+        self.request_planner.log_stats()
+        self._log_page_stats()
+        self.http_client.log_stats(self.http_client.reset_stats())
+        self.logger.info(f"Per-host request rates: {self.http_client.rate_limiter.rates()}")
+        open_breakers = self.breaker_states()
+        if open_breakers:
+            self.logger.warning(f"Tripped circuit breakers: {open_breakers}")
+        self.http_client.response_cache.log_stats()
+        self.http_client.response_cache.save()
+        self.content_hashes.log_stats()
+        self.content_hashes.save()
+        
+        # Filter jobs based on titles and location, best title matches first
+        filtered_jobs = self.matcher.top_jobs(all_jobs)
+        filtered_jobs = self.matcher.filter_locations(filtered_jobs)
+        self.title_cache.log_stats()
+        self.title_cache.save()
+        
+        # Only keep postings not saved by an earlier cycle or from another board
+        filtered_jobs = self.seen_jobs.filter_new(filtered_jobs)
+        self.seen_jobs.log_stats()
+        
+        # Collapse the same role posted on several boards into one record listing every board
+        filtered_jobs = self.near_duplicates.collapse(filtered_jobs)
+        self.near_duplicates.log_stats()
         
         # Save jobs
         if filtered_jobs:
             self.file_manager.save_jobs(filtered_jobs)
             self.logger.info(f"Saved {len(filtered_jobs)} new jobs")
+        # Postings are only marked as seen once they are stored
+        self.seen_jobs.commit()
+        self.near_duplicates.save()
+        self.file_manager.cleanup_old_jobs(self.retention_hours)
+        self.file_manager.compact_archive()
+    
+    def _log_page_stats(self):
+        """Log how many result pages each source read this cycle and why paging stopped"""
+        for scraper in self.scrapers:
+            stats = scraper.reset_page_stats()
+            if stats['pages']:
+                stops = ', '.join(f"{reason}: {count}" for reason, count in sorted(stats['stops'].items()))
+                self.logger.info(f"{scraper.source_name}: read {stats['pages']} pages (stopped on {stops})")
+    
+    def breaker_states(self) -> Dict[str, str]:
+        """Sources and hosts whose circuit breaker is currently open or half-open"""
+        return self.http_client.breakers.states()
     
     def _scraping_loop(self):
         """Main scraping loop"""
-        while self.is_running:
-            try:
-                # Run scraping tasks
-                asyncio.run(self._scrape_jobs())
-                
-                # Wait for an hour before next scrape
-                for _ in range(3600):  # 1 hour = 3600 seconds
-                    if not self.is_running:
-                        break
-                    time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error in scraping loop: {str(e)}")
-                time.sleep(300)  # Wait 5 minutes before retrying on error
-    
-    def start(self, job_titles: List[str]):
-        """Start the job scraping process"""
+        # Keep one event loop for the thread so the pooled session survives between cycles
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        
+        try:
+            while self.is_running:
+                try:
+                    # Run scraping tasks
+                    loop.run_until_complete(self._scrape_jobs())
+                    
+                    # Wait for an hour before next scrape
+                    for _ in range(3600):  # 1 hour = 3600 seconds
+                        if not self.is_running:
+                            break
+                        time.sleep(1)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error in scraping loop: {str(e)}")
+                    time.sleep(300)  # Wait 5 minutes before retrying on error
+        finally:
+            loop.run_until_complete(self.http_client.close())
+            loop.close()
+            self.parse_pool.shutdown()
+    
+    def start(self, job_titles: List[str]) -> bool:
+        """Start the job scraping process, returning whether it started"""
         if self.is_running:
-            return
+            return False
+        
+        # The HTTP client and parse pool belong to one scraping thread at a time; a cycle that
+        # outlived stop()'s join would otherwise share, or close, them under the new thread
+        if self.scraping_thread and self.scraping_thread.is_alive():
+            self.logger.warning("The previous scraping run is still finishing its cycle; start again once it stops")
+            return False
         
         self.job_titles = job_titles
-        self.matcher = JobMatcher(job_titles)
+        self.matcher = JobMatcher(job_titles, cache=self.title_cache)
         self.is_running = True
         
         # Save job titles
@@ -145,6 +233,7 @@ class JobScraper:
         self._start_scraping_thread()
         
         self.logger.info(f"Started scraping for titles: {', '.join(job_titles)}")
+        return True
     
     def stop(self):
         """Stop the job scraping process"""
@@ -209,7 +298,7 @@ def main():
         scraper = JobScraper()
         
         def on_start(titles: List[str]):
-            scraper.start(titles)
+            return scraper.start(titles)
         
         def on_stop():
             scraper.stop()
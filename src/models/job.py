@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     title: str
     company: str
@@ -11,6 +12,19 @@ class Job:
     source: str
     location: Optional[str] = None
     is_remote: bool = False
+    match_score: Optional[float] = None  # best title match score, set by JobMatcher
+    matched_title: Optional[str] = None  # target title that produced match_score
+    sources: Tuple[str, ...] = ()  # every board listing the job, set when near-duplicates are merged
+    
+    def __post_init__(self):
+        """Share one copy of the strings that repeat across many jobs"""
+        self.company = sys.intern(self.company)
+        self.source = sys.intern(self.source)
+        if self.location:
+            self.location = sys.intern(self.location)
+        if self.matched_title:
+            self.matched_title = sys.intern(self.matched_title)
+        self.sources = tuple(sys.intern(source) for source in self.sources)
     
     def to_dict(self) -> dict:
         """Convert job to dictionary for CSV storage"""
@@ -21,7 +35,10 @@ class Job:
             'posted_time': self.posted_time.isoformat(),
             'source': self.source,
             'location': self.location or '',
-            'is_remote': self.is_remote
+            'is_remote': self.is_remote,
+            'match_score': '' if self.match_score is None else self.match_score,
+            'matched_title': self.matched_title or '',
+            'sources': ', '.join(self.sources)
         }
     
     @classmethod
@@ -34,5 +51,8 @@ class Job:
             posted_time=datetime.fromisoformat(data['posted_time']),
             source=data['source'],
             location=data['location'] if data['location'] else None,
-            is_remote=data['is_remote']
-        ) 
\ No newline at end of file
+            is_remote=data['is_remote'],
+            match_score=float(data['match_score']) if data.get('match_score') not in (None, '') else None,
+            matched_title=data.get('matched_title') or None,
+            sources=tuple(data['sources'].split(', ')) if data.get('sources') else ()
+        )
@@ -0,0 +1,60 @@
+import math
+import sys
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from src.models.job import Job
+
+class JobBatch:
+    def __init__(self, jobs: Iterable[Job] = ()):
+        self.titles: List[str] = []
+        self.companies: List[str] = []
+        self.links: List[str] = []
+        self.posted_times = array('d')  # epoch seconds
+        self.sources: List[str] = []
+        self.locations: List[Optional[str]] = []
+        self.remote = array('b')
+        self.match_scores = array('d')  # NaN where unscored
+        self.matched_titles: List[Optional[str]] = []
+        self.source_lists: List[Tuple[str, ...]] = []  # Job.sources of each row
+        self.extend(jobs)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator[Job]:
+        return (self[index] for index in range(len(self)))
+
+    def __getitem__(self, index: int) -> Job:
+        """Rebuild the job in one row"""
+        score = self.match_scores[index]
+        return Job(
+            title=self.titles[index],
+            company=self.companies[index],
+            link=self.links[index],
+            posted_time=datetime.fromtimestamp(self.posted_times[index]),
+            source=self.sources[index],
+            location=self.locations[index],
+            is_remote=bool(self.remote[index]),
+            match_score=None if math.isnan(score) else score,
+            matched_title=self.matched_titles[index],
+            sources=self.source_lists[index]
+        )
+
+    def append(self, job: Job):
+        """Add a job as a new row, sharing repeated strings between rows"""
+        self.titles.append(job.title)
+        self.companies.append(sys.intern(job.company))
+        self.links.append(job.link)
+        self.posted_times.append(job.posted_time.timestamp())
+        self.sources.append(sys.intern(job.source))
+        self.locations.append(sys.intern(job.location) if job.location else None)
+        self.remote.append(bool(job.is_remote))
+        self.match_scores.append(math.nan if job.match_score is None else job.match_score)
+        self.matched_titles.append(job.matched_title)
+        self.source_lists.append(job.sources)
+
+    def extend(self, jobs: Iterable[Job]):
+        """Add jobs as new rows"""
+        for job in jobs:
+            self.append(job)
@@ -1,19 +1,46 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 import aiohttp
 import asyncio
+import codecs
+import random
 from bs4 import BeautifulSoup
 from src.models.job import Job
+from src.models.job_batch import JobBatch
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.config import Config
+from src.utils.content_hash_store import ContentHashStore
+from src.utils.html_parser import ParseOnly, make_soup, resolve_backend
+from src.utils.html_stream import CardStreamParser
+from src.utils.http_client import HttpClient
+from src.utils.location_classifier import LocationClassifier
 from src.utils.logger import Logger
+from src.utils.parse_pool import ParsePool
+from src.utils.request_planner import RequestPlanner
+from src.utils.time_parser import parse_time
 
 class BaseScraper(ABC):
     def __init__(self):
         self.logger = Logger()
+        self.http_client: Optional[HttpClient] = None
+        self._owns_http_client = False
+        self.content_hashes: Optional[ContentHashStore] = None
+        self.request_planner: Optional[RequestPlanner] = None
+        self.parse_pool: Optional[ParsePool] = None
         self.session = None
-        self.rate_limit_delay = 2  # seconds between requests
+        self.rate_limit_delay = 2  # initial seconds between requests, adapted per host
         self.max_retries = 3
-        self.retry_delay = 5  # seconds between retries
+        self.retry_delay = 2  # base seconds for exponential retry backoff
+        self.max_retry_delay = 30  # cap on a single retry backoff
+        self.cache_ttl = 0  # seconds a cached page is served without revalidation
+        self.parser_backend = resolve_backend()
+        self.parse_only: ParseOnly = None  # (tag, class) of the only subtrees to build when parsing
+        self.job_age_limit = timedelta(hours=Config().get('scraping', 'job_age_limit', 1))
+        self.page_stats = self._empty_page_stats()
+        self.stream = False  # extract jobs from response chunks instead of buffering whole pages
+        self.stream_chunk_size = 16384
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -23,33 +50,107 @@ class BaseScraper(ABC):
             'Cache-Control': 'max-age=0'
         }
     
+    # Shared, process-local collaborators that are not sent to parse workers
+    _TRANSIENT_ATTRS = ('logger', 'http_client', 'content_hashes', 'request_planner', 'parse_pool', 'session', 'page_stats')
+    
+    def __getstate__(self) -> Dict:
+        """Pickle only what parsing needs so the scraper can be sent to a worker process"""
+        state = self.__dict__.copy()
+        for attr in self._TRANSIENT_ATTRS:
+            state[attr] = None
+        state['_owns_http_client'] = False
+        return state
+    
+    def __setstate__(self, state: Dict):
+        """Restore a scraper unpickled in a worker process"""
+        self.__dict__.update(state)
+        self.logger = Logger()
+    
     async def _init_session(self):
-        """Initialize aiohttp session if not already initialized"""
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        """Borrow the shared pooled session, creating a private client if none is attached"""
+        if not self.http_client:
+            self.http_client = HttpClient()
+            self._owns_http_client = True
+        await self.http_client.start()
+        self.session = self.http_client.session
     
     async def _close_session(self):
-        """Close aiohttp session if it exists"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release the session, closing it only if this scraper owns the client"""
+        if self.http_client and self._owns_http_client:
+            await self.http_client.close()
+            self.http_client = None
+            self._owns_http_client = False
+        self.session = None
+    
+    @property
+    def source_name(self) -> str:
+        """Name identifying the source in breakers, caches and logs"""
+        return self.__class__.__name__
+    
+    def _breakers(self, url: str) -> List[CircuitBreaker]:
+        """Get the source and host circuit breakers guarding a URL"""
+        breakers = self.http_client.breakers
+        return [
+            breakers.get(f"source:{self.source_name}"),
+            breakers.get(f"host:{urlparse(url).netloc}")
+        ]
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for a retry attempt"""
+        return random.uniform(0, min(self.max_retry_delay, self.retry_delay * 2 ** attempt))
     
     async def _fetch_with_retry(self, url: str) -> Optional[str]:
-        """Fetch URL with retry logic and rate limiting"""
+        """Fetch URL with retry logic, rate limiting, circuit breaking and conditional-request caching"""
         await self._init_session()
+        cache = self.http_client.response_cache
+        registry = self.http_client.breakers
+        breakers = self._breakers(url)
         
         for attempt in range(self.max_retries):
+            entry = cache.get(url)
+            if entry and cache.is_fresh(entry, self.cache_ttl):
+                body = cache.read(url)
+                if body is not None:
+                    return body
+                entry = None
+            
+            if not registry.allow(breakers):
+                self.logger.debug(f"Circuit open for {self.source_name}, skipping {url}")
+                return None
+            
+            headers = dict(self.headers)
+            if entry:
+                headers.update(cache.conditional_headers(entry))
+            
             try:
-                # Add delay between requests
-                await asyncio.sleep(self.rate_limit_delay)
-                
-                async with self.session.get(url) as response:
+                async with self.http_client.request(
+                    'GET',
+                    url,
+                    rate_limit_delay=self.rate_limit_delay,
+                    headers=headers
+                ) as response:
+                    if response.status == 304 and entry:  # Not Modified
+                        registry.record_success(breakers)
+                        body = cache.read(url, revalidated=True, headers=response.headers)
+                        if body is not None:
+                            return body
+                        # The entry was evicted meanwhile, so the next attempt is a full GET
+                        continue
+                    
                     if response.status == 429:  # Too Many Requests
-                        retry_after = int(response.headers.get('Retry-After', self.retry_delay))
-                        self.logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                        await asyncio.sleep(retry_after)
+                        # The host is up; the rate limiter has already backed off per Retry-After
+                        registry.record_success(breakers)
+                        self.logger.warning(f"Rate limited on {url} (attempt {attempt + 1})")
                         continue
                     
+                    if response.status >= 500:  # Server error, worth retrying
+                        registry.record_failure(breakers)
+                        self.logger.warning(f"Server error {response.status} for {url} on attempt {attempt + 1}")
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+                    
+                    # Client errors say nothing about the host's health, so they leave the breakers alone
                     if response.status == 403:  # Forbidden
                         self.logger.warning(f"Access forbidden for {url}. Skipping...")
                         return None
@@ -62,16 +163,23 @@ class BaseScraper(ABC):
                         self.logger.warning(f"Unexpected status {response.status} for {url}")
                         return None
                     
-                    return await response.text()
+                    body = await response.text()
+                    registry.record_success(breakers)
+                    cache.store(url, body, response.headers, self.cache_ttl)
+                    return body
             
-            except aiohttp.ClientError as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                registry.record_failure(breakers)
                 self.logger.warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 continue
             except Exception as e:
                 self.logger.error(f"Unexpected error fetching {url}: {str(e)}")
                 return None
+            finally:
+                # A cancelled or unclassified request must not leave a half-open probe in flight
+                registry.release(breakers)
         
         return None
     
@@ -81,46 +189,201 @@ class BaseScraper(ABC):
         pass
     
     def is_within_last_hour(self, posted_time: datetime) -> bool:
-        """Check if a job was posted within the last hour"""
-        return datetime.now() - posted_time <= timedelta(hours=1)
+        """Check if a job was posted within the job age limit (an hour by default)"""
+        return datetime.now() - posted_time <= self.job_age_limit
     
     def is_valid_location(self, location: Optional[str]) -> bool:
         """Check if job location is valid (Remote or US-based)"""
-        if not location:
-            return False
-        location = location.lower()
-        return (
-            'remote' in location or
-            'united states' in location or
-            'usa' in location or
-            'us' in location
-        )
+        return LocationClassifier().is_valid(location)
     
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a webpage with rate limiting"""
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        self.logger.error(f"Error fetching {url}: Status {response.status}")
-                        return None
+            return await self._fetch_with_retry(url)
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {str(e)}")
             return None
-        finally:
-            # Rate limiting delay
-            await asyncio.sleep(1)
+
+    async def scrape_pages(self, pages: List[Tuple[str, Dict]]) -> List[Job]:
+        """Scrape several search pages concurrently, given as (url, parse context) pairs"""
+        results = await asyncio.gather(*(self.scrape_page(url, **context) for url, context in pages))
+        return [job for jobs in results for job in jobs]
+    
+    async def scrape_paginated(self, page_url: Callable[[int], str], max_pages: int, **context) -> List[Job]:
+        """Scrape result pages in order until one is empty or its newest job is older than the age limit"""
+        jobs = []
+        reason = 'max_pages'
+        page = 0
+        for page in range(1, max_pages + 1):
+            page_jobs = await self.scrape_page(page_url(page), **context)
+            if not page_jobs:
+                reason = 'empty'
+                break
+            jobs.extend(page_jobs)
+            if not self.is_within_last_hour(max(job.posted_time for job in page_jobs)):
+                reason = 'stale'
+                break
+        
+        self._record_pages(page, reason)
+        return jobs
+    
+    def _record_pages(self, pages: int, reason: str):
+        """Count the pages one search read and why its paging stopped"""
+        self.page_stats['pages'] += pages
+        self.page_stats['stops'][reason] = self.page_stats['stops'].get(reason, 0) + 1
+    
+    @staticmethod
+    def _empty_page_stats() -> Dict:
+        """Create zeroed pagination counters"""
+        return {'pages': 0, 'stops': {}}
+    
+    def reset_page_stats(self) -> Dict:
+        """Return this cycle's pages read and stop reasons, and start counting afresh"""
+        stats = self.page_stats
+        self.page_stats = self._empty_page_stats()
+        return stats
+    
+    async def scrape_page(self, url: str, **context) -> List[Job]:
+        """Scrape a search page once per cycle, sharing the result with duplicate requests"""
+        scrape = self._stream_page if self.stream else self._scrape_page
+        if not self.request_planner:
+            return await scrape(url, **context)
+        return await self.request_planner.run(
+            (self.source_name, url),
+            lambda: scrape(url, **context)
+        )
+    
+    async def _scrape_page(self, url: str, **context) -> List[Job]:
+        """Fetch and parse a search page, reusing the last parse if the page is unchanged"""
+        html = await self.fetch_page(url)
+        if not html:
+            return []
+        
+        source = self.source_name
+        digest = None
+        if self.content_hashes:
+            digest = self.content_hashes.digest(html)
+            jobs = self.content_hashes.lookup(source, url, digest)
+            if jobs is not None:
+                return jobs
+        
+        # The batch is only the compact form jobs cross from a parse worker in; it is not kept
+        if self.parse_pool:
+            jobs = list(await self.parse_pool.run(self._parse_rows, html, context))
+        else:
+            jobs = list(self._parse_rows(html, context))
+        
+        if self.content_hashes:
+            self.content_hashes.store(source, url, digest, jobs)
+        return jobs
+
+    async def _stream_page(self, url: str, **context) -> List[Job]:
+        """Collect the jobs streamed from a search page"""
+        return [job async for job in self.stream_jobs(url, **context)]
+    
+    async def stream_jobs(self, url: str, **context) -> AsyncIterator[Job]:
+        """Yield jobs as their cards arrive, bypassing the page caches and dropping the connection after the card list"""
+        await self._init_session()
+        registry = self.http_client.breakers
+        breakers = self._breakers(url)
+        streaming = False
+        
+        for attempt in range(self.max_retries):
+            if not registry.allow(breakers):
+                self.logger.debug(f"Circuit open for {self.source_name}, skipping {url}")
+                return
+            
+            try:
+                async with self.http_client.request(
+                    'GET',
+                    url,
+                    rate_limit_delay=self.rate_limit_delay,
+                    headers=self.headers
+                ) as response:
+                    if response.status == 429:  # Too Many Requests
+                        registry.record_success(breakers)
+                        self.logger.warning(f"Rate limited on {url} (attempt {attempt + 1})")
+                        continue
+                    
+                    if response.status >= 500:  # Server error, worth retrying
+                        registry.record_failure(breakers)
+                        self.logger.warning(f"Server error {response.status} for {url} on attempt {attempt + 1}")
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+                    
+                    if response.status != 200:
+                        self.logger.warning(f"Unexpected status {response.status} for {url}. Skipping...")
+                        return
+                    
+                    registry.record_success(breakers)
+                    streaming = True
+                    parser = self._stream_parser()
+                    decoder = codecs.getincrementaldecoder(response.get_encoding())(errors='replace')
+                    now = datetime.now()  # every card on the page is aged against the same moment
+                    async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                        await self._feed(parser, decoder.decode(chunk))
+                        for job in self._jobs_from_cards(parser.pop_cards(), now, **context):
+                            yield job
+                        if parser.done:
+                            break
+                    
+                    if not parser.done:
+                        await self._feed(parser, decoder.decode(b'', final=True))
+                        parser.close()
+                        for job in self._jobs_from_cards(parser.pop_cards(), now, **context):
+                            yield job
+                    return
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                registry.record_failure(breakers)
+                self.logger.warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
+                if streaming:  # jobs may already have been yielded, so a retry would repeat them
+                    return
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+            finally:
+                registry.release(breakers)
+    
+    async def _feed(self, parser: CardStreamParser, text: str):
+        """Feed a chunk to the stream parser, on a parse pool thread when there is a pool"""
+        if self.parse_pool:
+            await self.parse_pool.run_in_thread(parser.feed, text)
+        else:
+            parser.feed(text)
+    
+    def _jobs_from_cards(self, cards: List[Dict[str, str]], now: datetime, **context) -> List[Job]:
+        """Build a job per card, skipping cards that fail so one bad card does not lose the page"""
+        jobs = []
+        for card in cards:
+            try:
+                jobs.append(self._job_from_card(card, now, **context))
+            except Exception as e:
+                self.logger.error(f"Error building {self.source_name} job: {str(e)}")
+        return jobs
+    
+    def _stream_parser(self) -> CardStreamParser:
+        """Create the incremental card extractor used when streaming"""
+        raise NotImplementedError
+    
+    def _job_from_card(self, card: Dict[str, str], now: datetime, **context) -> Job:
+        """Build a job from the fields the stream parser extracted for a card"""
+        raise NotImplementedError
+    
+    def _parse_rows(self, html: str, context: Dict) -> JobBatch:
+        """Parse a page into a columnar job batch; runs in a parse worker when a pool is attached"""
+        soup = make_soup(html, self.parser_backend, self.parse_only)
+        return JobBatch(self._parse_jobs(soup, **context))
 
     def _get_search_url(self, job_title: str) -> Optional[str]:
         """Get the search URL for a job title"""
         raise NotImplementedError
     
-    def _parse_jobs(self, soup: BeautifulSoup, job_title: str) -> List[Job]:
-        """Parse job listings from HTML"""
+    def _parse_jobs(self, soup: BeautifulSoup, **context) -> List[Job]:
+        """Parse job listings from a tree built by make_soup (BeautifulSoup or a compatible wrapper)"""
         raise NotImplementedError
     
     def _parse_time(self, time_str: str) -> datetime:
-        """Parse time string into datetime object"""
-        raise NotImplementedError 
\ No newline at end of file
+        """Parse a posting time string into a datetime"""
+        return parse_time(time_str)
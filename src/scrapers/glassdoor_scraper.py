@@ -1,6 +1,5 @@
 from datetime import datetime
 from typing import List, Optional
-import aiohttp
 import asyncio
 from bs4 import BeautifulSoup
 import re
@@ -26,7 +25,7 @@ class GlassdoorScraper(BaseScraper):
         encoded_title = job_title.replace(" ", "+")
         return f"{self.base_url}?q={encoded_title}&locT=C&locId=1&jobType=all&fromAge=1&api_key={self.api_key}"
     
-    def _parse_jobs(self, soup: BeautifulSoup, job_title: str) -> List[Job]:
+    def _parse_jobs(self, soup: BeautifulSoup, job_title: str = '', **context) -> List[Job]:
         """Parse job listings from HTML"""
         jobs = []
         try:
@@ -63,56 +62,18 @@ class GlassdoorScraper(BaseScraper):
         
         return jobs
     
-    def _parse_time(self, time_str: str) -> datetime:
-        """Parse time string into datetime object"""
-        try:
-            # Glassdoor time format examples:
-            # "Just now"
-            # "2 hours ago"
-            # "3 days ago"
-            # "1 week ago"
-            
-            time_str = time_str.lower()
-            
-            if "just now" in time_str:
-                return datetime.now()
-            
-            if "hour" in time_str:
-                hours = int(time_str.split()[0])
-                return datetime.now() - timedelta(hours=hours)
-            
-            if "day" in time_str:
-                days = int(time_str.split()[0])
-                return datetime.now() - timedelta(days=days)
-            
-            if "week" in time_str:
-                weeks = int(time_str.split()[0])
-                return datetime.now() - timedelta(weeks=weeks)
-            
-            return datetime.now()
-            
-        except Exception as e:
-            self.logger.warning(f"Error parsing Glassdoor time: {str(e)}")
-            return datetime.now()
-    
     async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
         """Scrape jobs from Glassdoor"""
         jobs = []
         try:
+            pages = []
             for title in job_titles:
                 url = self._get_search_url(title)
                 if not url:
                     continue
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            self.logger.error(f"Glassdoor API returned status code: {response.status}")
-                            continue
-                        
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        jobs.extend(self._parse_jobs(soup, title))
+                pages.append((url, {'job_title': title}))
+            
+            jobs = await self.scrape_pages(pages)
         
         except Exception as e:
             self.logger.error(f"Error scraping Glassdoor: {str(e)}")
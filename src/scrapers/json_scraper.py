@@ -0,0 +1,148 @@
+import asyncio
+import json
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import aiohttp
+from src.models.job import Job
+from src.scrapers.base_scraper import BaseScraper
+from src.utils.config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(body: bytes) -> Any:
+    """Decode a JSON body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+class JsonScraper(BaseScraper):
+    def __init__(self):
+        super().__init__()
+        self.headers.update({'Accept': 'application/json'})
+        self.page_size = 100
+        self.max_pages = Config().get('scraping', 'max_api_pages', 5)
+
+    @abstractmethod
+    def _request(self, job_title: str, cursor: Any) -> Tuple[str, str, Dict]:
+        """Build the (method, url, request kwargs) for one results page; cursor is None for the first"""
+        pass
+
+    @abstractmethod
+    def _rows(self, data: Any) -> List[Dict]:
+        """Get the job records from a decoded response"""
+        pass
+
+    @abstractmethod
+    def _job_from_row(self, row: Dict, now: datetime) -> Job:
+        """Build a job from one record"""
+        pass
+
+    def _next_cursor(self, data: Any, cursor: Any, rows: List[Dict]) -> Any:
+        """Cursor for the next page, or None at the end; offset-based by default, cursor APIs override"""
+        if len(rows) < self.page_size:
+            return None
+        return (cursor or 0) + len(rows)
+
+    async def fetch_json(self, method: str, url: str, **kwargs) -> Optional[Any]:
+        """Request a JSON document with retries, rate limiting and circuit breaking"""
+        await self._init_session()
+        registry = self.http_client.breakers
+        breakers = self._breakers(url)
+        headers = {**self.headers, **kwargs.pop('headers', {})}
+
+        for attempt in range(self.max_retries):
+            if not registry.allow(breakers):
+                self.logger.debug(f"Circuit open for {self.source_name}, skipping {url}")
+                return None
+
+            try:
+                async with self.http_client.request(
+                    method,
+                    url,
+                    rate_limit_delay=self.rate_limit_delay,
+                    headers=headers,
+                    **kwargs
+                ) as response:
+                    if response.status == 429:  # Too Many Requests
+                        registry.record_success(breakers)
+                        self.logger.warning(f"Rate limited on {url} (attempt {attempt + 1})")
+                        continue
+
+                    if response.status >= 500:  # Server error, worth retrying
+                        registry.record_failure(breakers)
+                        self.logger.warning(f"Server error {response.status} for {url} on attempt {attempt + 1}")
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt))
+                        continue
+
+                    body = await response.read()
+                    if response.status != 200:
+                        self.logger.error(f"{self.source_name} API error: {response.status} - {body[:500].decode(errors='replace')}")
+                        return None
+
+                    registry.record_success(breakers)
+                    return loads(body)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                registry.record_failure(breakers)
+                self.logger.warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+            except ValueError as e:
+                self.logger.error(f"Invalid JSON from {self.source_name}: {str(e)}")
+                return None
+            finally:
+                registry.release(breakers)
+
+        return None
+
+    async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
+        """Scrape jobs for every title, searching titles concurrently"""
+        jobs = []
+        try:
+            results = await asyncio.gather(*(self._scrape_title(title) for title in job_titles))
+            jobs = [job for title_jobs in results for job in title_jobs]
+
+        except Exception as e:
+            self.logger.error(f"Error scraping {self.source_name}: {str(e)}")
+
+        return jobs
+
+    async def _scrape_title(self, job_title: str) -> List[Job]:
+        """Page through one search until results run out or fall outside the age limit"""
+        jobs = []
+        cursor = None
+        reason = 'max_pages'
+        page = 0
+        for page in range(1, self.max_pages + 1):
+            method, url, kwargs = self._request(job_title, cursor)
+            data = await self.fetch_json(method, url, **kwargs)
+            rows = self._rows(data) if data is not None else []
+            if not isinstance(rows, list) or not rows:
+                reason = 'empty'
+                break
+
+            now = datetime.now()
+            page_jobs = []
+            for row in rows:
+                try:
+                    page_jobs.append(self._job_from_row(row, now))
+                except Exception as e:
+                    self.logger.error(f"Error parsing {self.source_name} job: {str(e)}")
+            jobs.extend(page_jobs)
+
+            if page_jobs and not self.is_within_last_hour(max(job.posted_time for job in page_jobs)):
+                reason = 'stale'
+                break
+            cursor = self._next_cursor(data, cursor, rows)
+            if cursor is None:
+                reason = 'end'
+                break
+
+        self._record_pages(page, reason)
+        return jobs
@@ -1,13 +1,13 @@
 import os
 from datetime import datetime
-from typing import List
-import aiohttp
+from typing import Any, Dict, List, Tuple
 from dotenv import load_dotenv
-from .base_scraper import BaseScraper
+from .json_scraper import JsonScraper
 from ..models.job import Job
 from ..utils.logger import Logger
+from ..utils.time_parser import parse_time
 
-class LinkedInScraper(BaseScraper):
+class LinkedInScraper(JsonScraper):
     def __init__(self):
         super().__init__()
         self.logger = Logger()
@@ -18,53 +18,55 @@ class LinkedInScraper(BaseScraper):
         if not self.api_key:
             self.logger.warning("LinkedIn API key not found. LinkedIn scraping will be disabled.")
     
+    @property
+    def source_name(self) -> str:
+        return 'LinkedIn'
+    
     async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
         """Scrape jobs from LinkedIn"""
         if not self.api_key:
             return []
-        
-        jobs = []
-        try:
-            async with self.session as session:
-                for title in job_titles:
-                    params = {
-                        'keywords': title,
-                        'location': 'United States',
-                        'timePosted': 'r86400',  # Last 24 hours
-                        'limit': 100
-                    }
-                    
-                    headers = {
-                        'Authorization': f'Bearer {self.api_key}',
-                        'X-Restli-Protocol-Version': '2.0.0'
-                    }
-                    
-                    async with session.get(
-                        self.api_url,
-                        params=params,
-                        headers=headers
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            for job_data in data.get('elements', []):
-                                job = Job(
-                                    title=job_data.get('title', ''),
-                                    company=job_data.get('companyName', ''),
-                                    link=job_data.get('applyUrl', ''),
-                                    posted_time=datetime.fromtimestamp(
-                                        job_data.get('listedAt', 0) / 1000
-                                    ),
-                                    source='LinkedIn',
-                                    location=job_data.get('location', ''),
-                                    is_remote='remote' in job_data.get('location', '').lower()
-                                )
-                                jobs.append(job)
-                        else:
-                            self.logger.error(
-                                f"LinkedIn API error: {response.status} - {await response.text()}"
-                            )
-        
-        except Exception as e:
-            self.logger.error(f"Error scraping LinkedIn: {str(e)}")
-        
-        return jobs 
\ No newline at end of file
+        return await super().scrape_jobs(job_titles)
+    
+    def _request(self, job_title: str, cursor: Any) -> Tuple[str, str, Dict]:
+        """Build the jobs API request for one page, paged by start offset"""
+        return 'GET', self.api_url, {
+            'params': {
+                'keywords': job_title,
+                'location': 'United States',
+                'timePosted': 'r86400',  # Last 24 hours
+                'start': cursor or 0,
+                'count': self.page_size
+            },
+            'headers': {
+                'Authorization': f'Bearer {self.api_key}',
+                'X-Restli-Protocol-Version': '2.0.0'
+            }
+        }
+    
+    def _next_cursor(self, data: Any, cursor: Any, rows: List[Dict]) -> Any:
+        """Next start offset, stopping at the total LinkedIn reports"""
+        start = (cursor or 0) + len(rows)
+        total = (data.get('paging') or {}).get('total')
+        if total is not None:
+            return start if start < total else None
+        return super()._next_cursor(data, cursor, rows)
+    
+    def _rows(self, data: Any) -> List[Dict]:
+        """Get the jobs from a jobs API response"""
+        if not isinstance(data, dict):
+            return []
+        return data.get('elements') or []
+    
+    def _job_from_row(self, row: Dict, now: datetime) -> Job:
+        """Build a job from a LinkedIn record"""
+        location = row.get('location', '')
+        return Job(
+            title=row.get('title', ''),
+            company=row.get('companyName') or '',
+            link=row.get('applyUrl', ''),
+            posted_time=parse_time(row.get('listedAt'), now),
+            source='LinkedIn',
+            location=location,
+            is_remote='remote' in location.lower()
+        )
@@ -1,11 +1,11 @@
 from datetime import datetime
-from typing import List
-import aiohttp
-from .base_scraper import BaseScraper
+from typing import Any, Dict, List, Tuple
+from .json_scraper import JsonScraper
 from ..models.job import Job
 from ..utils.logger import Logger
+from ..utils.time_parser import parse_time
 
-class SimplifyScraper(BaseScraper):
+class SimplifyScraper(JsonScraper):
     def __init__(self):
         super().__init__()
         self.logger = Logger()
@@ -14,65 +14,56 @@ class SimplifyScraper(BaseScraper):
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        # Simplify uses a GraphQL API, paged by offset
+        self.query = """
+        query SearchJobs($query: String!, $location: String!, $timeRange: String!, $offset: Int, $limit: Int) {
+            jobs(query: $query, location: $location, timeRange: $timeRange, offset: $offset, limit: $limit) {
+                id
+                title
+                company {
+                    name
+                }
+                location
+                postedAt
+                applyUrl
+                isRemote
+            }
+        }
+        """
+    
+    @property
+    def source_name(self) -> str:
+        return 'Simplify'
     
-    async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
-        """Scrape jobs from Simplify"""
-        jobs = []
-        try:
-            for title in job_titles:
-                # Simplify uses a GraphQL API
-                query = {
-                    "query": """
-                    query SearchJobs($query: String!, $location: String!, $timeRange: String!) {
-                        jobs(query: $query, location: $location, timeRange: $timeRange) {
-                            id
-                            title
-                            company {
-                                name
-                            }
-                            location
-                            postedAt
-                            applyUrl
-                            isRemote
-                        }
-                    }
-                    """,
-                    "variables": {
-                        "query": title,
-                        "location": "United States",
-                        "timeRange": "1h"
-                    }
+    def _request(self, job_title: str, cursor: Any) -> Tuple[str, str, Dict]:
+        """Build the GraphQL search request for one page"""
+        return 'POST', f"{self.base_url}/graphql", {
+            'json': {
+                "query": self.query,
+                "variables": {
+                    "query": job_title,
+                    "location": "United States",
+                    "timeRange": "1h",
+                    "offset": cursor or 0,
+                    "limit": self.page_size
                 }
-                
-                async with self.session.post(
-                    f"{self.base_url}/graphql",
-                    json=query
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        for job_data in data.get('data', {}).get('jobs', []):
-                            try:
-                                job = Job(
-                                    title=job_data.get('title', ''),
-                                    company=job_data.get('company', {}).get('name', ''),
-                                    link=job_data.get('applyUrl', ''),
-                                    posted_time=datetime.fromisoformat(
-                                        job_data.get('postedAt', '').replace('Z', '+00:00')
-                                    ),
-                                    source='Simplify',
-                                    location=job_data.get('location', ''),
-                                    is_remote=job_data.get('isRemote', False)
-                                )
-                                jobs.append(job)
-                            except Exception as e:
-                                self.logger.error(f"Error parsing Simplify job: {str(e)}")
-                                continue
-                    else:
-                        self.logger.error(
-                            f"Simplify API error: {response.status} - {await response.text()}"
-                        )
-        
-        except Exception as e:
-            self.logger.error(f"Error scraping Simplify: {str(e)}")
-        
-        return jobs 
\ No newline at end of file
+            }
+        }
+    
+    def _rows(self, data: Any) -> List[Dict]:
+        """Get the jobs from a GraphQL response"""
+        if not isinstance(data, dict) or not isinstance(data.get('data'), dict):
+            return []
+        return data['data'].get('jobs') or []
+    
+    def _job_from_row(self, row: Dict, now: datetime) -> Job:
+        """Build a job from a Simplify record"""
+        return Job(
+            title=row.get('title', ''),
+            company=(row.get('company') or {}).get('name') or '',
+            link=row.get('applyUrl', ''),
+            posted_time=parse_time(row.get('postedAt'), now),
+            source='Simplify',
+            location=row.get('location', ''),
+            is_remote=row.get('isRemote', False)
+        )
@@ -0,0 +1,195 @@
+import asyncio
+import os
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin
+import yaml
+from src.scrapers.base_scraper import BaseScraper
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+from src.utils.html_stream import CardStreamParser
+from src.utils.time_parser import parse_time
+
+REQUIRED_FIELDS = ('title', 'company', 'location', 'posted_time', 'link')
+
+@dataclass(frozen=True)
+class Selector:
+    name: Optional[str]
+    class_: Optional[str]
+
+    @classmethod
+    def compile(cls, selector: str) -> 'Selector':
+        """Compile a `tag.class` selector into find() arguments"""
+        tag, _, classes = selector.strip().partition('.')
+        return cls(tag or None, classes.replace('.', ' ') or None)
+
+    def find(self, element):
+        """Find the first match below an element"""
+        return element.find(self.name, class_=self.class_)
+
+    def find_all(self, element) -> List:
+        """Find all matches below an element"""
+        return element.find_all(self.name, class_=self.class_)
+
+@dataclass(frozen=True)
+class SourceSpec:
+    name: str
+    search_url: str
+    card: Selector
+    fields: Dict[str, Selector]
+    card_list: Optional[Selector] = None
+    link_base: str = ''
+    regions: Tuple[str, ...] = ()
+    remote_region: Optional[str] = None
+    page_param: Optional[str] = None
+    max_pages: int = 1
+    cache_ttl: int = 0
+    rate_limit_delay: Optional[float] = None
+    enabled: bool = True
+    stream: bool = False
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SourceSpec':
+        """Create a spec from a sources.yaml entry, compiling its selectors"""
+        fields = data.get('fields') or {}
+        missing = [name for name in REQUIRED_FIELDS if name not in fields]
+        if missing:
+            raise ValueError(f"missing field selectors: {', '.join(missing)}")
+
+        return cls(
+            name=data['name'],
+            search_url=data['search_url'],
+            card=Selector.compile(data['card']),
+            fields={name: Selector.compile(fields[name]) for name in REQUIRED_FIELDS},
+            card_list=Selector.compile(data['list']) if data.get('list') else None,
+            link_base=data.get('link_base', ''),
+            regions=tuple(data.get('regions') or ()),
+            remote_region=data.get('remote_region'),
+            page_param=data.get('page_param'),
+            max_pages=data.get('max_pages', 1),
+            cache_ttl=data.get('cache_ttl', 0),
+            rate_limit_delay=data.get('rate_limit_delay'),
+            enabled=data.get('enabled', True),
+            stream=data.get('stream', False),
+            headers=data.get('headers') or {}
+        )
+
+def load_source_specs(path: str = os.path.join('config', 'sources.yaml')) -> List[SourceSpec]:
+    """Load job board specs, skipping entries that are invalid"""
+    logger = Logger()
+    if not os.path.exists(path):
+        logger.error(f"Source definitions not found: {path}")
+        return []
+
+    with open(path, 'r') as f:
+        config = yaml.safe_load(f) or {}
+
+    defaults = config.get('defaults') or {}
+    specs = []
+    for entry in config.get('sources') or []:
+        try:
+            specs.append(SourceSpec.from_dict({**defaults, **entry}))
+        except (KeyError, ValueError) as e:
+            logger.error(f"Invalid source definition {entry.get('name', '?')}: {str(e)}")
+    return specs
+
+class SpecScraper(BaseScraper):
+    def __init__(self, spec: SourceSpec):
+        super().__init__()
+        self.spec = spec
+        self.cache_ttl = spec.cache_ttl
+        if spec.rate_limit_delay:
+            self.rate_limit_delay = spec.rate_limit_delay
+        self.headers.update(spec.headers)
+        self.stream = spec.stream
+        if Config().get('parsing', 'partial', True):
+            self.parse_only = (spec.card.name, spec.card.class_)
+
+    @property
+    def source_name(self) -> str:
+        return self.spec.name
+
+    def _search_url(self, title: str, region: Optional[str], page: int) -> str:
+        """Build the search URL for a title, region and result page"""
+        url = self.spec.search_url.format(query=quote_plus(title), region=region or '')
+        if page > 1 and self.spec.page_param:
+            url += ('&' if '?' in url else '?') + f"{self.spec.page_param}={page}"
+        return url
+
+    async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
+        """Scrape jobs for every title (and region) of the source"""
+        jobs = []
+        try:
+            regions = self.spec.regions or (None,)
+            results = await asyncio.gather(*(
+                self._scrape_search(title, region)
+                for title in job_titles
+                for region in regions
+            ))
+            jobs = [job for search_jobs in results for job in search_jobs]
+
+        except Exception as e:
+            self.logger.error(f"Error scraping {self.spec.name}: {str(e)}")
+
+        return jobs
+
+    async def _scrape_search(self, title: str, region: Optional[str]) -> List[Job]:
+        """Scrape the result pages of one search until they run out or get too old"""
+        return await self.scrape_paginated(
+            lambda page: self._search_url(title, region, page),
+            self.spec.max_pages,
+            region=region
+        )
+
+    def _parse_jobs(self, soup, region: Optional[str] = None, **context) -> List[Job]:
+        """Extract every job card on a page using the source's compiled selectors"""
+        spec = self.spec
+        cards = []
+        for card in spec.card.find_all(soup):
+            try:
+                elements = {name: selector.find(card) for name, selector in spec.fields.items()}
+                if not all(elements.values()):
+                    continue
+                cards.append({
+                    'title': elements['title'].text.strip(),
+                    'company': elements['company'].text.strip(),
+                    'location': elements['location'].text.strip(),
+                    'posted_time': elements['posted_time'].text.strip(),
+                    'link': elements['link']['href']
+                })
+
+            except Exception as e:
+                self.logger.error(f"Error parsing {spec.name} job card: {str(e)}")
+                continue
+
+        # All cards on a page are aged against the same moment
+        return self._jobs_from_cards(cards, datetime.now(), region=region)
+
+    def _stream_parser(self) -> CardStreamParser:
+        """Create an incremental extractor for this source's cards"""
+        return CardStreamParser(
+            (self.spec.card.name, self.spec.card.class_),
+            {name: (selector.name, selector.class_) for name, selector in self.spec.fields.items()},
+            attrs={'link': 'href'},
+            card_list=(self.spec.card_list.name, self.spec.card_list.class_) if self.spec.card_list else None
+        )
+
+    def _job_from_card(self, card: Dict[str, str], now: datetime, region: Optional[str] = None, **context) -> Job:
+        """Build a job from a card's extracted field values"""
+        if self.spec.regions:
+            is_remote = region == self.spec.remote_region
+        else:
+            is_remote = 'remote' in card['location'].lower()
+
+        return Job(
+            title=card['title'],
+            company=card['company'],
+            link=urljoin(self.spec.link_base, card['link']),
+            posted_time=parse_time(card['posted_time'], now),
+            source=self.spec.name,
+            location=card['location'],
+            is_remote=is_remote
+        )
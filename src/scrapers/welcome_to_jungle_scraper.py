@@ -1,11 +1,11 @@
 from datetime import datetime
-from typing import List
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
+from typing import Any, Dict, List, Tuple
+from .json_scraper import JsonScraper
 from ..models.job import Job
 from ..utils.logger import Logger
+from ..utils.time_parser import parse_time
 
-class WelcomeToJungleScraper(BaseScraper):
+class WelcomeToJungleScraper(JsonScraper):
     def __init__(self):
         super().__init__()
         self.logger = Logger()
@@ -16,47 +16,43 @@ class WelcomeToJungleScraper(BaseScraper):
             'X-Requested-With': 'XMLHttpRequest'
         })
     
-    async def scrape_jobs(self, job_titles: List[str]) -> List[Job]:
-        """Scrape jobs from Welcome to the Jungle"""
-        jobs = []
-        try:
-            for title in job_titles:
-                # Welcome to the Jungle uses a search API
-                search_url = f"{self.base_url}/api/search"
-                params = {
-                    'query': title,
-                    'location': 'United States',
-                    'timeRange': '1h',
-                    'page': 1,
-                    'limit': 100
-                }
-                
-                async with self.session.get(search_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        for job_data in data.get('jobs', []):
-                            try:
-                                job = Job(
-                                    title=job_data.get('title', ''),
-                                    company=job_data.get('company', {}).get('name', ''),
-                                    link=f"https://www.welcometothejungle.com/en/jobs/{job_data.get('slug', '')}",
-                                    posted_time=datetime.fromisoformat(
-                                        job_data.get('publishedAt', '').replace('Z', '+00:00')
-                                    ),
-                                    source='Welcome to the Jungle',
-                                    location=job_data.get('location', {}).get('city', ''),
-                                    is_remote=job_data.get('location', {}).get('isRemote', False)
-                                )
-                                jobs.append(job)
-                            except Exception as e:
-                                self.logger.error(f"Error parsing Welcome to the Jungle job: {str(e)}")
-                                continue
-                    else:
-                        self.logger.error(
-                            f"Welcome to the Jungle API error: {response.status} - {await response.text()}"
-                        )
-        
-        except Exception as e:
-            self.logger.error(f"Error scraping Welcome to the Jungle: {str(e)}")
-        
-        return jobs 
\ No newline at end of file
+    @property
+    def source_name(self) -> str:
+        return 'Welcome to the Jungle'
+    
+    def _request(self, job_title: str, cursor: Any) -> Tuple[str, str, Dict]:
+        """Build the search API request for one page"""
+        return 'GET', f"{self.base_url}/api/search", {
+            'params': {
+                'query': job_title,
+                'location': 'United States',
+                'timeRange': '1h',
+                'page': cursor or 1,
+                'limit': self.page_size
+            }
+        }
+    
+    def _next_cursor(self, data: Any, cursor: Any, rows: List[Dict]) -> Any:
+        """The search API is paged by page number"""
+        if len(rows) < self.page_size:
+            return None
+        return (cursor or 1) + 1
+    
+    def _rows(self, data: Any) -> List[Dict]:
+        """Get the jobs from a search response"""
+        if not isinstance(data, dict):
+            return []
+        return data.get('jobs') or []
+    
+    def _job_from_row(self, row: Dict, now: datetime) -> Job:
+        """Build a job from a Welcome to the Jungle record"""
+        location = row.get('location') or {}
+        return Job(
+            title=row.get('title', ''),
+            company=(row.get('company') or {}).get('name') or '',
+            link=f"https://www.welcometothejungle.com/en/jobs/{row.get('slug', '')}",
+            posted_time=parse_time(row.get('publishedAt'), now),
+            source='Welcome to the Jungle',
+            location=location.get('city', ''),
+            is_remote=location.get('isRemote', False)
+        )
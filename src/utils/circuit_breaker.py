@@ -0,0 +1,113 @@
+import time
+from typing import Dict, List
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float, max_reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    @property
+    def open_timeout(self) -> float:
+        """Seconds to stay open, doubling each time the breaker trips again"""
+        return min(self.max_reset_timeout, self.reset_timeout * 2 ** max(0, self.trips - 1))
+
+    def ready(self) -> bool:
+        """Check if a request may be attempted, without changing state"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            return time.monotonic() - self.opened_at >= self.open_timeout
+        return not self.probe_in_flight
+
+    def begin(self):
+        """Mark a request as started, turning an expired open breaker into a single probe"""
+        if self.state == self.OPEN:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            self.probe_in_flight = True
+
+    def record_success(self):
+        """Close the breaker after a successful request"""
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.probe_in_flight = False
+
+    def release(self):
+        """End a request that neither proved nor disproved the host is up, letting another probe through"""
+        self.probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failed request; return True if this trips the breaker"""
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            self.failures = 0
+            return True
+        return False
+
+class CircuitBreakerRegistry:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.failure_threshold = config.get('circuit_breaker', 'failure_threshold', 5)
+        self.reset_timeout = config.get('circuit_breaker', 'reset_timeout', 300)
+        self.max_reset_timeout = config.get('circuit_breaker', 'max_reset_timeout', 3000)
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Get or create the breaker with the given name"""
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(
+                name, self.failure_threshold, self.reset_timeout, self.max_reset_timeout
+            )
+        return self.breakers[name]
+
+    def allow(self, breakers: List[CircuitBreaker]) -> bool:
+        """Start a request only if every breaker guarding it lets it through"""
+        if not all(breaker.ready() for breaker in breakers):
+            return False
+        for breaker in breakers:
+            breaker.begin()
+        return True
+
+    def record_success(self, breakers: List[CircuitBreaker]):
+        """Report a successful request to its breakers"""
+        for breaker in breakers:
+            breaker.record_success()
+
+    def record_failure(self, breakers: List[CircuitBreaker]):
+        """Report a failed request to its breakers"""
+        for breaker in breakers:
+            if breaker.record_failure():
+                self.logger.warning(
+                    f"Circuit breaker {breaker.name} opened for {breaker.open_timeout:.0f} seconds"
+                )
+
+    def release(self, breakers: List[CircuitBreaker]):
+        """Report the end of a request; clears a probe left in flight by cancellation or a non-server error"""
+        for breaker in breakers:
+            breaker.release()
+
+    def states(self) -> Dict[str, str]:
+        """State of every breaker that is not closed"""
+        return {
+            name: breaker.state for name, breaker in self.breakers.items()
+            if breaker.state != CircuitBreaker.CLOSED
+        }
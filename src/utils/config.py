@@ -0,0 +1,26 @@
+import os
+from typing import Any, Optional
+import yaml
+
+class Config:
+    _instance: Optional['Config'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Config, cls).__new__(cls)
+            cls._instance._load_config()
+        return cls._instance
+
+    def _load_config(self):
+        """Load settings from config/config.yaml if it exists"""
+        self.config_file = os.path.join('config', 'config.yaml')
+        self.settings = {}
+
+        if os.path.exists(self.config_file):
+            with open(self.config_file, 'r') as f:
+                self.settings = yaml.safe_load(f) or {}
+
+    def get(self, section: str, key: str, default: Any = None) -> Any:
+        """Get a setting from a config section, falling back to a default"""
+        values = self.settings.get(section) or {}
+        return values.get(key, default)
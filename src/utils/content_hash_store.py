@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+class ContentHashStore:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.store_file = config.get(
+            'cache', 'content_hash_file', os.path.join('data', 'cache', 'content_hashes.json')
+        )
+        self.max_age = config.get('cache', 'content_hash_max_age_days', 7) * 24 * 3600
+        self.entries: Dict[str, dict] = {}
+        self.stats = self._empty_stats()
+        self._load()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed page counters"""
+        return {'unchanged': 0, 'parsed': 0}
+
+    @staticmethod
+    def _key(source: str, url: str) -> str:
+        """Key a page by the source that parses it and its URL"""
+        return f"{source} {url}"
+
+    @staticmethod
+    def digest(body: str) -> str:
+        """Hash a page body"""
+        return hashlib.blake2b(body.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load(self):
+        """Load page hashes and parse results saved by earlier runs"""
+        if not os.path.exists(self.store_file):
+            return
+        try:
+            with open(self.store_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable content hash store: {str(e)}")
+            self.entries = {}
+
+    def lookup(self, source: str, url: str, digest: str) -> Optional[List[Job]]:
+        """Return the previous parse result if the page hash is unchanged"""
+        entry = self.entries.get(self._key(source, url))
+        if not entry or entry['hash'] != digest:
+            return None
+
+        entry['seen_at'] = time.time()
+        self.stats['unchanged'] += 1
+        return [Job.from_dict(data) for data in entry['jobs']]
+
+    def store(self, source: str, url: str, digest: str, jobs: List[Job]):
+        """Remember a page hash together with the jobs parsed from it"""
+        self.entries[self._key(source, url)] = {
+            'hash': digest,
+            'jobs': [job.to_dict() for job in jobs],
+            'seen_at': time.time()
+        }
+        self.stats['parsed'] += 1
+
+    def save(self):
+        """Drop pages not seen for a while and persist the store"""
+        cutoff = time.time() - self.max_age
+        self.entries = {
+            key: entry for key, entry in self.entries.items()
+            if entry['seen_at'] >= cutoff
+        }
+        try:
+            os.makedirs(os.path.dirname(self.store_file) or '.', exist_ok=True)
+            with open(self.store_file, 'w') as f:
+                json.dump(self.entries, f)
+        except OSError as e:
+            self.logger.warning(f"Could not save content hash store: {str(e)}")
+
+    def log_stats(self):
+        """Log and reset page counters"""
+        stats, self.stats = self.stats, self._empty_stats()
+        self.logger.info(
+            f"Page parsing: {stats['parsed']} parsed, {stats['unchanged']} unchanged pages skipped"
+        )
@@ -1,24 +1,35 @@
 import os
-import csv
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 import pandas as pd
 from src.models.job import Job
-import yaml
+from src.utils.config import Config
+from src.utils.job_archive import JobArchive
+from src.utils.job_store import JobStore
+from src.utils.logger import Logger
 
 class FileManager:
     def __init__(self):
         self.data_dir = "data"
         self.config_file = "config.yaml"
         self.titles_file = "job_titles.txt"
-        self.jobs_dir = os.path.join(self.data_dir, "jobs")
         self._ensure_data_directory()
+        self.job_store = JobStore()
+        self.archive = self._create_archive()
     
     def _ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
-        os.makedirs(self.jobs_dir, exist_ok=True)
+    
+    def _create_archive(self) -> Optional[JobArchive]:
+        """Create the Parquet archive if it is enabled and pyarrow is installed"""
+        if not Config().get('archive', 'enabled', False):
+            return None
+        if not JobArchive.available():
+            Logger().warning("Job archive is enabled but pyarrow is not installed; archiving is off")
+            return None
+        return JobArchive()
     
     def save_job_titles(self, titles: List[str]):
         """Save job titles to CSV"""
@@ -33,53 +44,33 @@ class FileManager:
         return df['title'].tolist()
     
     def save_jobs(self, jobs: List[Job]):
-        """Save jobs to a new hourly file"""
+        """Save jobs to the job store, updating postings saved before"""
         if not jobs:
             return
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"jobs_{timestamp}.csv"
-        filepath = os.path.join(self.jobs_dir, filename)
-        
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'title', 'company', 'link', 'posted_time',
-                'source', 'location', 'is_remote'
-            ])
-            writer.writeheader()
-            for job in jobs:
-                writer.writerow(job.to_dict())
+        self.job_store.save_jobs(jobs)
+        if self.archive:
+            self.archive.append(jobs)
     
-    def cleanup_old_files(self, hours: int = 24):
-        """Delete job files older than specified hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        for filename in os.listdir(self.jobs_dir):
-            if not filename.endswith('.csv'):
-                continue
-                
-            filepath = os.path.join(self.jobs_dir, filename)
-            file_time = datetime.fromtimestamp(os.path.getctime(filepath))
-            
-            if file_time < cutoff_time:
-                try:
-                    os.remove(filepath)
-                except Exception as e:
-                    print(f"Error deleting {filepath}: {str(e)}")
+    def cleanup_old_jobs(self, hours: int = 24):
+        """Delete jobs saved more than the specified hours ago"""
+        self.job_store.delete_older_than(hours)
     
     def get_latest_jobs(self) -> List[Job]:
-        """Get the most recent jobs from the latest file"""
-        files = [f for f in os.listdir(self.jobs_dir) if f.endswith('.csv')]
-        if not files:
-            return []
-        
-        latest_file = max(files, key=lambda x: os.path.getctime(os.path.join(self.jobs_dir, x)))
-        filepath = os.path.join(self.jobs_dir, latest_file)
-        
-        jobs = []
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                jobs.append(Job.from_dict(row))
-        
-        return jobs 
\ No newline at end of file
+        """Get the jobs saved by the most recent cycle"""
+        return self.job_store.latest_jobs()
+    
+    def load_jobs(self) -> List[Job]:
+        """Get all stored jobs, best title matches first"""
+        return self.job_store.jobs()
+    
+    def compact_archive(self):
+        """Merge the small per-cycle archive files of finished days"""
+        if self.archive:
+            self.archive.compact()
+    
+    def query_archive(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                      sources: Optional[List[str]] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load archived jobs for analysis, filtering by posting time and source while reading"""
+        if not self.archive:
+            raise RuntimeError("Job archive is not enabled (set archive.enabled and install pyarrow)")
+        return self.archive.query(start, end, sources, columns)
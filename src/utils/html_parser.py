@@ -0,0 +1,118 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+class SelectolaxElement:
+    """Exposes the subset of the BeautifulSoup Tag API the scrapers use on top of a selectolax node"""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    @staticmethod
+    def _selector(name: Optional[str], class_: Optional[str]) -> str:
+        """Build the CSS selector equivalent of a find(name, class_=...) call"""
+        selector = name or '*'
+        if class_:
+            selector += ''.join(f'.{cls}' for cls in class_.split())
+        return selector
+
+    def find_all(self, name: Optional[str] = None, class_: Optional[str] = None) -> List['SelectolaxElement']:
+        """Find all matching descendants, like Tag.find_all"""
+        own_id = self.node.mem_id
+        return [
+            SelectolaxElement(node) for node in self.node.css(self._selector(name, class_))
+            if node.mem_id != own_id
+        ]
+
+    def find(self, name: Optional[str] = None, class_: Optional[str] = None) -> Optional['SelectolaxElement']:
+        """Find the first matching descendant, like Tag.find"""
+        selector = self._selector(name, class_)
+        node = self.node.css_first(selector)
+        if node is not None and node.mem_id == self.node.mem_id:
+            # css_first can return the element itself; only then walk on to its first matching descendant
+            node = next((match for match in self.node.css(selector) if match.mem_id != node.mem_id), None)
+        return SelectolaxElement(node) if node is not None else None
+
+    @property
+    def text(self) -> str:
+        """All text inside the element, like Tag.text"""
+        return self.node.text(deep=True)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get an attribute value, like Tag.get"""
+        if key not in self.node.attributes:
+            return default
+        return self.node.attributes[key] or ''
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+# (tag name, class) of the only elements to build, or None for the whole page
+ParseOnly = Optional[Tuple[Optional[str], Optional[str]]]
+
+def _strainer(parse_only: ParseOnly) -> Optional[SoupStrainer]:
+    """Build a SoupStrainer so BeautifulSoup only creates the matching subtrees"""
+    if not parse_only:
+        return None
+    name, class_ = parse_only
+    return SoupStrainer(name, class_=class_) if class_ else SoupStrainer(name)
+
+def _parse_with_selectolax(html: str, parse_only: ParseOnly = None) -> SelectolaxElement:
+    """Parse with the lexbor engine behind selectolax"""
+    # lexbor builds its tree in C and only matched nodes get Python wrappers,
+    # so there is nothing to gain from straining here
+    return SelectolaxElement(LexborHTMLParser(html).root)
+
+def _parse_with_lxml(html: str, parse_only: ParseOnly = None) -> BeautifulSoup:
+    """Parse into a BeautifulSoup tree using lxml's C tokenizer"""
+    return BeautifulSoup(html, 'lxml', parse_only=_strainer(parse_only))
+
+def _parse_with_html_parser(html: str, parse_only: ParseOnly = None) -> BeautifulSoup:
+    """Parse into a BeautifulSoup tree using the pure Python parser"""
+    return BeautifulSoup(html, 'html.parser', parse_only=_strainer(parse_only))
+
+# Fastest first; 'auto' picks the first one that is installed
+PARSER_BACKENDS: Dict[str, Callable[[str, ParseOnly], object]] = {
+    'selectolax': _parse_with_selectolax,
+    'lxml': _parse_with_lxml,
+    'html.parser': _parse_with_html_parser
+}
+
+def _available(name: str) -> bool:
+    """Check if a parser backend's library is installed"""
+    if name == 'selectolax':
+        return LexborHTMLParser is not None
+    if name == 'lxml':
+        return HAS_LXML
+    return name in PARSER_BACKENDS
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """Resolve a configured backend name to an installed one, falling back to html.parser"""
+    name = name or Config().get('parsing', 'backend', 'auto')
+    if name == 'auto':
+        return next(backend for backend in PARSER_BACKENDS if _available(backend))
+    if not _available(name):
+        Logger().warning(f"HTML parser backend '{name}' is not installed, falling back to html.parser")
+        return 'html.parser'
+    return name
+
+def make_soup(html: str, backend: Optional[str] = None, parse_only: ParseOnly = None):
+    """Parse HTML into a tree supporting find/find_all/text/[attr], optionally building only parse_only subtrees"""
+    return PARSER_BACKENDS[backend or resolve_backend()](html, parse_only)
@@ -0,0 +1,118 @@
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from src.utils.html_parser import ParseOnly
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+))
+
+class CardStreamParser(HTMLParser):
+    """Extracts job cards from HTML fed in chunks, holding only the card being read; sets `done` once the card list closes
+
+    Without a card_list selector the whole document is read, since cards may sit in per-card wrappers.
+    """
+
+    def __init__(self, card: ParseOnly, fields: Dict[str, ParseOnly], attrs: Optional[Dict[str, str]] = None,
+                 card_list: ParseOnly = None):
+        super().__init__(convert_charrefs=True)
+        self.card = self._matcher(card)
+        self.card_list = self._matcher(card_list) if card_list else None
+        self.fields = {name: self._matcher(selector) for name, selector in fields.items()}
+        self.attrs = attrs or {}
+        self.stack: List[str] = []
+        self.cards: List[Dict[str, str]] = []
+        self.done = False
+        self._card_depth: Optional[int] = None  # stack depth of the open card
+        self._list_depth: Optional[int] = None  # stack depth of the open card list element
+        self._current: Dict[str, str] = {}
+        self._capturing: Dict[str, int] = {}  # field -> stack depth of its open element
+        self._text: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _matcher(selector: ParseOnly) -> Tuple[Optional[str], frozenset]:
+        """Turn a (tag, class) selector into a tag name and the set of classes to require"""
+        name, class_ = selector or (None, None)
+        return name, frozenset((class_ or '').split())
+
+    @staticmethod
+    def _matches(matcher: Tuple[Optional[str], frozenset], tag: str, attrs: List[Tuple[str, Optional[str]]]) -> bool:
+        """Check a start tag against a selector"""
+        name, classes = matcher
+        if name and name != tag:
+            return False
+        if not classes:
+            return True
+        for key, value in attrs:
+            if key == 'class' and value:
+                return classes.issubset(value.split())
+        return False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if self.done:
+            return
+        if self.card_list and self._list_depth is None and self._matches(self.card_list, tag, attrs):
+            self._list_depth = len(self.stack) + 1
+        if self._card_depth is None:
+            if self._matches(self.card, tag, attrs):
+                self._card_depth = len(self.stack) + 1
+                self._current = {}
+        else:
+            for field, matcher in self.fields.items():
+                if field in self._current or field in self._capturing:
+                    continue
+                if not self._matches(matcher, tag, attrs):
+                    continue
+                if field in self.attrs:
+                    self._current[field] = dict(attrs).get(self.attrs[field]) or ''
+                else:
+                    self._capturing[field] = len(self.stack) + 1
+                    self._text[field] = []
+
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.stack and self.stack[-1] == tag:
+            self._close_top()
+
+    def handle_endtag(self, tag: str):
+        if self.done or tag not in self.stack:
+            return
+        # Close anything left open inside the element, as browsers do
+        while self.stack:
+            if self._close_top() == tag:
+                break
+
+    def handle_data(self, data: str):
+        for field in self._capturing:
+            self._text[field].append(data)
+
+    def _close_top(self) -> str:
+        """Pop the innermost open element, finishing any field, card or card list it ends"""
+        depth = len(self.stack)
+        tag = self.stack.pop()
+
+        for field, field_depth in list(self._capturing.items()):
+            if field_depth == depth:
+                self._current[field] = ''.join(self._text.pop(field)).strip()
+                del self._capturing[field]
+
+        if self._card_depth == depth:
+            if all(field in self._current for field in self.fields):
+                self.cards.append(self._current)
+            self._current = {}
+            self._capturing = {}
+            self._text = {}
+            self._card_depth = None
+        elif self._list_depth == depth:
+            self.done = True
+
+        return tag
+
+    def pop_cards(self) -> List[Dict[str, str]]:
+        """Take the cards finished since the last call"""
+        cards, self.cards = self.cards, []
+        return cards
@@ -0,0 +1,118 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import aiohttp
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.config import Config
+from src.utils.logger import Logger
+from src.utils.rate_limiter import RateLimiter
+from src.utils.response_cache import ResponseCache
+
+class HttpClient:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.limit = config.get('http', 'max_connections', 100)
+        self.limit_per_host = config.get('http', 'max_connections_per_host', 4)
+        self.dns_cache_ttl = config.get('http', 'dns_cache_ttl', 300)
+        self.keepalive_timeout = config.get('http', 'keepalive_timeout', 30)
+        self.max_requests_per_host = config.get('http', 'max_requests_per_host', 2)
+        self.timeout = aiohttp.ClientTimeout(
+            total=config.get('http', 'total_timeout', 30),
+            connect=config.get('http', 'connect_timeout', 10)
+        )
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.rate_limiter = RateLimiter()
+        self.response_cache = ResponseCache()
+        self.breakers = CircuitBreakerRegistry()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed connection pool counters"""
+        return {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Count requests and pooled connection reuse"""
+        trace_config = aiohttp.TraceConfig()
+
+        def counter(key):
+            async def on_event(session, context, params):
+                self.stats[key] += 1
+            return on_event
+
+        trace_config.on_request_start.append(counter('requests'))
+        trace_config.on_connection_create_end.append(counter('connections_created'))
+        trace_config.on_connection_reuseconn.append(counter('connections_reused'))
+        trace_config.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace_config.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace_config
+
+    async def start(self):
+        """Create the pooled session if it does not exist yet"""
+        if self.session and not self.session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            trace_configs=[self._create_trace_config()]
+        )
+        # Semaphores bind to the loop they first wait on, and a new session may be running on a new loop
+        self.host_semaphores = {}
+
+    async def close(self):
+        """Close the pooled session and all of its connections"""
+        self.response_cache.save()
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self.host_semaphores = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent requests to the URL's host"""
+        host = urlparse(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.max_requests_per_host)
+        return self.host_semaphores[host]
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, rate_limit_delay: Optional[float] = None, **kwargs):
+        """Send a request on the pooled session, waiting for a free slot and a rate token on its host"""
+        await self.start()
+        initial_rate = 1 / rate_limit_delay if rate_limit_delay else None
+        await self.rate_limiter.acquire(url, initial_rate)
+        async with self._host_semaphore(url):
+            async with self.session.request(method, url, **kwargs) as response:
+                self.rate_limiter.record(url, response.status, response.headers.get('Retry-After'))
+                yield response
+
+    def reset_stats(self) -> Dict[str, int]:
+        """Return the counters collected so far and start new ones"""
+        stats, self.stats = self.stats, self._empty_stats()
+        return stats
+
+    def log_stats(self, stats: Optional[Dict[str, int]] = None):
+        """Log pooled connection reuse counters"""
+        stats = stats or self.stats
+        self.logger.info(
+            f"HTTP pool: {stats['requests']} requests, "
+            f"{stats['connections_created']} new connections, "
+            f"{stats['connections_reused']} reused (handshakes saved), "
+            f"{stats['dns_cache_hits']} DNS cache hits, {stats['dns_cache_misses']} misses"
+        )
@@ -0,0 +1,172 @@
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Iterable, List, Optional
+import pandas as pd
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Written beside a compaction's output until its inputs are deleted
+_MANIFEST = '.compaction.json'
+
+class JobArchive:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.archive_dir = config.get('archive', 'dir', os.path.join('data', 'archive'))
+        self.compression = config.get('archive', 'compression', 'zstd')
+        self.compact_min_files = config.get('archive', 'compact_min_files', 2)
+        self.schema = pa.schema([
+            ('title', pa.string()),
+            ('company', pa.string()),
+            ('link', pa.string()),
+            ('posted_time', pa.timestamp('us')),
+            ('location', pa.string()),
+            ('is_remote', pa.bool_()),
+            ('match_score', pa.float64()),
+            ('matched_title', pa.string()),
+            ('sources', pa.list_(pa.string())),
+            ('saved_date', pa.string()),
+            ('source', pa.string())
+        ])
+        # Files live under saved_date=YYYY-MM-DD/source=<name>/. Only today's partitions get new files,
+        # so a finished day is compacted once, and date and source filters skip whole directories
+        self.partitioning = ds.partitioning(
+            pa.schema([('saved_date', pa.string()), ('source', pa.string())]), flavor='hive'
+        )
+        self._recover()
+
+    @staticmethod
+    def available() -> bool:
+        """Check if pyarrow is installed"""
+        return pa is not None
+
+    def append(self, jobs: Iterable[Job], saved: Optional[date] = None):
+        """Write jobs as new compressed Parquet files in the partition of each source for the day they were saved"""
+        jobs = list(jobs)
+        if not jobs:
+            return
+        saved_date = (saved or date.today()).isoformat()
+        table = pa.Table.from_pydict({
+            'title': [job.title for job in jobs],
+            'company': [job.company for job in jobs],
+            'link': [job.link for job in jobs],
+            'posted_time': [job.posted_time for job in jobs],
+            'location': [job.location for job in jobs],
+            'is_remote': [bool(job.is_remote) for job in jobs],
+            'match_score': [job.match_score for job in jobs],
+            'matched_title': [job.matched_title for job in jobs],
+            'sources': [list(job.sources) for job in jobs],
+            'saved_date': [saved_date] * len(jobs),
+            'source': [job.source for job in jobs]
+        }, schema=self.schema)
+        ds.write_dataset(
+            table,
+            self.archive_dir,
+            format='parquet',
+            partitioning=self.partitioning,
+            basename_template=f"part-{time.time_ns()}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            file_options=ds.ParquetFileFormat().make_write_options(compression=self.compression)
+        )
+
+    def query(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+              sources: Optional[List[str]] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Archived jobs posted in [start, end) from the given sources as a DataFrame, reading only the given columns"""
+        if not os.path.isdir(self.archive_dir):
+            return self.schema.empty_table().to_pandas()
+        # The full schema reads files written before a column was added, with nulls for it
+        dataset = ds.dataset(self.archive_dir, schema=self.schema, format='parquet', partitioning=self.partitioning)
+
+        # Jobs are saved after they are posted, so days saved before start are skipped whole;
+        # posted_time conditions use the row group statistics
+        conditions = []
+        if start is not None:
+            conditions.append(ds.field('saved_date') >= start.date().isoformat())
+            conditions.append(ds.field('posted_time') >= pa.scalar(start, pa.timestamp('us')))
+        if end is not None:
+            conditions.append(ds.field('posted_time') < pa.scalar(end, pa.timestamp('us')))
+        if sources:
+            conditions.append(ds.field('source').isin(sources))
+        condition = None
+        for part in conditions:
+            condition = part if condition is None else condition & part
+
+        return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+    def compact(self) -> int:
+        """Merge the files of each finished day's partitions into one, returning how many files were merged"""
+        if not os.path.isdir(self.archive_dir):
+            return 0
+        self._recover()
+        today = f"saved_date={date.today().isoformat()}"
+        merged = 0
+        for directory, _, filenames in os.walk(self.archive_dir):
+            files = sorted(name for name in filenames if name.endswith('.parquet') and not name.startswith('.'))
+            if len(files) < self.compact_min_files or today in directory.split(os.sep):
+                continue
+            paths = [os.path.join(directory, name) for name in files]
+            name = f"part-{time.time_ns()}-compacted.parquet"
+            # Dot files are skipped by readers, so a half-written file is never queried
+            temporary = os.path.join(directory, f".{name}.tmp")
+            try:
+                table = pa.concat_tables([pq.read_table(path) for path in paths], promote_options='default')
+                pq.write_table(table, temporary, compression=self.compression)
+                # The manifest names the inputs, so a crash after the rename cannot leave their rows twice
+                self._write_manifest(directory, {'output': name, 'inputs': files})
+                os.replace(temporary, os.path.join(directory, name))
+            except (OSError, pa.ArrowException) as e:
+                self.logger.warning(f"Could not compact {directory}: {str(e)}")
+                self._recover_directory(directory)
+                continue
+            self._recover_directory(directory)
+            merged += len(paths)
+        if merged:
+            self.logger.info(f"Compacted {merged} archive files")
+        return merged
+
+    @staticmethod
+    def _write_manifest(directory: str, manifest: dict):
+        """Atomically record the output and inputs of a compaction in progress"""
+        path = os.path.join(directory, _MANIFEST)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + '.tmp', path)
+
+    def _recover(self):
+        """Finish or undo compactions interrupted by a crash"""
+        if not os.path.isdir(self.archive_dir):
+            return
+        for directory, _, filenames in os.walk(self.archive_dir):
+            if _MANIFEST in filenames or any(name.endswith('.tmp') for name in filenames):
+                self._recover_directory(directory)
+
+    def _recover_directory(self, directory: str):
+        """Delete a compaction's inputs once its output is in place, otherwise its partial output"""
+        path = os.path.join(directory, _MANIFEST)
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        if manifest and os.path.exists(os.path.join(directory, manifest['output'])):
+            for name in manifest['inputs']:
+                input_path = os.path.join(directory, name)
+                if os.path.exists(input_path):
+                    os.remove(input_path)
+        for name in os.listdir(directory):
+            if name.startswith('.') and name.endswith('.tmp'):
+                os.remove(os.path.join(directory, name))
+        if os.path.exists(path):
+            os.remove(path)
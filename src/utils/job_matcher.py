@@ -1,12 +1,33 @@
-from typing import List
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from fuzzywuzzy import fuzz
 from src.models.job import Job
+from src.utils.location_classifier import LocationClassifier
+from src.utils.title_match_cache import TitleMatch, TitleMatchCache
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz as rapid_fuzz
+    from rapidfuzz.process import cdist
+except ImportError:
+    cdist = None
 
 class JobMatcher:
-    def __init__(self, target_titles: List[str] = None, threshold: int = 80):
+    def __init__(self, target_titles: List[str] = None, threshold: int = 80, cache: Optional[TitleMatchCache] = None):
         self.target_titles = [title.lower() for title in (target_titles or [])]
         self.threshold = threshold
-    
+        self.char_index = self._build_char_index()
+        self.cache = cache
+        self.locations = LocationClassifier()
+        if self.cache:
+            self.cache.bind(self.target_titles, threshold)
+
+    @staticmethod
+    def normalize(title: str) -> str:
+        """Lowercase a title and collapse its whitespace"""
+        return ' '.join(title.lower().split())
+
     def match_jobs(self, job_title: str, jobs: List[Job]) -> List[Job]:
         """Match jobs based on title similarity"""
         matched_jobs = []
@@ -16,47 +37,185 @@ class JobMatcher:
                 matched_jobs.append(job)
         return matched_jobs
 
+    def _score(self, target_title: str, job_title: str) -> float:
+        """Exact score of one lowercased pair: 100 on containment, else the best of ratio and partial ratio"""
+        if target_title in job_title or job_title in target_title:
+            return 100.0
+        return max(fuzz.ratio(target_title, job_title), fuzz.partial_ratio(target_title, job_title))
+
+    def _build_char_index(self) -> Dict[str, List[Tuple[int, int]]]:
+        """Index target titles by character: char -> [(target column, occurrences)]"""
+        index: Dict[str, List[Tuple[int, int]]] = {}
+        for column, target in enumerate(self.target_titles):
+            for char, count in Counter(target).items():
+                index.setdefault(char, []).append((column, count))
+        return index
+
+    @staticmethod
+    def _window_bound(shorter: str, longer: str) -> float:
+        """Bound partial_ratio by the character overlap of the shorter title with each window of the longer"""
+        wanted = Counter(shorter)
+        window = Counter(longer[:len(shorter)])
+        overlap = sum(min(count, wanted[char]) for char, count in window.items())
+        width = min(len(shorter), len(longer))
+        best = 0.0
+        for start in range(len(longer)):
+            best = max(best, 2 * overlap / (len(shorter) + width))
+            char = longer[start]
+            if window[char] <= wanted[char]:
+                overlap -= 1
+            window[char] -= 1
+            if start + len(shorter) < len(longer):
+                char = longer[start + len(shorter)]
+                window[char] += 1
+                if window[char] <= wanted[char]:
+                    overlap += 1
+            else:
+                width -= 1
+        return best
+
+    def _char_bounds(self, job_title: str, floor: float = 0, per_window: bool = True) -> List[float]:
+        """Upper bound of the score against every target from shared characters alone
+
+        Matching characters (M) never exceed the character overlap (ov), so ratio = 2M/(la+lb) <= 2ov/(la+lb),
+        and a partial_ratio window of width lw scores 2M/(ls+lw) <= 2ov/(ls+lw) <= 2ov/(ls+ov).
+        """
+        overlaps = [0] * len(self.target_titles)
+        for char, count in Counter(job_title).items():
+            for column, target_count in self.char_index.get(char, ()):
+                overlaps[column] += min(count, target_count)
+
+        bounds = []
+        for overlap, target in zip(overlaps, self.target_titles):
+            if not overlap:
+                bounds.append(0)
+                continue
+            # Same choice as fuzzywuzzy, which slides the target over the title when lengths tie
+            shorter, longer = (target, job_title) if len(target) <= len(job_title) else (job_title, target)
+            ratio_bound = 2 * overlap / (len(target) + len(job_title))
+            partial_bound = 2 * overlap / (len(shorter) + overlap)
+            # Only pairs still in the running pay for the per-window bound
+            if per_window and round(100 * partial_bound) >= floor and partial_bound > ratio_bound:
+                partial_bound = self._window_bound(shorter, longer)
+            # fuzzywuzzy rounds to whole numbers, and rounding keeps the order
+            bounds.append(round(100 * max(ratio_bound, partial_bound)))
+        return bounds
+
+    def bound_matrix(self, job_titles: List[str], floor: float = 0) -> List[List[float]]:
+        """Upper bounds on the scores, not the scores, of all job titles (rows) against all targets (columns)"""
+        job_titles = [self.normalize(title) for title in job_titles]
+        if not job_titles or not self.target_titles:
+            return [[0.0] * len(self.target_titles) for _ in job_titles]
+
+        # rapidfuzz tightens plausible rows far more cheaply than the per-window bound
+        matrix = [self._char_bounds(title, floor, per_window=cdist is None) for title in job_titles]
+
+        # Tighten the bounds of plausible rows with rapidfuzz's C++ scorers, spread across all cores.
+        # Its alignment is optimal, so a score is never below fuzzywuzzy's for the same pair
+        # Rows whose character bounds stay below floor are already ruled out and not fuzzy scored
+        plausible = [row for row, bounds in enumerate(matrix) if max(bounds) >= floor]
+        if cdist is not None and plausible:
+            titles = [job_titles[row] for row in plausible]
+            fuzzy = np.rint(np.maximum(
+                cdist(titles, self.target_titles, scorer=rapid_fuzz.ratio, workers=-1),
+                cdist(titles, self.target_titles, scorer=rapid_fuzz.partial_ratio, workers=-1)
+            ))
+            for row, fuzzy_row in zip(plausible, fuzzy.tolist()):
+                matrix[row] = [min(bound, score) for bound, score in zip(matrix[row], fuzzy_row)]
+
+        for row, title in zip(matrix, job_titles):
+            for column, target in enumerate(self.target_titles):
+                if target in title or title in target:
+                    row[column] = 100.0
+        return matrix
+
+    def _best_match(self, job_title: str, row: List[float]) -> TitleMatch:
+        """Exact best score and target for a row of bounds, skipping targets whose bound cannot beat the best so far"""
+        best, best_target = 0, None
+        for column in sorted(range(len(row)), key=row.__getitem__, reverse=True):
+            if row[column] <= best:
+                break
+            score = self._score(self.target_titles[column], job_title)
+            if score > best:
+                best, best_target = score, self.target_titles[column]
+        return best, best_target
+
+    def best_matches(self, job_titles: List[str], floor: float = 0) -> List[Optional[TitleMatch]]:
+        """Best score and matched target of each job title, or None where the bounds rule out reaching floor"""
+        titles = [self.normalize(title) for title in job_titles]
+        matches = {}
+        misses = []
+        for title in dict.fromkeys(titles):
+            match = self.cache.get(title) if self.cache else None
+            if match is None:
+                misses.append(title)
+            else:
+                matches[title] = match
+
+        if misses:
+            for title, row in zip(misses, self.bound_matrix(misses, floor)):
+                if max(row, default=0) < floor:
+                    matches[title] = None
+                    continue
+                matches[title] = self._best_match(title, row)
+                if self.cache:
+                    self.cache.put(title, matches[title])
+
+        return [matches[title] for title in titles]
+
     def matches_title(self, job_title: str) -> bool:
         """Check if a job title matches any of the target titles using fuzzy matching"""
-        job_title = job_title.lower()
-        
-        for target_title in self.target_titles:
-            # Try exact match first
-            if target_title in job_title or job_title in target_title:
-                return True
-            
-            # Try fuzzy matching
-            ratio = fuzz.ratio(target_title, job_title)
-            if ratio >= self.threshold:
-                return True
-            
-            # Try partial ratio for better matching of substrings
-            partial_ratio = fuzz.partial_ratio(target_title, job_title)
-            if partial_ratio >= self.threshold:
-                return True
-        
-        return False
-    
+        match = self.best_matches([job_title], self.threshold)[0]
+        return match is not None and match[0] >= self.threshold
+
+    def score_jobs(self, jobs: List[Job]) -> List[Job]:
+        """Attach the best score and matched target to each job in one pass (None where the threshold is ruled out)"""
+        matches = self.best_matches([job.title for job in jobs], self.threshold)
+        for job, match in zip(jobs, matches):
+            job.match_score, job.matched_title = match if match is not None else (None, None)
+        return jobs
+
+    def iter_matches(self, jobs: Iterable[Job], batch_size: int = 500) -> Iterator[Job]:
+        """Stream the jobs that reach the threshold, scored in batches, in input order"""
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= batch_size:
+                yield from self._matching(batch)
+                batch = []
+        if batch:
+            yield from self._matching(batch)
+
+    def _matching(self, jobs: List[Job]) -> List[Job]:
+        """Score a batch and keep the jobs that reach the threshold"""
+        return [
+            job for job in self.score_jobs(jobs)
+            if job.match_score is not None and job.match_score >= self.threshold
+        ]
+
+    def top_jobs(self, jobs: Iterable[Job], k: Optional[int] = None) -> List[Job]:
+        """Matching jobs ranked by match score, best first; only the best k are kept if k is given"""
+        matches = self.iter_matches(jobs)
+        if k is None:
+            return sorted(matches, key=lambda job: job.match_score, reverse=True)
+        return heapq.nlargest(k, matches, key=lambda job: job.match_score)
+
     def filter_jobs(self, jobs: List[Job]) -> List[Job]:
-        """Filter jobs based on title matching"""
-        return [job for job in jobs if self.matches_title(job.title)]
-    
+        """Filter jobs based on title matching, attaching each match's score"""
+        return list(self.iter_matches(jobs))
+
+    def match_qualities(self, job_titles: List[str]) -> List[float]:
+        """Get the best matching score of each job title, scoring them in one batch"""
+        return [score for score, _ in self.best_matches(job_titles)]
+
     def get_match_quality(self, job_title: str) -> float:
         """Get the best matching score for a job title"""
-        job_title = job_title.lower()
-        best_score = 0
-        
-        for target_title in self.target_titles:
-            # Try exact match
-            if target_title in job_title or job_title in target_title:
-                return 100.0
-            
-            # Try fuzzy matching
-            ratio = fuzz.ratio(target_title, job_title)
-            best_score = max(best_score, ratio)
-            
-            # Try partial ratio
-            partial_ratio = fuzz.partial_ratio(target_title, job_title)
-            best_score = max(best_score, partial_ratio)
-        
-        return best_score 
\ No newline at end of file
+        return self.match_qualities([job_title])[0]
+
+    def is_valid_location(self, location: Optional[str]) -> bool:
+        """Check if a job location is remote or in the US"""
+        return self.locations.is_valid(location)
+
+    def filter_locations(self, jobs: Iterable[Job]) -> List[Job]:
+        """Keep remote and US jobs, classifying each distinct location once"""
+        return self.locations.valid_jobs(jobs)
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+from src.utils.url_utils import canonical_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    canonical_url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    link TEXT NOT NULL,
+    posted_time REAL NOT NULL,
+    source TEXT NOT NULL,
+    location TEXT,
+    is_remote INTEGER NOT NULL,
+    match_score REAL,
+    matched_title TEXT,
+    sources TEXT,
+    saved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_posted_time ON jobs (posted_time);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS jobs_saved_at ON jobs (saved_at);
+"""
+
+# A posting saved again keeps its earliest posting time and takes the newest details
+_UPSERT = """
+INSERT INTO jobs (
+    canonical_url, title, company, link, posted_time, source,
+    location, is_remote, match_score, matched_title, sources, saved_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (canonical_url) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    link = excluded.link,
+    posted_time = min(posted_time, excluded.posted_time),
+    source = excluded.source,
+    location = excluded.location,
+    is_remote = excluded.is_remote,
+    match_score = excluded.match_score,
+    matched_title = excluded.matched_title,
+    sources = excluded.sources,
+    saved_at = excluded.saved_at
+"""
+
+_COLUMNS = "title, company, link, posted_time, source, location, is_remote, match_score, matched_title, sources"
+
+class JobStore:
+    def __init__(self, db_file: Optional[str] = None):
+        self.logger = Logger()
+        self.db_file = db_file or Config().get('files', 'job_db', os.path.join('data', 'jobs.db'))
+        os.makedirs(os.path.dirname(self.db_file) or '.', exist_ok=True)
+        with self._connect() as conn:
+            # WAL lets the GUI read while the scraper thread writes; the mode is stored in the file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # Databases created before near-duplicate merging lack the sources column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if 'sources' not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN sources TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one operation; connections are not shared between threads"""
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row(job: Job, saved_at: float) -> tuple:
+        """Convert a job to the values of an upsert"""
+        return (
+            canonical_url(job.link) if job.link else f"{job.source}|{job.title}|{job.company}",
+            job.title,
+            job.company,
+            job.link,
+            job.posted_time.timestamp(),
+            job.source,
+            job.location,
+            int(bool(job.is_remote)),
+            job.match_score,
+            job.matched_title,
+            ', '.join(job.sources) or None,
+            saved_at
+        )
+
+    @staticmethod
+    def _job(row: tuple) -> Job:
+        """Create a job from a selected row"""
+        title, company, link, posted_time, source, location, is_remote, match_score, matched_title, sources = row
+        return Job(
+            title=title,
+            company=company,
+            link=link,
+            posted_time=datetime.fromtimestamp(posted_time),
+            source=source,
+            location=location,
+            is_remote=bool(is_remote),
+            match_score=match_score,
+            matched_title=matched_title,
+            sources=tuple(sources.split(', ')) if sources else ()
+        )
+
+    def save_jobs(self, jobs: Iterable[Job]) -> int:
+        """Upsert jobs in one transaction, keyed on their canonical link"""
+        saved_at = time.time()
+        rows = [self._row(job, saved_at) for job in jobs]
+        if not rows:
+            return 0
+        with self._connect() as conn, conn:
+            conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def latest_jobs(self) -> List[Job]:
+        """Jobs saved or updated by the most recent cycle"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE saved_at = (SELECT max(saved_at) FROM jobs)"
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def jobs(self, since: Optional[datetime] = None, source: Optional[str] = None,
+             limit: Optional[int] = None) -> List[Job]:
+        """Stored jobs, best title matches first and newest first among equal scores"""
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("posted_time >= ?")
+            params.append(since.timestamp())
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY match_score IS NULL, match_score DESC, posted_time DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._job(row) for row in rows]
+
+    def delete_older_than(self, hours: float) -> int:
+        """Delete jobs last saved more than the given number of hours ago, however long ago they were posted"""
+        cutoff = time.time() - hours * 3600
+        with self._connect() as conn, conn:
+            deleted = conn.execute("DELETE FROM jobs WHERE saved_at < ?", (cutoff,)).rowcount
+        if deleted:
+            self.logger.info(f"Deleted {deleted} jobs saved more than {hours} hours ago")
+        return deleted
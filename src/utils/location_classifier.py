@@ -0,0 +1,167 @@
+import re
+from typing import Dict, Iterable, List, Optional
+from src.models.job import Job
+
+REMOTE = 'remote'
+US = 'us'
+AMBIGUOUS = 'ambiguous'  # US place names shared with places abroad
+FOREIGN = 'foreign'
+
+REMOTE_PHRASES = (
+    'remote', 'fully remote', 'remote first', 'anywhere', 'work from home', 'wfh',
+    'telecommute', 'telecommuting', 'distributed', 'virtual'
+)
+
+# "US" itself collides with the word "us", so like the state codes it only counts in capitals
+COUNTRY_PHRASES = (
+    'usa', 'united states', 'united states of america'
+)
+
+# Count as US only when no place abroad is named with them ("Tbilisi, Georgia")
+AMBIGUOUS_PHRASES = ('georgia',)
+
+FOREIGN_PHRASES = (
+    'tbilisi', 'batumi', 'kutaisi', 'canada', 'mexico', 'uk', 'united kingdom', 'england', 'ireland',
+    'germany', 'france', 'spain', 'portugal', 'netherlands', 'poland', 'ukraine', 'armenia',
+    'azerbaijan', 'turkey', 'russia', 'israel', 'india', 'brazil', 'argentina', 'australia',
+    'philippines', 'europe', 'emea', 'apac', 'latam', 'toronto', 'vancouver', 'montreal', 'ottawa',
+    'calgary', 'bengaluru', 'bangalore', 'mumbai', 'new delhi', 'delhi', 'hyderabad', 'pune', 'chennai',
+    'noida', 'gurgaon', 'gurugram'
+)
+
+# Canadian province codes; like the state codes they only count in capitals
+PROVINCES = frozenset({'AB', 'BC', 'MB', 'NB', 'NL', 'NS', 'NT', 'NU', 'ON', 'PE', 'QC', 'SK', 'YT'})
+
+STATES = {
+    'AL': 'alabama', 'AK': 'alaska', 'AZ': 'arizona', 'AR': 'arkansas', 'CA': 'california',
+    'CO': 'colorado', 'CT': 'connecticut', 'DE': 'delaware', 'DC': 'district of columbia',
+    'FL': 'florida', 'GA': 'georgia', 'HI': 'hawaii', 'ID': 'idaho', 'IL': 'illinois',
+    'IN': 'indiana', 'IA': 'iowa', 'KS': 'kansas', 'KY': 'kentucky', 'LA': 'louisiana',
+    'ME': 'maine', 'MD': 'maryland', 'MA': 'massachusetts', 'MI': 'michigan', 'MN': 'minnesota',
+    'MS': 'mississippi', 'MO': 'missouri', 'MT': 'montana', 'NE': 'nebraska', 'NV': 'nevada',
+    'NH': 'new hampshire', 'NJ': 'new jersey', 'NM': 'new mexico', 'NY': 'new york',
+    'NC': 'north carolina', 'ND': 'north dakota', 'OH': 'ohio', 'OK': 'oklahoma', 'OR': 'oregon',
+    'PA': 'pennsylvania', 'RI': 'rhode island', 'SC': 'south carolina', 'SD': 'south dakota',
+    'TN': 'tennessee', 'TX': 'texas', 'UT': 'utah', 'VT': 'vermont', 'VA': 'virginia',
+    'WA': 'washington', 'WV': 'west virginia', 'WI': 'wisconsin', 'WY': 'wyoming',
+    'PR': 'puerto rico'
+}
+
+CITIES = (
+    'new york city', 'nyc', 'brooklyn', 'manhattan', 'los angeles', 'san francisco', 'sf bay area',
+    'bay area', 'silicon valley', 'san jose', 'san diego', 'oakland', 'palo alto', 'mountain view',
+    'sunnyvale', 'menlo park', 'santa clara', 'redwood city', 'irvine', 'sacramento', 'seattle',
+    'bellevue', 'redmond', 'portland', 'boston', 'chicago', 'austin', 'dallas',
+    'houston', 'san antonio', 'fort worth', 'denver', 'boulder', 'atlanta', 'miami', 'tampa',
+    'orlando', 'jacksonville', 'phoenix', 'scottsdale', 'tempe', 'salt lake city', 'las vegas',
+    'minneapolis', 'detroit', 'ann arbor', 'pittsburgh', 'philadelphia', 'baltimore', 'raleigh',
+    'charlotte', 'nashville', 'columbus', 'cleveland', 'cincinnati', 'indianapolis',
+    'st louis', 'saint louis', 'kansas city', 'milwaukee', 'madison', 'new orleans', 'honolulu',
+    'anchorage', 'albuquerque', 'omaha', 'arlington', 'reston', 'mclean', 'herndon',
+    'jersey city', 'hoboken', 'stamford', 'providence', 'hartford', 'buffalo', 'rochester',
+    'albany', 'washington dc', 'washington d c'
+)
+
+# Words, keeping dotted abbreviations like "U.S." together
+_TOKEN = re.compile(r"[A-Za-z]+(?:\.[A-Za-z]+)*\.?")
+
+# A region code such as "ON" or "KA" before a final code makes that code a country ("Toronto, ON, CA")
+_REGION_CODE = re.compile(r"[A-Z]{2,3}")
+
+class LocationClassifier:
+    _instance: Optional['LocationClassifier'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LocationClassifier, cls).__new__(cls)
+            cls._instance._build()
+        return cls._instance
+
+    def _build(self):
+        """Compile the gazetteer into a token trie"""
+        self.trie: Dict[str, dict] = {}
+        for phrase in REMOTE_PHRASES:
+            self._add(phrase, REMOTE)
+        for phrase in COUNTRY_PHRASES + tuple(STATES.values()) + CITIES:
+            if phrase not in AMBIGUOUS_PHRASES:
+                self._add(phrase, US)
+        for phrase in AMBIGUOUS_PHRASES:
+            self._add(phrase, AMBIGUOUS)
+        for phrase in FOREIGN_PHRASES:
+            self._add(phrase, FOREIGN)
+        # Two-letter codes collide with words ("IN", "OR", "ME", "us"), so they only count in capitals
+        self.states = frozenset(STATES)
+        self.memo: Dict[str, Optional[str]] = {}
+        self.max_memo = 100000
+
+    def _add(self, phrase: str, category: str):
+        """Add a phrase to the trie, one token per level"""
+        node = self.trie
+        for token in phrase.split():
+            node = node.setdefault(token, {})
+        node.setdefault('$', category)
+
+    @staticmethod
+    def _tokens(location: str) -> List[str]:
+        """Split a location into words, folding "U.S." into "US" """
+        return [token.replace('.', '') for token in _TOKEN.findall(location)]
+
+    def _code(self, tokens: List[str], index: int) -> Optional[str]:
+        """Categorize a capitalized region or country code; state codes double as country codes (CA, IN)"""
+        token = tokens[index]
+        if token == 'US':
+            return US
+        if token in PROVINCES:
+            return FOREIGN
+        if token in self.states:
+            if index == len(tokens) - 1 and index > 0 and _REGION_CODE.fullmatch(tokens[index - 1]):
+                return FOREIGN
+            return AMBIGUOUS
+        return None
+
+    def _classify(self, location: str) -> Optional[str]:
+        """Find the categories mentioned in a location; remote wins over a US place"""
+        tokens = self._tokens(location)
+        lowered = [token.lower() for token in tokens]
+        found = set()
+        for start in range(len(tokens)):
+            code = self._code(tokens, start)
+            if code:
+                found.add(code)
+            node = self.trie
+            for token in lowered[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                category = node.get('$')
+                if category == REMOTE:
+                    return REMOTE
+                if category:
+                    found.add(category)
+        if US in found or (AMBIGUOUS in found and FOREIGN not in found):
+            return US
+        return None
+
+    def classify(self, location: Optional[str]) -> Optional[str]:
+        """Classify a location as 'remote', 'us' or None, memoized per distinct string"""
+        if not location:
+            return None
+        if location not in self.memo:
+            if len(self.memo) >= self.max_memo:
+                self.memo.clear()
+            self.memo[location] = self._classify(location)
+        return self.memo[location]
+
+    def classify_many(self, locations: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """Classify many locations, doing the work once per distinct string"""
+        return [self.classify(location) for location in locations]
+
+    def is_valid(self, location: Optional[str]) -> bool:
+        """Check if a location is remote or in the US"""
+        return self.classify(location) is not None
+
+    def valid_jobs(self, jobs: Iterable[Job]) -> List[Job]:
+        """Keep the jobs that are remote or located in the US"""
+        jobs = list(jobs)
+        categories = self.classify_many(job.location for job in jobs)
+        return [job for job, category in zip(jobs, categories) if job.is_remote or category is not None]
@@ -0,0 +1,239 @@
+import os
+import random
+import re
+import struct
+import time
+import zlib
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# File layout: header, then per signature its source, link and title marker hashes, last-seen time and num_perm
+# values, all uint32
+_MAGIC = b'MNH2'
+_OLD_MAGICS = (b'MNHS',)
+_HEADER = struct.Struct('<4sII')
+
+_MASK = (1 << 64) - 1
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+_COMPANY_SUFFIXES = re.compile(r'\b(inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc)\b')
+_TITLE_WORDS = {'sr': 'senior', 'jr': 'junior', 'engr': 'engineer', 'mgr': 'manager', 'dev': 'developer'}
+# Title words that tell apart roles which otherwise read alike; two postings only merge if theirs are the same
+_SENIORITY = {
+    'intern', 'junior', 'associate', 'mid', 'senior', 'staff', 'principal', 'lead', 'distinguished', 'head',
+    'director', 'vp', 'chief'
+}
+_NUMERALS = re.compile(r'\d+|i{1,3}|iv|vi{0,3}|ix|x')
+
+Signature = Tuple[int, ...]
+Entry = Tuple[int, int, int, int, Signature]  # source, link and marker hashes, last-seen time, signature
+
+class NearDuplicateIndex:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.index_file = config.get(
+            'cache', 'near_duplicate_file', os.path.join('data', 'cache', 'near_duplicates.bin')
+        )
+        self.max_age = config.get('cache', 'near_duplicate_max_age_days', 14) * 24 * 3600
+        self.threshold = config.get('dedup', 'similarity_threshold', 0.85)
+        self.num_perm = config.get('dedup', 'num_perm', 128)
+        self.bands = config.get('dedup', 'lsh_bands', 32)
+        self.rows = self.num_perm // self.bands
+        # Multiply-shift hashes, seeded so signatures saved by one run stay comparable in the next
+        rng = random.Random(self.num_perm)
+        self.permutations = [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(self.num_perm)]
+        if np is not None:
+            self._multipliers = np.array([a for a, _ in self.permutations], dtype=np.uint64)[:, None]
+            self._increments = np.array([b for _, b in self.permutations], dtype=np.uint64)[:, None]
+        self.signatures: List[Signature] = []
+        self.seen_at: List[int] = []
+        self.source_keys: List[int] = []
+        self.link_keys: List[int] = []
+        self.marker_keys: List[int] = []
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}  # (band, band hash) -> signature ids
+        self.stats = self._empty_stats()
+        self._load()
+        self.saved = len(self.signatures)  # signatures up to here were saved; later ones await save()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed job counters"""
+        return {'unique': 0, 'merged': 0, 'archived': 0}
+
+    @staticmethod
+    def normalize_company(company: str) -> str:
+        """Lowercase a company name without punctuation or legal suffixes like Inc or LLC"""
+        return ' '.join(_COMPANY_SUFFIXES.sub(' ', _NON_WORD.sub(' ', company.lower())).split())
+
+    @classmethod
+    def normalize(cls, job: Job) -> str:
+        """Reduce a job to lowercase words of its title, company and location, without common variations"""
+        title = ' '.join(_TITLE_WORDS.get(word, word) for word in _NON_WORD.sub(' ', job.title.lower()).split())
+        location = ' '.join(_NON_WORD.sub(' ', (job.location or '').lower()).split())
+        return f"{title} | {cls.normalize_company(job.company)} | {location}"
+
+    @staticmethod
+    def _key(text: str) -> int:
+        return zlib.crc32(text.encode('utf-8'))
+
+    @classmethod
+    def markers(cls, job: Job) -> str:
+        """Seniority words and level numerals of a title, such as 'ii senior'"""
+        words = (_TITLE_WORDS.get(word, word) for word in _NON_WORD.sub(' ', job.title.lower()).split())
+        return ' '.join(sorted({word for word in words if word in _SENIORITY or _NUMERALS.fullmatch(word)}))
+
+    def keys(self, job: Job) -> Tuple[int, int, int]:
+        """Hashes of a job's source, link and title markers"""
+        return self._key(job.source), self._key(job.link), self._key(self.markers(job))
+
+    def signature(self, job: Job) -> Signature:
+        """MinHash signature of the character 3-gram shingles of a job's title, company and location"""
+        text = self.normalize(job)
+        shingles = {zlib.crc32(text[i:i + 3].encode('utf-8')) for i in range(max(len(text) - 2, 1))}
+        if np is not None:
+            values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+            hashes = (self._multipliers * values + self._increments) >> np.uint64(32)
+            return tuple(hashes.min(axis=1).tolist())
+        return tuple(
+            min(((a * shingle + b) & _MASK) >> 32 for shingle in shingles)
+            for a, b in self.permutations
+        )
+
+    def _band_keys(self, signature: Signature) -> List[Tuple[int, int]]:
+        """Bucket keys of a signature, one per band of rows"""
+        return [(band, hash(signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+
+    def similarity(self, first: Signature, second: Signature) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(x == y for x, y in zip(first, second)) / self.num_perm
+
+    def _add(self, source: int, link: int, markers: int, seen_at: int, signature: Signature) -> int:
+        """Index a signature and return its id"""
+        entry = len(self.signatures)
+        self.source_keys.append(source)
+        self.link_keys.append(link)
+        self.marker_keys.append(markers)
+        self.seen_at.append(seen_at)
+        self.signatures.append(signature)
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, []).append(entry)
+        return entry
+
+    def _entries(self) -> List[Entry]:
+        return list(zip(self.source_keys, self.link_keys, self.marker_keys, self.seen_at, self.signatures))
+
+    def can_merge(self, entry: int, source: int, link: int, markers: int) -> bool:
+        """Whether a posting may copy an indexed one: the same title markers, and another board or the same link"""
+        # Near-identical postings with their own links on one board are separate openings
+        same_board = self.source_keys[entry] == source and self.link_keys[entry] != link
+        return self.marker_keys[entry] == markers and not same_board
+
+    def find(self, signature: Signature, accept: Callable[[int], bool]) -> Optional[int]:
+        """Id of the most similar accepted signature at or above the threshold, looking only at shared buckets"""
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        best, best_entry = self.threshold, None
+        # In id order, so ties go to the earliest posting
+        for entry in sorted(candidates):
+            if not accept(entry):
+                continue
+            similarity = self.similarity(signature, self.signatures[entry])
+            if similarity > best or (similarity == best and best_entry is None):
+                best, best_entry = similarity, entry
+        return best_entry
+
+    def collapse(self, jobs: Iterable[Job]) -> List[Job]:
+        """Merge copies from other boards into the first job of each cluster, listing every board; drop jobs kept earlier"""
+        now = int(time.time())
+        # Signatures of a cycle whose jobs were never stored are forgotten, so those jobs are offered again
+        if len(self.signatures) > self.saved:
+            self._rebuild(self._entries()[:self.saved])
+        first_new = len(self.signatures)
+        canonical: Dict[int, Job] = {}
+        sources: Dict[int, List[str]] = {}
+        for job in jobs:
+            source, link, markers = self.keys(job)
+            signature = self.signature(job)
+            # A board lists a role once; its other look-alike postings in this cycle are separate openings
+            entry = self.find(signature, lambda entry: self.can_merge(entry, source, link, markers) and (
+                entry < first_new or job.source not in sources[entry]
+            ))
+            if entry is None:
+                entry = self._add(source, link, markers, now, signature)
+                canonical[entry] = job
+                sources[entry] = [job.source]
+                self.stats['unique'] += 1
+            elif entry >= first_new:
+                sources[entry].append(job.source)
+                self.stats['merged'] += 1
+            else:
+                self.seen_at[entry] = now
+                self.stats['archived'] += 1
+
+        # The kept job's own board stays its source; the others are listed beside it
+        for entry, job in canonical.items():
+            if len(sources[entry]) > 1:
+                job.sources = tuple(sources[entry])
+        return list(canonical.values())
+
+    def _load(self):
+        """Load the signatures saved by earlier runs and rebuild the buckets"""
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'rb') as f:
+                magic, num_perm, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic in _OLD_MAGICS:
+                    self.logger.info("Near duplicate index format changed, starting a new index")
+                    return
+                if magic != _MAGIC:
+                    raise ValueError("not a near duplicate index")
+                if num_perm != self.num_perm:
+                    self.logger.info("Near duplicate settings changed, starting a new index")
+                    return
+                values = array('I')
+                values.fromfile(f, count * (num_perm + 4))
+        except (OSError, ValueError, EOFError, struct.error) as e:
+            self.logger.warning(f"Ignoring unreadable near duplicate index: {str(e)}")
+            return
+        width = num_perm + 4
+        for start in range(0, len(values), width):
+            self._add(*values[start:start + 4], tuple(values[start + 4:start + width]))
+
+    def _rebuild(self, entries: List[Entry]):
+        """Replace the index with the given entries"""
+        self.source_keys, self.link_keys, self.marker_keys, self.seen_at, self.signatures = [], [], [], [], []
+        self.buckets = {}
+        for *keys, signature in entries:
+            self._add(*keys, signature)
+
+    def save(self):
+        """Drop signatures not seen for a while and persist the index; call once the collapsed jobs are stored"""
+        cutoff = time.time() - self.max_age
+        kept = [entry for entry in self._entries() if entry[3] >= cutoff]
+        self._rebuild(kept)
+        self.saved = len(self.signatures)
+        try:
+            os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+            with open(self.index_file, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, self.num_perm, len(self.signatures)))
+                array('I', (value for *keys, signature in kept for value in tuple(keys) + signature)).tofile(f)
+        except OSError as e:
+            self.logger.warning(f"Could not save near duplicate index: {str(e)}")
+
+    def log_stats(self):
+        """Log and reset job counters"""
+        stats, self.stats = self.stats, self._empty_stats()
+        self.logger.info(
+            f"Near duplicates: {stats['unique']} unique, {stats['merged']} merged across sources, "
+            f"{stats['archived']} matching earlier jobs dropped, {len(self.signatures)} signatures kept"
+        )
@@ -0,0 +1,54 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+class ParsePool:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.kind = config.get('parsing', 'executor', 'process')
+        self.workers = config.get('parsing', 'workers', None) or max(1, (os.cpu_count() or 2) - 1)
+        self.executor: Optional[Executor] = None
+
+    def _create_executor(self) -> Optional[Executor]:
+        """Create the configured executor; None parses inline on the event loop"""
+        if self.kind == 'process':
+            # Spawn rather than fork: the scraper runs beside the GUI thread
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        if self.kind == 'thread':
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='parser')
+        return None
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run a parse function in the pool without blocking the event loop"""
+        if self.executor is None:
+            self.executor = self._create_executor()
+        if self.executor is None:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, func, *args)
+        except BrokenExecutor as e:
+            self.logger.error(f"Parse pool broke, parsing inline until it is recreated: {str(e)}")
+            self.shutdown()
+            return func(*args)
+
+    async def run_in_thread(self, func: Callable[..., Any], *args) -> Any:
+        """Run stateful parse work that must stay in this process, such as feeding a stream parser, off the event loop"""
+        if self.kind not in ('process', 'thread'):
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def shutdown(self):
+        """Stop the worker processes or threads"""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, window: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.recent_throttles = deque(maxlen=window)
+
+    def reserve(self) -> float:
+        """Take a token if one is available, otherwise return the seconds to wait"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    @property
+    def throttle_rate(self) -> float:
+        """Fraction of recent responses that were rate limited"""
+        if not self.recent_throttles:
+            return 0.0
+        return sum(self.recent_throttles) / len(self.recent_throttles)
+
+class RateLimiter:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.default_rate = config.get('rate_limit', 'initial_rate', 0.5)
+        self.min_rate = config.get('rate_limit', 'min_rate', 0.05)
+        self.max_rate = config.get('rate_limit', 'max_rate', 2.0)
+        self.burst = config.get('rate_limit', 'burst', 2)
+        self.increase_step = config.get('rate_limit', 'increase_step', 0.05)
+        self.decrease_factor = config.get('rate_limit', 'decrease_factor', 0.5)
+        self.max_retry_after = config.get('rate_limit', 'max_retry_after', 300)
+        self.window = config.get('rate_limit', 'window', 20)
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, url: str, initial_rate: Optional[float] = None) -> TokenBucket:
+        """Get the bucket for the URL's host, seeding new hosts with the initial rate"""
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            rate = min(self.max_rate, max(self.min_rate, initial_rate or self.default_rate))
+            self.buckets[host] = TokenBucket(rate, self.burst, self.window)
+        return self.buckets[host]
+
+    async def acquire(self, url: str, initial_rate: Optional[float] = None):
+        """Wait until the URL's host has a request token available"""
+        bucket = self._bucket(url, initial_rate)
+        while True:
+            wait = bucket.reserve()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def record(self, url: str, status: int, retry_after: Optional[str] = None):
+        """Adapt the host's rate to a response status"""
+        bucket = self._bucket(url)
+        throttled = status == 429 or (status == 503 and retry_after is not None)
+        bucket.recent_throttles.append(throttled)
+
+        if throttled:
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+            bucket.tokens = 0
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                delay = min(delay, self.max_retry_after)
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            self.logger.warning(
+                f"Rate limited by {urlparse(url).netloc}, slowing to {bucket.rate:.2f} req/s"
+            )
+        elif bucket.throttle_rate == 0:
+            # Probe for a higher rate only while the host has stopped throttling us
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+    def rates(self) -> Dict[str, float]:
+        """Current request rate per host in requests per second"""
+        return {host: round(bucket.rate, 3) for host, bucket in self.buckets.items()}
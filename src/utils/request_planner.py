@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+from src.utils.logger import Logger
+
+T = TypeVar('T')
+
+class RequestPlanner:
+    def __init__(self):
+        self.logger = Logger()
+        self.tasks: Dict[Hashable, asyncio.Future] = {}
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed request counters"""
+        return {'requested': 0, 'executed': 0, 'saved': 0}
+
+    def begin_cycle(self):
+        """Forget the previous cycle's requests so pages are fetched again"""
+        self.tasks = {}
+        self.stats = self._empty_stats()
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run a request once per cycle, sharing its result with every caller using the same key"""
+        self.stats['requested'] += 1
+        task = self.tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self.tasks[key] = task
+            self.stats['executed'] += 1
+        else:
+            self.stats['saved'] += 1
+
+        # Shield the shared task so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+
+    def log_stats(self):
+        """Log how many requests were planned, executed and saved this cycle"""
+        self.logger.info(
+            f"Request planner: {self.stats['requested']} page requests, "
+            f"{self.stats['executed']} executed, {self.stats['saved']} saved by deduplication"
+        )
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+class ResponseCache:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.cache_dir = config.get('cache', 'http_cache_dir', os.path.join('data', 'cache', 'http'))
+        self.max_bytes = config.get('cache', 'http_cache_max_mb', 100) * 1024 * 1024
+        self.index_file = os.path.join(self.cache_dir, 'index.json')
+        self.entries: 'OrderedDict[str, dict]' = OrderedDict()
+        self.total_bytes = 0
+        self.stats = self._empty_stats()
+        self._load_index()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed cache counters"""
+        return {'fresh_hits': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+    def _load_index(self):
+        """Load the cache index, dropping entries whose body file is missing"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if not os.path.exists(self.index_file):
+            return
+
+        try:
+            with open(self.index_file, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable HTTP cache index: {str(e)}")
+            return
+
+        # The index is saved least recently used first
+        for url, entry in entries:
+            if os.path.exists(self._body_path(url)):
+                self.entries[url] = entry
+                self.total_bytes += entry['size']
+
+    def _body_path(self, url: str) -> str:
+        """Path of the file holding a cached response body"""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+    def get(self, url: str) -> Optional[dict]:
+        """Get the cache entry for a URL and mark it as recently used"""
+        entry = self.entries.get(url)
+        if entry:
+            self.entries.move_to_end(url)
+        return entry
+
+    def is_fresh(self, entry: dict, ttl: float) -> bool:
+        """Check if an entry can be served without asking the server"""
+        return ttl > 0 and time.time() - entry['validated_at'] < ttl
+
+    def conditional_headers(self, entry: dict) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for an entry"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read(self, url: str, revalidated: bool = False, headers=None) -> Optional[str]:
+        """Read a cached body; after a 304, refresh its validation time and the validators the 304 sent"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None  # evicted while the request was in flight
+        try:
+            with open(self._body_path(url), 'r', encoding='utf-8') as f:
+                body = f.read()
+        except OSError:
+            self.remove(url)
+            return None
+
+        if revalidated:
+            entry['validated_at'] = time.time()
+            if headers:
+                entry['etag'] = headers.get('ETag') or entry['etag']
+                entry['last_modified'] = headers.get('Last-Modified') or entry['last_modified']
+            self.stats['revalidated'] += 1
+        else:
+            self.stats['fresh_hits'] += 1
+        return body
+
+    def store(self, url: str, body: str, headers, ttl: float = 0):
+        """Store a response body if it can be reused by a later request"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not (etag or last_modified or ttl > 0):
+            return
+
+        data = body.encode('utf-8')
+        try:
+            with open(self._body_path(url), 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            self.logger.warning(f"Could not cache response for {url}: {str(e)}")
+            return
+
+        self.remove(url, delete_file=False)
+        self.entries[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'validated_at': time.time(),
+            'size': len(data)
+        }
+        self.total_bytes += len(data)
+        self.stats['stored'] += 1
+        self._evict()
+
+    def remove(self, url: str, delete_file: bool = True):
+        """Drop an entry and optionally its body file"""
+        entry = self.entries.pop(url, None)
+        if not entry:
+            return
+        self.total_bytes -= entry['size']
+        if delete_file:
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Evict least recently used entries until the cache fits its size limit"""
+        while self.total_bytes > self.max_bytes and self.entries:
+            url = next(iter(self.entries))
+            self.remove(url)
+            self.stats['evicted'] += 1
+
+    def save(self):
+        """Persist the cache index"""
+        try:
+            with open(self.index_file, 'w') as f:
+                json.dump(list(self.entries.items()), f)
+        except OSError as e:
+            self.logger.warning(f"Could not save HTTP cache index: {str(e)}")
+
+    def log_stats(self):
+        """Log and reset cache counters"""
+        stats, self.stats = self.stats, self._empty_stats()
+        self.logger.info(
+            f"HTTP cache: {stats['fresh_hits']} served fresh, "
+            f"{stats['revalidated']} revalidated (304), {stats['stored']} stored, "
+            f"{stats['evicted']} evicted, {self.total_bytes // 1024} KB on disk"
+        )
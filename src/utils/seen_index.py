@@ -0,0 +1,126 @@
+import hashlib
+import os
+import re
+import struct
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+from src.models.job import Job
+from src.utils.config import Config
+from src.utils.logger import Logger
+from src.utils.url_utils import canonical_url
+
+# File layout: header, then every key as a uint64, then each key's last-seen time as a uint32
+_MAGIC = b'SEEN'
+_HEADER = struct.Struct('<4sI')
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+class SeenIndex:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.index_file = config.get('cache', 'seen_jobs_file', os.path.join('data', 'cache', 'seen_jobs.bin'))
+        self.max_age = config.get('cache', 'seen_jobs_max_age_days', 14) * 24 * 3600
+        self.entries: Dict[int, int] = {}  # 64-bit key hash -> last seen (epoch seconds)
+        self.pending: Dict[int, int] = {}  # keys of the current cycle, recorded by commit()
+        self.stats = self._empty_stats()
+        self._load()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed job counters"""
+        return {'new': 0, 'seen': 0}
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """Hash a key to 64 bits"""
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    @staticmethod
+    def fingerprint(job: Job) -> str:
+        """Normalize title, company and location so a posting syndicated to several boards compares equal"""
+        title = _NON_WORD.sub(' ', job.title.lower()).strip()
+        company = _NON_WORD.sub(' ', job.company.lower()).strip()
+        location = _NON_WORD.sub(' ', (job.location or '').lower()).strip()
+        return f"{title}|{company}|{location}"
+
+    def link_key(self, job: Job) -> Optional[int]:
+        """Hashed canonical link of a job, if it has one"""
+        return self._hash('u:' + canonical_url(job.link)) if job.link else None
+
+    def keys(self, job: Job) -> List[int]:
+        """Hashed keys a job is known by: its canonical link and its title/company/location fingerprint"""
+        keys = [self._hash('t:' + self.fingerprint(job))]
+        link_key = self.link_key(job)
+        if link_key is not None:
+            keys.append(link_key)
+        return keys
+
+    def _load(self):
+        """Load the keys saved by earlier runs"""
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'rb') as f:
+                magic, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC:
+                    raise ValueError("not a seen job index")
+                keys, seen_at = array('Q'), array('I')
+                keys.fromfile(f, count)
+                seen_at.fromfile(f, count)
+            self.entries = dict(zip(keys, seen_at))
+        except (OSError, ValueError, EOFError, struct.error) as e:
+            self.logger.warning(f"Ignoring unreadable seen job index: {str(e)}")
+            self.entries = {}
+
+    def filter_new(self, jobs: Iterable[Job]) -> List[Job]:
+        """Keep the jobs never seen before, in order; the first of several duplicates wins
+
+        Nothing is remembered until commit(), so jobs whose save fails are offered again next cycle.
+        """
+        now = int(time.time())
+        cutoff = now - self.max_age
+        self.pending = {}
+        new_jobs = []
+        for job in jobs:
+            keys = self.keys(job)
+            if any(key in self.pending or self.entries.get(key, 0) >= cutoff for key in keys):
+                self.stats['seen'] += 1
+                # Only a saved posting's own link is refreshed, so it is never saved twice while listed;
+                # fingerprints expire, letting a later posting of the same role through
+                link_key = self.link_key(job)
+                if link_key is not None and self.entries.get(link_key, 0) >= cutoff:
+                    self.pending[link_key] = now
+            else:
+                self.stats['new'] += 1
+                new_jobs.append(job)
+                for key in keys:
+                    self.pending[key] = now
+        return new_jobs
+
+    def commit(self):
+        """Remember the jobs of the last filter_new() call, once they are saved, and persist the index"""
+        self.entries.update(self.pending)
+        self.pending = {}
+        self.save()
+
+    def save(self):
+        """Drop keys not seen for a while and persist the index"""
+        cutoff = time.time() - self.max_age
+        self.entries = {key: seen_at for key, seen_at in self.entries.items() if seen_at >= cutoff}
+        try:
+            os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+            with open(self.index_file, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, len(self.entries)))
+                array('Q', self.entries.keys()).tofile(f)
+                array('I', self.entries.values()).tofile(f)
+        except OSError as e:
+            self.logger.warning(f"Could not save seen job index: {str(e)}")
+
+    def log_stats(self):
+        """Log and reset job counters"""
+        stats, self.stats = self.stats, self._empty_stats()
+        self.logger.info(
+            f"Seen job index: {stats['new']} new, {stats['seen']} already seen, {len(self.entries)} keys kept"
+        )
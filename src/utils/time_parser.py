@@ -0,0 +1,114 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+from src.utils.logger import Logger
+
+TimeValue = Union[str, int, float, None]
+
+_UNIT_DELTAS = {
+    'second': timedelta(seconds=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365)
+}
+
+_UNIT_ALIASES = {
+    's': 'second', 'sec': 'second', 'secs': 'second', 'second': 'second', 'seconds': 'second',
+    'm': 'minute', 'min': 'minute', 'mins': 'minute', 'minute': 'minute', 'minutes': 'minute',
+    'h': 'hour', 'hr': 'hour', 'hrs': 'hour', 'hour': 'hour', 'hours': 'hour',
+    'd': 'day', 'day': 'day', 'days': 'day',
+    'w': 'week', 'wk': 'week', 'wks': 'week', 'week': 'week', 'weeks': 'week',
+    'mo': 'month', 'month': 'month', 'months': 'month',
+    'y': 'year', 'yr': 'year', 'yrs': 'year', 'year': 'year', 'years': 'year'
+}
+
+# "3 hours ago", "Posted 2d ago", "30+ days ago", "an hour ago"
+_RELATIVE = re.compile(
+    r'\b(\d+|an?|one)\s*\+?\s*(' + '|'.join(sorted(_UNIT_ALIASES, key=len, reverse=True)) + r')\b'
+)
+_NOW = re.compile(r'\b(just now|now|moments? ago|few seconds ago|today|just posted)\b')
+_YESTERDAY = re.compile(r'\byesterday\b')
+_EPOCH = re.compile(r'^\d{10}(\d{3})?(\.\d+)?$')
+_ISO = re.compile(r'^\d{4}-\d{2}-\d{2}([ t]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?(z|[+-]\d{2}:?\d{2})?$')
+
+_ABSOLUTE_FORMATS = ('%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y', '%m/%d/%Y')
+
+def _to_local_naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive local time, like datetime.now()"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+def _from_epoch(value: float) -> datetime:
+    """Convert epoch seconds or milliseconds to naive local time"""
+    if value > 1e11:
+        value /= 1000
+    return datetime.fromtimestamp(value)
+
+@lru_cache(maxsize=4096)
+def _parse_text(text: str) -> Tuple[Optional[timedelta], Optional[datetime]]:
+    """Parse a time string into (age, None) for relative values or (None, datetime) for absolute ones"""
+    text = text.strip().lower()
+    if not text:
+        return None, None
+
+    # Well-formed values can still name impossible dates (2024-02-30) or overflow; those count as unknown
+    if _EPOCH.match(text):
+        try:
+            return None, _from_epoch(float(text))
+        except (ValueError, OverflowError, OSError):
+            Logger().warning(f"Invalid epoch posting time: '{text}'")
+            return None, None
+
+    if _ISO.match(text):
+        try:
+            return None, _to_local_naive(datetime.fromisoformat(text.upper().replace('Z', '+00:00')))
+        except ValueError:
+            Logger().warning(f"Invalid posting date: '{text}'")
+            return None, None
+
+    match = _RELATIVE.search(text)
+    if match:
+        count, unit = match.groups()
+        count = 1 if count in ('a', 'an', 'one') else int(count)
+        return _UNIT_DELTAS[_UNIT_ALIASES[unit]] * count, None
+
+    if _NOW.search(text):
+        return timedelta(0), None
+    if _YESTERDAY.search(text):
+        return timedelta(days=1), None
+
+    for fmt in _ABSOLUTE_FORMATS:
+        try:
+            return None, datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
+    Logger().warning(f"Unrecognized posting time: '{text}'")
+    return None, None
+
+def parse_time(value: TimeValue, now: Optional[datetime] = None) -> datetime:
+    """Parse a relative ('3 hours ago'), ISO or epoch time into naive local time; unknown values give now"""
+    now = now or datetime.now()
+    if value is None:
+        return now
+    if isinstance(value, (int, float)):
+        try:
+            return _from_epoch(value) if value > 0 else now
+        except (ValueError, OverflowError, OSError):
+            return now
+
+    age, absolute = _parse_text(value)
+    if absolute is not None:
+        return absolute
+    if age is not None:
+        return now - age
+    return now
+
+def cache_info():
+    """Hit/miss statistics of the parsed-string cache"""
+    return _parse_text.cache_info()
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from src.utils.config import Config
+from src.utils.logger import Logger
+
+# Best score of a title and the target title that produced it (None when nothing scored)
+TitleMatch = Tuple[float, Optional[str]]
+
+class TitleMatchCache:
+    def __init__(self):
+        self.logger = Logger()
+        config = Config()
+        self.cache_file = config.get(
+            'cache', 'title_match_file', os.path.join('data', 'cache', 'title_matches.json')
+        )
+        self.max_entries = config.get('cache', 'title_match_max_entries', 50000)
+        self.fingerprint: Optional[str] = None
+        self.entries: 'OrderedDict[str, TitleMatch]' = OrderedDict()
+        self.stats = self._empty_stats()
+        self._load()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Create zeroed lookup counters"""
+        return {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def make_fingerprint(target_titles: List[str], threshold: int) -> str:
+        """Identify a target title set and threshold; cached scores are only valid for the same one"""
+        key = json.dumps([sorted(target_titles), threshold])
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _load(self):
+        """Load title scores saved by an earlier run"""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            self.fingerprint = data['fingerprint']
+            self.entries = OrderedDict((title, tuple(match)) for title, match in data['entries'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable title match cache: {str(e)}")
+            self.fingerprint = None
+            self.entries = OrderedDict()
+
+    def bind(self, target_titles: List[str], threshold: int):
+        """Use the cache for a target set, dropping scores computed for a different one"""
+        fingerprint = self.make_fingerprint(target_titles, threshold)
+        if fingerprint != self.fingerprint:
+            self.entries.clear()
+            self.fingerprint = fingerprint
+
+    def get(self, title: str) -> Optional[TitleMatch]:
+        """Look up a normalized title, marking it recently used"""
+        match = self.entries.get(title)
+        if match is None:
+            self.stats['misses'] += 1
+            return None
+        self.entries.move_to_end(title)
+        self.stats['hits'] += 1
+        return match
+
+    def put(self, title: str, match: TitleMatch):
+        """Remember a title's best match, evicting the least recently used beyond the size limit"""
+        self.entries[title] = match
+        self.entries.move_to_end(title)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from the cache since the last reset"""
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0.0
+
+    def save(self):
+        """Persist the cache so a restart starts warm"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            with open(self.cache_file, 'w') as f:
+                json.dump({
+                    'fingerprint': self.fingerprint,
+                    'entries': [[title, list(match)] for title, match in self.entries.items()]
+                }, f)
+        except OSError as e:
+            self.logger.warning(f"Could not save title match cache: {str(e)}")
+
+    def log_stats(self):
+        """Log and reset lookup counters"""
+        ratio = self.hit_ratio()
+        stats, self.stats = self.stats, self._empty_stats()
+        self.logger.info(
+            f"Title match cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({ratio:.0%} hit ratio), {len(self.entries)} titles cached"
+        )
@@ -0,0 +1,17 @@
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track how a link was reached
+_TRACKING_PARAMS = re.compile(r'^(utm_.*|ref|refid|referer|referrer|src|source|from|tk|trk|trackingid|gclid|fbclid)$', re.I)
+
+def canonical_url(url: str) -> str:
+    """Normalize a job link so the same posting reached through different links compares equal"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAMS.match(key)
+    )
+    return urlunsplit(('', host, parts.path.rstrip('/'), urlencode(query), ''))
@@ -0,0 +1,22 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.config import Config
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run every test in an empty directory with default settings, so data files never leak between tests"""
+    monkeypatch.chdir(tmp_path)
+    Config._instance = None
+    yield tmp_path
+    Config._instance = None
+
+
+@pytest.fixture
+def settings():
+    """Settings of a fresh Config singleton for a test to override, e.g. settings['archive'] = {'enabled': True}"""
+    return Config().settings
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Tuple
+from aiohttp import web
+from src.models.job import Job
+from src.scrapers.spec_scraper import SourceSpec, SpecScraper
+
+CARD = (
+    '<div class="card"><h5 class="card-title">{title}</h5><div class="company-name">Acme</div>'
+    '<div class="location">Remote, US</div><div class="posted-date">{posted}</div>'
+    '<a class="card-link" href="https://example.com/jobs/{index}">apply</a></div>'
+)
+
+
+def search_page(count: int = 3, posted: str = '10 minutes ago', title: str = 'Software Engineer {index}') -> str:
+    """A search results page in the markup of the Dice source spec"""
+    cards = ''.join(
+        CARD.format(title=title.format(index=index), posted=posted, index=index) for index in range(count)
+    )
+    return f'<html><body><nav>menu</nav><div class="results">{cards}</div><footer>footer</footer></body></html>'
+
+
+def make_job(title: str = 'Software Engineer', company: str = 'Acme', link: str = 'https://example.com/jobs/1',
+             source: str = 'Dice', location: str = 'Remote', posted_time: datetime = None, **fields) -> Job:
+    return Job(title, company, link, posted_time or datetime.now(), source, location, **fields)
+
+
+# Field selectors matching CARD
+CARD_FIELDS = {
+    'title': 'h5.card-title',
+    'company': 'div.company-name',
+    'location': 'div.location',
+    'posted_time': 'div.posted-date',
+    'link': 'a.card-link'
+}
+
+
+def make_scraper(base_url: str, **spec) -> SpecScraper:
+    """A scraper for a test source with short delays, searching base_url/jobs; spec entries override the defaults"""
+    spec = SourceSpec.from_dict({
+        'name': 'Test',
+        'search_url': base_url + '/jobs?q={query}',
+        'card': 'div.card',
+        'fields': {name: 'div.' + name for name in ('title', 'company', 'location', 'posted_time', 'link')},
+        **spec
+    })
+    scraper = SpecScraper(spec)
+    scraper.rate_limit_delay = 0.001
+    scraper.retry_delay = 0.001
+    return scraper
+
+
+async def serve(handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+                port: int = 0) -> Tuple[web.AppRunner, str]:
+    """Serve a handler on the given local port, or a free one; returns the runner and base URL"""
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', port, reuse_address=True)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}'
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
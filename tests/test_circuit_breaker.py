@@ -0,0 +1,107 @@
+import asyncio
+import time
+from aiohttp import web
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from tests.helpers import make_scraper, serve, run
+
+
+def test_breaker_opens_after_threshold_and_half_opens_once():
+    breaker = CircuitBreaker('host:x', failure_threshold=2, reset_timeout=60, max_reset_timeout=600)
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.ready()
+
+    breaker.opened_at = time.monotonic() - 61
+    assert breaker.ready()
+    breaker.begin()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.ready()  # only one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.ready()
+
+
+def test_release_lets_a_new_probe_through():
+    breaker = CircuitBreaker('host:x', failure_threshold=1, reset_timeout=0, max_reset_timeout=0)
+    breaker.record_failure()
+    breaker.begin()
+    assert not breaker.ready()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.ready()
+
+
+def test_cancelled_probe_does_not_wedge_the_breaker():
+    async def slow(request):
+        await asyncio.sleep(5)
+        return web.Response(text='late')
+
+    async def scenario():
+        runner, base_url = await serve(slow)
+        scraper = make_scraper(base_url)
+        try:
+            await scraper._init_session()
+            url = base_url + '/jobs?q=x'
+            breakers = scraper._breakers(url)
+            for breaker in breakers:
+                breaker.state, breaker.opened_at, breaker.trips = CircuitBreaker.OPEN, 0.0, 1
+            task = asyncio.create_task(scraper.fetch_page(url))
+            await asyncio.sleep(0.2)
+            assert all(breaker.probe_in_flight for breaker in breakers)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return breakers
+        finally:
+            await scraper.http_client.close()
+            await runner.cleanup()
+
+    breakers = run(scenario())
+    assert not any(breaker.probe_in_flight for breaker in breakers)
+    assert all(breaker.ready() for breaker in breakers)
+
+
+def test_client_errors_do_not_count_as_failures(settings):
+    settings['circuit_breaker'] = {'failure_threshold': 2}
+
+    async def not_found(request):
+        return web.Response(status=404)
+
+    async def scenario():
+        runner, base_url = await serve(not_found)
+        scraper = make_scraper(base_url)
+        try:
+            for _ in range(5):
+                assert await scraper.fetch_page(base_url + '/jobs?q=x') is None
+            return scraper.http_client.breakers
+        finally:
+            await scraper.http_client.close()
+            await runner.cleanup()
+
+    registry = run(scenario())
+    assert registry.states() == {}
+    assert all(breaker.failures == 0 for breaker in registry.breakers.values())
+
+
+def test_server_errors_open_the_breaker(settings):
+    settings['circuit_breaker'] = {'failure_threshold': 2}
+
+    async def broken(request):
+        return web.Response(status=503)
+
+    async def scenario():
+        runner, base_url = await serve(broken)
+        scraper = make_scraper(base_url)
+        try:
+            await scraper.fetch_page(base_url + '/jobs?q=x')
+            return scraper.http_client.breakers
+        finally:
+            await scraper.http_client.close()
+            await runner.cleanup()
+
+    assert CircuitBreaker.OPEN in run(scenario()).states().values()
+
+
+def test_registry_allows_only_when_every_breaker_is_ready():
+    registry = CircuitBreakerRegistry()
+    source, host = registry.get('source:a'), registry.get('host:b')
+    host.state, host.opened_at = CircuitBreaker.OPEN, time.monotonic()
+    assert not registry.allow([source, host])
+    assert not source.probe_in_flight
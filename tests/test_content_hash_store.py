@@ -0,0 +1,51 @@
+from aiohttp import web
+from src.utils.content_hash_store import ContentHashStore
+from tests.helpers import make_job, make_scraper, serve, run
+
+
+def test_returns_the_previous_jobs_only_for_an_unchanged_page():
+    store = ContentHashStore()
+    jobs = [make_job(match_score=90.0, sources=('Dice', 'BuiltIn'))]
+    store.store('Dice', 'https://example.com/jobs', store.digest('<html>v1</html>'), jobs)
+    assert store.lookup('Dice', 'https://example.com/jobs', store.digest('<html>v1</html>')) == jobs
+    assert store.lookup('Dice', 'https://example.com/jobs', store.digest('<html>v2</html>')) is None
+    assert store.lookup('BuiltIn', 'https://example.com/jobs', store.digest('<html>v1</html>')) is None
+
+
+def test_survives_a_restart():
+    store = ContentHashStore()
+    store.store('Dice', 'https://example.com/jobs', store.digest('page'), [make_job()])
+    store.save()
+    jobs = ContentHashStore().lookup('Dice', 'https://example.com/jobs', store.digest('page'))
+    assert [(job.title, job.link) for job in jobs] == [('Software Engineer', 'https://example.com/jobs/1')]
+
+
+def test_unchanged_page_is_not_parsed_again(monkeypatch):
+    page = (
+        '<div class="card"><div class="title">Engineer</div><div class="company">Acme</div>'
+        '<div class="location">Remote</div><div class="posted_time">5 minutes ago</div>'
+        '<div class="link" href="https://example.com/1">apply</div></div>'
+    )
+
+    async def handler(request):
+        return web.Response(text=page, content_type='text/html')
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        scraper = make_scraper(base_url)
+        scraper.content_hashes = ContentHashStore()
+        parses = []
+        parse_rows = scraper._parse_rows
+        monkeypatch.setattr(scraper, '_parse_rows', lambda html, context: parses.append(1) or parse_rows(html, context))
+        try:
+            first = await scraper.scrape_page(base_url + '/jobs')
+            second = await scraper.scrape_page(base_url + '/jobs')
+        finally:
+            await scraper._close_session()
+            await runner.cleanup()
+        return first, second, len(parses), scraper.content_hashes.stats
+
+    first, second, parses, stats = run(scenario())
+    assert len(first) == 1 and second == first
+    assert parses == 1
+    assert stats == {'unchanged': 1, 'parsed': 1}
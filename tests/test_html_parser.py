@@ -0,0 +1,13 @@
+import pytest
+from src.utils.html_parser import PARSER_BACKENDS, _available, make_soup
+
+HTML = '<div class="card"><div class="card">inner</div><p class="x">first</p><p class="x">second</p></div>'
+
+
+@pytest.mark.parametrize('backend', [backend for backend in PARSER_BACKENDS if _available(backend)])
+def test_find_returns_the_first_descendant_like_beautifulsoup(backend):
+    card = make_soup(HTML, backend).find('div', class_='card')
+    assert card.find('p', class_='x').text == 'first'
+    assert card.find('div', class_='card').text == 'inner'  # never the element itself
+    assert card.find('span') is None
+    assert [element.text for element in card.find_all('p')] == ['first', 'second']
@@ -0,0 +1,90 @@
+import dataclasses
+import pytest
+from aiohttp import web
+from src.scrapers.spec_scraper import SpecScraper, load_source_specs
+from src.utils.html_stream import CardStreamParser
+from tests.helpers import CARD, search_page, serve, run
+
+FIELDS = {
+    'title': ('h5', 'card-title'),
+    'company': ('div', 'company-name'),
+    'location': ('div', 'location'),
+    'posted_time': ('div', 'posted-date'),
+    'link': ('a', 'card-link')
+}
+
+
+def wrapped_page(count: int) -> str:
+    """A results list where every card sits in its own list item"""
+    items = ''.join(
+        '<li>' + CARD.format(title=f'Software Engineer {index}', posted='10 minutes ago', index=index) + '</li>'
+        for index in range(count)
+    )
+    return f'<html><body><ul class="results">{items}</ul><footer>footer</footer></body></html>'
+
+
+def parse(html: str, chunk_size: int = 7, **kwargs) -> CardStreamParser:
+    parser = CardStreamParser(('div', 'card'), FIELDS, attrs={'link': 'href'}, **kwargs)
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+    parser.close()
+    return parser
+
+
+def test_reads_every_wrapped_card_without_a_list_selector():
+    parser = parse(wrapped_page(5))
+    assert [card['title'] for card in parser.cards] == [f'Software Engineer {index}' for index in range(5)]
+    assert not parser.done
+
+
+def test_reads_every_wrapped_card_inside_the_list():
+    parser = parse(wrapped_page(5), card_list=('ul', 'results'))
+    assert len(parser.cards) == 5
+    assert parser.done
+
+
+def test_stops_when_the_list_closes():
+    html = search_page(2) + CARD.format(title='After the list', posted='now', index=9)
+    parser = parse(html, card_list=('div', 'results'))
+    assert [card['link'] for card in parser.cards] == ['https://example.com/jobs/0', 'https://example.com/jobs/1']
+    assert parser.done
+
+
+def test_extracts_attributes_and_text():
+    parser = parse(search_page(1))
+    assert parser.cards == [{
+        'title': 'Software Engineer 0',
+        'company': 'Acme',
+        'location': 'Remote, US',
+        'posted_time': '10 minutes ago',
+        'link': 'https://example.com/jobs/0'
+    }]
+
+
+@pytest.fixture
+def dice(request):
+    specs = load_source_specs(str(request.config.rootpath / 'config/sources.yaml'))
+    spec = next(spec for spec in specs if spec.name == 'Dice')
+    scraper = SpecScraper(spec)
+    scraper.rate_limit_delay = 0.001
+    scraper.stream_chunk_size = 64
+    return scraper
+
+
+@pytest.mark.parametrize('page', [search_page(5), wrapped_page(5)])
+def test_streamed_and_buffered_pages_give_the_same_jobs(dice, page):
+    async def handler(request):
+        return web.Response(text=page, content_type='text/html')
+
+    async def scenario(stream):
+        runner, base_url = await serve(handler)
+        dice.stream = stream
+        try:
+            return await dice.scrape_page(base_url + '/jobs')
+        finally:
+            await dice._close_session()
+            await runner.cleanup()
+
+    streamed, buffered = run(scenario(True)), run(scenario(False))
+    assert len(streamed) == 5
+    assert [(job.title, job.link) for job in streamed] == [(job.title, job.link) for job in buffered]
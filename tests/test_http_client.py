@@ -0,0 +1,35 @@
+import asyncio
+from aiohttp import web
+from src.utils.http_client import HttpClient
+from tests.helpers import serve, run
+
+
+def test_client_can_be_restarted_on_a_new_event_loop(settings):
+    settings['http'] = {'max_requests_per_host': 1}
+    settings['rate_limit'] = {'initial_rate': 100, 'max_rate': 100, 'burst': 10}
+    client = HttpClient()
+    ports = []
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return web.Response(text='ok')
+
+    async def cycle():
+        # The same host on both loops, so the second loop meets the first loop's host slot
+        runner, base_url = await serve(handler, *ports[:1])
+        ports.append(int(base_url.rsplit(':', 1)[1]))
+
+        async def fetch():
+            async with client.request('GET', base_url + '/jobs') as response:
+                return await response.text()
+
+        try:
+            # Two requests to one host contend for its only slot
+            return await asyncio.gather(fetch(), fetch())
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    # Each scraping thread runs its own loop, as after a Stop and Start in the GUI
+    assert run(cycle()) == ['ok', 'ok']
+    assert run(cycle()) == ['ok', 'ok']
@@ -0,0 +1,124 @@
+import os
+from datetime import date, datetime, timedelta
+import pytest
+from tests.helpers import make_job
+
+pytest.importorskip('pyarrow')
+from src.utils import job_archive
+from src.utils.job_archive import JobArchive
+
+POSTED = datetime(2026, 3, 2, 12, 0)
+
+
+@pytest.fixture
+def archive(tmp_path, settings):
+    settings['archive'] = {'dir': str(tmp_path / 'archive')}
+    return JobArchive()
+
+
+def saved_on(monkeypatch, day: date):
+    """Make the archive believe today is the given day"""
+    class Today(date):
+        @classmethod
+        def today(cls):
+            return day
+    monkeypatch.setattr(job_archive, 'date', Today)
+
+
+def parquet_files(archive):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), archive.archive_dir)
+        for directory, _, names in os.walk(archive.archive_dir)
+        for name in names if name.endswith('.parquet') and not name.startswith('.')
+    )
+
+
+def test_query_filters_by_posting_time_and_source(archive):
+    archive.append([
+        make_job(link='https://example.com/1', posted_time=POSTED),
+        make_job(link='https://example.com/2', posted_time=POSTED + timedelta(hours=2)),
+        make_job(link='https://example.com/3', posted_time=POSTED, source='BuiltIn')
+    ])
+    frame = archive.query(start=POSTED, end=POSTED + timedelta(hours=1), sources=['Dice'], columns=['link', 'source'])
+    assert list(frame.columns) == ['link', 'source']
+    assert frame['link'].tolist() == ['https://example.com/1']
+
+
+def test_partitions_by_saved_date_not_posting_date(archive, monkeypatch):
+    saved_on(monkeypatch, date(2026, 3, 5))
+    archive.append([make_job(posted_time=POSTED - timedelta(days=30))])
+    assert all(path.startswith('saved_date=2026-03-05') for path in parquet_files(archive))
+
+
+def test_append_can_backfill_an_earlier_saved_date(archive):
+    archive.append([make_job(posted_time=POSTED)], saved=date(2026, 3, 2))
+    assert all(path.startswith('saved_date=2026-03-02') for path in parquet_files(archive))
+
+
+def test_query_skips_partitions_outside_the_filters(archive, monkeypatch):
+    saved_on(monkeypatch, date(2026, 3, 1))
+    archive.append([make_job(link='https://example.com/old', posted_time=POSTED - timedelta(days=1))])
+    saved_on(monkeypatch, date(2026, 3, 2))
+    archive.append([make_job(link='https://example.com/new', posted_time=POSTED)])
+    archive.append([make_job(link='https://example.com/other', posted_time=POSTED, source='BuiltIn')])
+
+    # Unreadable files in partitions the filters rule out are never opened
+    for path in parquet_files(archive):
+        if 'saved_date=2026-03-01' in path or 'source=BuiltIn' in path:
+            with open(os.path.join(archive.archive_dir, path), 'wb') as f:
+                f.write(b'not parquet')
+
+    frame = archive.query(start=datetime(2026, 3, 2), sources=['Dice'])
+    assert frame['link'].tolist() == ['https://example.com/new']
+
+
+def test_compacts_each_finished_day_once(archive, monkeypatch):
+    saved_on(monkeypatch, date(2026, 3, 1))
+    archive.append([make_job(link='https://example.com/1', posted_time=POSTED)])
+    archive.append([make_job(link='https://example.com/2', posted_time=POSTED)])
+    saved_on(monkeypatch, date(2026, 3, 2))
+    archive.append([make_job(link='https://example.com/3', posted_time=POSTED)])
+    archive.append([make_job(link='https://example.com/4', posted_time=POSTED)])
+
+    assert archive.compact() == 2
+    assert archive.compact() == 0
+    files = parquet_files(archive)
+    assert len([path for path in files if 'saved_date=2026-03-01' in path]) == 1
+    assert len([path for path in files if 'saved_date=2026-03-02' in path]) == 2
+    assert sorted(archive.query()['link']) == [f'https://example.com/{index}' for index in range(1, 5)]
+
+
+def test_crash_after_the_rename_leaves_no_duplicates(archive, monkeypatch):
+    saved_on(monkeypatch, date(2026, 3, 1))
+    archive.append([make_job(link='https://example.com/1', posted_time=POSTED)])
+    archive.append([make_job(link='https://example.com/2', posted_time=POSTED)])
+    saved_on(monkeypatch, date(2026, 3, 2))
+
+    def crash(self, directory):
+        raise RuntimeError('crash')
+
+    monkeypatch.setattr(JobArchive, '_recover_directory', crash)
+    with pytest.raises(RuntimeError):
+        archive.compact()
+    monkeypatch.undo()
+    assert len(parquet_files(archive)) == 3  # merged output beside both inputs
+
+    recovered = JobArchive()
+    assert len(parquet_files(recovered)) == 1
+    assert sorted(recovered.query()['link']) == ['https://example.com/1', 'https://example.com/2']
+
+
+def test_failed_compaction_keeps_the_inputs(archive, monkeypatch):
+    saved_on(monkeypatch, date(2026, 3, 1))
+    archive.append([make_job(link='https://example.com/1', posted_time=POSTED)])
+    archive.append([make_job(link='https://example.com/2', posted_time=POSTED)])
+    saved_on(monkeypatch, date(2026, 3, 2))
+
+    def fail(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(job_archive.os, 'replace', fail)
+    assert archive.compact() == 0
+    monkeypatch.undo()
+    assert len(parquet_files(archive)) == 2
+    assert not [name for _, _, names in os.walk(archive.archive_dir) for name in names if name.startswith('.')]
@@ -0,0 +1,22 @@
+import pickle
+from datetime import datetime
+from src.models.job_batch import JobBatch
+from tests.helpers import make_job
+
+POSTED = datetime(2026, 3, 1, 9, 30)
+
+
+def jobs():
+    return [
+        make_job(title='Senior Python Developer', link='https://example.com/1', posted_time=POSTED),
+        make_job(title='Line Cook', company='Diner', link='https://example.com/2', location=None, posted_time=POSTED),
+        make_job(title='Backend Engineer', link='https://example.com/3', is_remote=True,
+                 match_score=91.0, matched_title='backend engineer', posted_time=POSTED)
+    ]
+
+
+def test_rows_round_trip():
+    batch = JobBatch(jobs())
+    assert len(batch) == 3
+    assert list(batch) == jobs()
+    assert list(pickle.loads(pickle.dumps(batch))) == jobs()
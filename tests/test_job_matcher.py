@@ -0,0 +1,89 @@
+import random
+import pytest
+from fuzzywuzzy import fuzz
+from src.utils import job_matcher
+from src.utils.job_matcher import JobMatcher
+from src.utils.title_match_cache import TitleMatchCache
+from tests.helpers import make_job
+
+TARGETS = ['Software Engineer', 'Data Scientist', 'Python Developer', 'Product Manager', 'DevOps Engineer']
+
+WORDS = [
+    'senior', 'sr.', 'staff', 'lead', 'software', 'engineer', 'engineering', 'backend', 'frontend', 'full', 'stack',
+    'data', 'scientist', 'science', 'python', 'developer', 'manager', 'product', 'designer', 'devops', 'ii', 'iii',
+    'platform', 'ml', 'cook', 'nurse', 'sales', 'remote', '-', '(contract)', 'softwar', 'enginer'
+]
+
+
+def titles(count: int = 300):
+    rng = random.Random(7)
+    fixed = ['Software Engineer', 'Senior Software Engineer II', 'Sr. Python Dev', 'Line Cook', 'Engineer', 'SWE',
+             'Data', 'Product Manager - Payments', 'Devops Engineer (Remote)', 'Softwre Enginer', '']
+    return fixed + [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))) for _ in range(count)]
+
+
+def baseline_quality(targets, job_title):
+    """Best score of a title as the original per-pair matcher computed it"""
+    job_title = job_title.lower()
+    best = 0
+    for target in (title.lower() for title in targets):
+        if target in job_title or job_title in target:
+            return 100.0
+        best = max(best, fuzz.ratio(target, job_title), fuzz.partial_ratio(target, job_title))
+    return best
+
+
+@pytest.fixture(params=['rapidfuzz', 'character bounds'])
+def matcher(request, monkeypatch):
+    if request.param == 'character bounds':
+        monkeypatch.setattr(job_matcher, 'cdist', None)
+    elif job_matcher.cdist is None:
+        pytest.skip('rapidfuzz is not installed')
+    return JobMatcher(TARGETS)
+
+
+def test_bounds_never_fall_below_the_exact_score(matcher):
+    sample = titles()
+    for title, row in zip(sample, matcher.bound_matrix(sample)):
+        normalized = matcher.normalize(title)
+        for target, bound in zip(matcher.target_titles, row):
+            assert bound >= matcher._score(target, normalized), (title, target)
+
+
+def test_scores_match_fuzzywuzzy(matcher):
+    sample = titles()
+    expected = [baseline_quality(TARGETS, ' '.join(title.split())) for title in sample]
+    assert matcher.match_qualities(sample) == expected
+
+
+def test_threshold_decisions_match_fuzzywuzzy(matcher):
+    sample = titles()
+    expected = [baseline_quality(TARGETS, ' '.join(title.split())) >= matcher.threshold for title in sample]
+    assert [job.title for job in matcher.filter_jobs([make_job(title=title) for title in sample])] == [
+        title for title, keep in zip(sample, expected) if keep
+    ]
+
+
+def test_top_jobs_are_ranked_and_cut_to_k():
+    matcher = JobMatcher(TARGETS)
+    jobs = [make_job(title=title, link=str(index)) for index, title in enumerate(titles(100))]
+    ranked = matcher.top_jobs(jobs)
+    assert [job.match_score for job in ranked] == sorted((job.match_score for job in ranked), reverse=True)
+    assert all(job.match_score >= matcher.threshold and job.matched_title in matcher.target_titles for job in ranked)
+    assert [job.match_score for job in matcher.top_jobs(jobs, k=5)] == [job.match_score for job in ranked[:5]]
+
+
+def test_cache_serves_repeat_titles_with_the_same_scores():
+    cache = TitleMatchCache()
+    matcher = JobMatcher(TARGETS, cache=cache)
+    sample = titles(50)
+    first = matcher.match_qualities(sample)
+    cache.save()
+
+    reloaded = TitleMatchCache()
+    warm = JobMatcher(TARGETS, cache=reloaded)
+    assert warm.match_qualities(sample) == first
+    assert reloaded.stats['misses'] == 0
+
+    JobMatcher(['Line Cook'], cache=reloaded)
+    assert not reloaded.entries  # scores for other targets are dropped
@@ -0,0 +1,71 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta
+import pytest
+from src.utils.job_store import JobStore
+from tests.helpers import make_job
+
+
+def test_adds_the_sources_column_to_older_databases(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY, canonical_url TEXT NOT NULL UNIQUE, title TEXT NOT NULL, "
+            "company TEXT NOT NULL, link TEXT NOT NULL, posted_time REAL NOT NULL, source TEXT NOT NULL, "
+            "location TEXT, is_remote INTEGER NOT NULL, match_score REAL, matched_title TEXT, saved_at REAL NOT NULL)"
+        )
+    store = JobStore(path)
+    store.save_jobs([make_job(sources=('Dice', 'BuiltIn'))])
+    assert [job.sources for job in store.jobs()] == [('Dice', 'BuiltIn')]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.db'))
+
+
+def test_keeps_jobs_posted_long_ago_for_the_retention_window(store):
+    store.save_jobs([make_job(posted_time=datetime.now() - timedelta(days=3))])
+    assert store.delete_older_than(24) == 0
+    assert len(store.jobs()) == 1
+
+
+def test_deletes_jobs_saved_before_the_retention_window(store, monkeypatch):
+    saved_at = time.time() - 25 * 3600
+    monkeypatch.setattr(time, 'time', lambda: saved_at)
+    store.save_jobs([make_job(link='https://example.com/jobs/old')])
+    monkeypatch.undo()
+    store.save_jobs([make_job(link='https://example.com/jobs/new')])
+    assert store.delete_older_than(24) == 1
+    assert [job.link for job in store.jobs()] == ['https://example.com/jobs/new']
+
+
+def test_upsert_keeps_the_first_posting_time_and_the_newest_details(store):
+    first = datetime(2026, 3, 1, 9, 0)
+    store.save_jobs([make_job(link='https://www.example.com/jobs/1?utm_source=feed', posted_time=first)])
+    store.save_jobs([make_job(title='Staff Engineer', link='https://example.com/jobs/1/',
+                              posted_time=first + timedelta(hours=5), match_score=90.0)])
+    jobs = store.jobs()
+    assert len(jobs) == 1
+    assert jobs[0].posted_time == first
+    assert (jobs[0].title, jobs[0].link, jobs[0].match_score) == ('Staff Engineer', 'https://example.com/jobs/1/', 90.0)
+
+
+def test_latest_jobs_are_those_of_the_last_save(store):
+    store.save_jobs([make_job(link='https://example.com/jobs/1'), make_job(link='https://example.com/jobs/2')])
+    store.save_jobs([make_job(link='https://example.com/jobs/2'), make_job(link='https://example.com/jobs/3')])
+    assert sorted(job.link for job in store.latest_jobs()) == ['https://example.com/jobs/2', 'https://example.com/jobs/3']
+
+
+def test_jobs_are_filtered_and_ranked(store):
+    now = datetime.now()
+    store.save_jobs([
+        make_job(link='https://example.com/jobs/1', posted_time=now - timedelta(hours=3), match_score=95.0),
+        make_job(link='https://example.com/jobs/2', posted_time=now, match_score=85.0),
+        make_job(link='https://example.com/jobs/3', posted_time=now, source='BuiltIn'),
+        make_job(link='https://example.com/jobs/4', posted_time=now - timedelta(hours=1), match_score=95.0)
+    ])
+    assert [job.link[-1] for job in store.jobs()] == ['4', '1', '2', '3']
+    assert [job.link[-1] for job in store.jobs(since=now - timedelta(hours=2))] == ['4', '2', '3']
+    assert [job.link[-1] for job in store.jobs(source='BuiltIn')] == ['3']
+    assert [job.link[-1] for job in store.jobs(limit=2)] == ['4', '1']
@@ -0,0 +1,79 @@
+import json
+import pytest
+from aiohttp import web
+from src.scrapers.simplify_scraper import SimplifyScraper
+from src.scrapers.welcome_to_jungle_scraper import WelcomeToJungleScraper
+from tests.helpers import serve, run
+
+
+def simplify_page(count):
+    return {'data': {'jobs': [
+        {'title': f'Engineer {index}', 'company': {'name': 'Acme'}, 'location': 'Remote',
+         'postedAt': '5 minutes ago', 'applyUrl': f'https://example.com/{index}', 'isRemote': True}
+        for index in range(count)
+    ]}}
+
+
+async def scrape(scraper, base_url, titles=('Engineer',)):
+    scraper.base_url = base_url
+    scraper.rate_limit_delay = 0.001
+    try:
+        return await scraper.scrape_jobs(list(titles))
+    finally:
+        await scraper._close_session()
+
+
+def scrape_with(scraper, handler):
+    async def scenario():
+        runner, base_url = await serve(handler)
+        try:
+            return await scrape(scraper, base_url)
+        finally:
+            await runner.cleanup()
+    return run(scenario())
+
+
+def test_reads_jobs_from_the_api():
+    async def handler(request):
+        return web.json_response(simplify_page(3))
+
+    jobs = scrape_with(SimplifyScraper(), handler)
+    assert [job.title for job in jobs] == ['Engineer 0', 'Engineer 1', 'Engineer 2']
+    assert all(job.company == 'Acme' and job.source == 'Simplify' and job.is_remote for job in jobs)
+
+
+def test_pages_by_offset_until_a_short_page():
+    offsets = []
+
+    async def handler(request):
+        offset = (await request.json())['variables']['offset']
+        offsets.append(offset)
+        return web.json_response(simplify_page(2 if offset < 4 else 1))
+
+    scraper = SimplifyScraper()
+    scraper.page_size = 2
+    jobs = scrape_with(scraper, handler)
+    assert offsets == [0, 2, 4]
+    assert len(jobs) == 5
+    assert scraper.page_stats['stops'] == {'end': 1}
+
+
+UNEXPECTED_BODIES = [[], ['a', 'b'], 'text', 42, None, {'data': []}, {'jobs': {}}]
+
+
+@pytest.mark.parametrize('scraper_class', [SimplifyScraper, WelcomeToJungleScraper])
+@pytest.mark.parametrize('body', UNEXPECTED_BODIES)
+def test_unexpected_bodies_give_no_jobs(scraper_class, body):
+    async def handler(request):
+        return web.Response(text=json.dumps(body), content_type='application/json')
+
+    scraper = scraper_class()
+    assert scrape_with(scraper, handler) == []
+    assert scraper.page_stats['stops'] == {'empty': 1}
+
+
+@pytest.mark.parametrize('body', UNEXPECTED_BODIES)
+def test_linkedin_ignores_unexpected_bodies(body):
+    pytest.importorskip('dotenv')
+    from src.scrapers.linkedin_scraper import LinkedInScraper
+    assert LinkedInScraper()._rows(body) == []
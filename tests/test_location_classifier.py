@@ -0,0 +1,54 @@
+import pytest
+from src.utils.location_classifier import LocationClassifier
+from tests.helpers import make_job
+
+
+@pytest.mark.parametrize('location, expected', [
+    ('Remote', 'remote'),
+    ('Work from home', 'remote'),
+    ('Batumi, Georgia (Remote)', 'remote'),
+    ('Austin, TX', 'us'),
+    ('Portland, OR', 'us'),
+    ('New York, NY', 'us'),
+    ('U.S.', 'us'),
+    ('US', 'us'),
+    ('United States', 'us'),
+    ('Atlanta, Georgia', 'us'),
+    ('Georgia', 'us'),
+    ('Georgia, USA', 'us'),
+    ('Atlanta, GA', 'us'),
+    ('Contact us', None),
+    ('Join us in Berlin', None),
+    ('Tbilisi, Georgia', None),
+    ('Georgia, Europe', None),
+    ('Toronto, Canada', None),
+    ('Toronto, ON, CA', None),
+    ('Toronto, ON', None),
+    ('Bengaluru, IN', None),
+    ('Bengaluru, KA, IN', None),
+    ('San Francisco, CA', 'us'),
+    ('San Francisco, CA, US', 'us'),
+    ('Birmingham, AL', 'us'),
+    ('Seattle, WA or Toronto, ON', 'us'),
+    ('London', None),
+    ('', None),
+    (None, None),
+])
+def test_classifies_locations(location, expected):
+    assert LocationClassifier().classify(location) == expected
+
+
+def test_state_codes_only_count_in_capitals():
+    classifier = LocationClassifier()
+    assert classifier.classify('Carmel, IN') == 'us'
+    assert classifier.classify('Log in or sign up') is None
+
+
+def test_keeps_remote_and_us_jobs():
+    jobs = [
+        make_job(location='Tbilisi, Georgia'),
+        make_job(location='Seattle, WA'),
+        make_job(location='Anywhere'),
+        make_job(location='Berlin', is_remote=True)
+    ]
+    assert [job.location for job in LocationClassifier().valid_jobs(jobs)] == ['Seattle, WA', 'Anywhere', 'Berlin']
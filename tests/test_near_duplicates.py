@@ -0,0 +1,116 @@
+import os
+import struct
+import pytest
+from src.utils.job_store import JobStore
+from src.utils.near_duplicates import NearDuplicateIndex
+from tests.helpers import make_job
+
+
+def postings():
+    return [
+        make_job(title='Senior Software Engineer', company='Acme Inc', location='Austin, TX',
+                 link='https://dice.example.com/1', source='Dice'),
+        make_job(title='Sr. Software Engineer', company='Acme', location='Austin, TX',
+                 link='https://builtin.example.com/9', source='BuiltIn'),
+        make_job(title='Senior Software Engineer', company='Globex', location='Austin, TX',
+                 link='https://dice.example.com/2', source='Dice'),
+        make_job(title='Senior Frontend Engineer', company='Acme', location='Remote',
+                 link='https://dice.example.com/3', source='Dice')
+    ]
+
+
+def test_merges_the_same_role_across_boards_and_keeps_the_source():
+    jobs = NearDuplicateIndex().collapse(postings())
+    assert [job.link for job in jobs] == [
+        'https://dice.example.com/1', 'https://dice.example.com/2', 'https://dice.example.com/3'
+    ]
+    assert jobs[0].source == 'Dice'
+    assert jobs[0].sources == ('Dice', 'BuiltIn')
+    assert jobs[1].sources == () and jobs[2].sources == ()
+
+
+def test_saved_signatures_drop_later_copies():
+    index = NearDuplicateIndex()
+    index.collapse(postings())
+    index.save()
+    assert NearDuplicateIndex().collapse(postings()[1:2]) == []
+
+
+def test_unsaved_cycle_is_forgotten():
+    index = NearDuplicateIndex()
+    index.collapse(postings())  # the jobs were never stored, so save() was not called
+    assert len(index.collapse(postings())) == 3
+
+
+def test_merged_jobs_are_found_by_their_board(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.save_jobs(NearDuplicateIndex().collapse(postings()))
+    dice = store.jobs(source='Dice')
+    assert len(dice) == 3
+    assert [job.sources for job in dice if job.sources] == [('Dice', 'BuiltIn')]
+    assert store.jobs(source='BuiltIn') == []
+
+
+def test_merged_jobs_are_archived_under_their_board(tmp_path, settings):
+    pytest.importorskip('pyarrow')
+    from src.utils.job_archive import JobArchive
+    settings['archive'] = {'dir': str(tmp_path / 'archive')}
+    archive = JobArchive()
+    archive.append(NearDuplicateIndex().collapse(postings()))
+    frame = archive.query(sources=['Dice'])
+    assert len(frame) == 3
+    assert sorted(len(sources) for sources in frame['sources']) == [0, 0, 2]
+
+
+def test_merges_slightly_different_company_spellings():
+    jobs = NearDuplicateIndex().collapse([
+        make_job(title='Senior Software Engineer', company='Initech Software', location='Austin, TX',
+                 link='https://dice.example.com/1', source='Dice'),
+        make_job(title='Senior Software Engineer', company='Initech Sofware', location='Austin, TX',
+                 link='https://builtin.example.com/1', source='BuiltIn')
+    ])
+    assert [job.sources for job in jobs] == [('Dice', 'BuiltIn')]
+
+
+@pytest.mark.parametrize('first, second', [
+    ('Software Engineer II', 'Software Engineer III'),
+    ('Senior Software Engineer', 'Software Engineer'),
+    ('Staff Software Engineer', 'Principal Software Engineer'),
+])
+def test_keeps_roles_of_different_levels_apart(first, second):
+    jobs = NearDuplicateIndex().collapse([
+        make_job(title=first, link='https://dice.example.com/1', source='Dice'),
+        make_job(title=second, link='https://builtin.example.com/1', source='BuiltIn')
+    ])
+    assert [job.title for job in jobs] == [first, second]
+    assert all(job.sources == () for job in jobs)
+
+
+def test_keeps_look_alike_openings_on_one_board():
+    jobs = NearDuplicateIndex().collapse([
+        make_job(link='https://dice.example.com/1', source='Dice'),
+        make_job(link='https://dice.example.com/2', source='Dice'),
+        make_job(link='https://builtin.example.com/1', source='BuiltIn')
+    ])
+    assert [job.link for job in jobs] == ['https://dice.example.com/1', 'https://dice.example.com/2']
+    assert jobs[0].sources == ('Dice', 'BuiltIn') and jobs[1].sources == ()
+
+
+def test_saved_role_does_not_suppress_another_level_or_opening():
+    index = NearDuplicateIndex()
+    index.collapse([make_job(title='Software Engineer II', link='https://dice.example.com/1', source='Dice')])
+    index.save()
+    later = NearDuplicateIndex().collapse([
+        make_job(title='Software Engineer III', link='https://builtin.example.com/1', source='BuiltIn'),
+        make_job(title='Software Engineer II', link='https://dice.example.com/2', source='Dice'),
+        make_job(title='Software Engineer II', link='https://builtin.example.com/2', source='BuiltIn')
+    ])
+    assert [job.link for job in later] == ['https://builtin.example.com/1', 'https://dice.example.com/2']
+
+
+def test_index_in_the_old_format_is_replaced():
+    index = NearDuplicateIndex()
+    os.makedirs(os.path.dirname(index.index_file), exist_ok=True)
+    with open(index.index_file, 'wb') as f:
+        f.write(struct.pack('<4sII', b'MNHS', index.num_perm, 1) + bytes(4 * (index.num_perm + 2)))
+    assert NearDuplicateIndex().signatures == []
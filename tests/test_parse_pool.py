@@ -0,0 +1,27 @@
+import pytest
+from aiohttp import web
+from src.utils.parse_pool import ParsePool
+from tests.helpers import CARD_FIELDS, make_scraper, search_page, serve, run
+
+
+@pytest.mark.parametrize('executor', ['inline', 'thread', 'process'])
+def test_every_executor_parses_the_same_jobs(settings, executor):
+    settings['parsing'] = {'executor': executor, 'workers': 1}
+
+    async def handler(request):
+        return web.Response(text=search_page(4), content_type='text/html')
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        scraper = make_scraper(base_url, fields=CARD_FIELDS)
+        scraper.parse_pool = ParsePool()
+        try:
+            return await scraper.scrape_page(base_url + '/jobs')
+        finally:
+            scraper.parse_pool.shutdown()
+            await scraper._close_session()
+            await runner.cleanup()
+
+    jobs = run(scenario())
+    assert [job.link for job in jobs] == [f'https://example.com/jobs/{index}' for index in range(4)]
+    assert all(job.company == 'Acme' and job.source == 'Test' for job in jobs)
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+from src.utils import rate_limiter
+from src.utils.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+from tests.helpers import run
+
+URL = 'https://example.com/jobs'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def limiter(settings, clock):
+    settings['rate_limit'] = {
+        'initial_rate': 1.0, 'min_rate': 0.1, 'max_rate': 1.2, 'burst': 2, 'increase_step': 0.1,
+        'decrease_factor': 0.5, 'max_retry_after': 60, 'window': 4
+    }
+    return RateLimiter()
+
+
+def test_bucket_allows_a_burst_then_waits_for_refill(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2, window=4)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.reserve() == 0
+
+
+def test_bucket_refill_is_capped_at_its_capacity(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2, window=4)
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(3)][:2] == [0, 0]
+    assert bucket.tokens < 1
+
+
+def test_throttling_halves_the_rate_and_empties_the_bucket(limiter):
+    for status, retry_after in ((429, None), (503, '1')):
+        rate = limiter._bucket(URL).rate
+        limiter.record(URL, status, retry_after)
+        assert limiter._bucket(URL).rate == pytest.approx(rate / 2)
+        assert limiter._bucket(URL).tokens == 0
+
+
+def test_plain_503_is_not_throttling(limiter):
+    limiter.record(URL, 503)
+    assert limiter.rates() == {'example.com': 1.1}
+
+
+def test_success_recovers_additively_once_throttling_leaves_the_window(limiter):
+    limiter.record(URL, 429)
+    rate = limiter._bucket(URL).rate
+    for _ in range(3):
+        limiter.record(URL, 200)
+    assert limiter._bucket(URL).rate == rate  # the 429 is still among the last four responses
+    limiter.record(URL, 200)
+    assert limiter._bucket(URL).rate == pytest.approx(rate + 0.1)
+    limiter.record(URL, 200)
+    assert limiter._bucket(URL).rate == pytest.approx(rate + 0.2)
+
+
+def test_rate_is_clamped_to_the_floor_and_ceiling(limiter):
+    for _ in range(10):
+        limiter.record(URL, 429)
+    assert limiter.rates() == {'example.com': 0.1}
+    limiter.buckets.clear()
+    for _ in range(10):
+        limiter.record(URL, 200)
+    assert limiter.rates() == {'example.com': 1.2}
+    assert limiter._bucket('https://fast.example.com', initial_rate=50).rate == 1.2
+    assert limiter._bucket('https://slow.example.com', initial_rate=0.001).rate == 0.1
+
+
+def test_retry_after_blocks_the_host_up_to_the_cap(limiter, clock):
+    limiter.record(URL, 429, '3600')
+    bucket = limiter._bucket(URL)
+    assert bucket.blocked_until == clock.now + 60
+    clock.now += 59
+    assert bucket.reserve() == pytest.approx(1)
+
+
+def test_acquire_waits_for_a_token(limiter, monkeypatch):
+    waits = []
+
+    async def sleep(seconds):
+        waits.append(seconds)
+        limiter._bucket(URL).tokens = 1
+
+    monkeypatch.setattr(rate_limiter.asyncio, 'sleep', sleep)
+    for _ in range(3):
+        run(limiter.acquire(URL))
+    assert waits == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('120', 120.0),
+    (' 5 ', 5.0),
+    ('0', 0.0),
+    (None, None),
+    ('', None),
+    ('soon', None),
+    ('-5', None),
+    ('1.5', None),
+])
+def test_parses_retry_after_seconds_and_garbage(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parses_retry_after_http_dates():
+    later = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert parse_retry_after(format_datetime(later, usegmt=True)) == pytest.approx(90, abs=2)
+    earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(earlier, usegmt=True)) == 0.0
@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from src.utils.request_planner import RequestPlanner
+from tests.helpers import run
+
+
+def test_runs_each_key_once_per_cycle():
+    planner = RequestPlanner()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f'page {key}'
+
+    async def cycle():
+        return await asyncio.gather(*(planner.run(key, lambda key=key: fetch(key)) for key in (1, 2, 1, 1)))
+
+    assert run(cycle()) == ['page 1', 'page 2', 'page 1', 'page 1']
+    assert calls == [1, 2]
+    assert planner.stats == {'requested': 4, 'executed': 2, 'saved': 2}
+
+    planner.begin_cycle()
+    run(cycle())
+    assert calls == [1, 2, 1, 2]
+
+
+def test_a_cancelled_caller_does_not_cancel_the_others():
+    planner = RequestPlanner()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return 'page'
+
+    async def scenario():
+        first = asyncio.ensure_future(planner.run('url', fetch))
+        second = asyncio.ensure_future(planner.run('url', fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert run(scenario()) == 'page'
+
+
+def test_failures_reach_every_caller():
+    planner = RequestPlanner()
+
+    async def fetch():
+        raise ValueError('boom')
+
+    async def scenario():
+        return await asyncio.gather(planner.run('url', fetch), planner.run('url', fetch), return_exceptions=True)
+
+    assert [type(result) for result in run(scenario())] == [ValueError, ValueError]
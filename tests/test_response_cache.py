@@ -0,0 +1,109 @@
+import time
+from aiohttp import web
+from src.utils.response_cache import ResponseCache
+from tests.helpers import make_scraper, serve, run
+
+
+def test_only_stores_responses_it_can_reuse():
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'plain', {})
+    cache.store('https://example.com/b', 'tagged', {'ETag': '"v1"'})
+    cache.store('https://example.com/c', 'fresh', {}, ttl=60)
+    assert cache.get('https://example.com/a') is None
+    assert cache.read('https://example.com/b') == 'tagged'
+    assert cache.conditional_headers(cache.get('https://example.com/b')) == {'If-None-Match': '"v1"'}
+    assert cache.is_fresh(cache.get('https://example.com/c'), ttl=60)
+    assert not cache.is_fresh(cache.get('https://example.com/b'), ttl=0)
+
+
+def test_freshness_expires_after_the_ttl():
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'body', {'Last-Modified': 'Mon, 02 Mar 2026 09:00:00 GMT'}, ttl=60)
+    entry = cache.get('https://example.com/a')
+    entry['validated_at'] = time.time() - 61
+    assert not cache.is_fresh(entry, ttl=60)
+    cache.read('https://example.com/a', revalidated=True)
+    assert cache.is_fresh(entry, ttl=60)
+
+
+def test_evicts_least_recently_used_beyond_the_size_limit(settings):
+    settings['cache'] = {'http_cache_max_mb': 10 / (1024 * 1024)}  # ten bytes
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'aaaa', {'ETag': 'a'})
+    cache.store('https://example.com/b', 'bbbb', {'ETag': 'b'})
+    cache.get('https://example.com/a')
+    cache.store('https://example.com/c', 'cccc', {'ETag': 'c'})
+    assert list(cache.entries) == ['https://example.com/a', 'https://example.com/c']
+    assert cache.total_bytes == 8
+
+
+def test_index_survives_a_restart():
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'body', {'ETag': '"v1"'})
+    cache.save()
+    reloaded = ResponseCache()
+    assert reloaded.get('https://example.com/a')['etag'] == '"v1"'
+    assert reloaded.read('https://example.com/a') == 'body'
+
+
+def test_revalidates_with_the_etag_and_serves_the_cached_page():
+    conditional = []
+
+    async def handler(request):
+        conditional.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text='<html>page</html>', content_type='text/html', headers={'ETag': '"v1"'})
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        scraper = make_scraper(base_url)
+        try:
+            return [await scraper.fetch_page(base_url + '/jobs') for _ in range(2)]
+        finally:
+            await scraper._close_session()
+            await runner.cleanup()
+
+    assert run(scenario()) == ['<html>page</html>', '<html>page</html>']
+    assert conditional == [None, '"v1"']
+
+
+def test_revalidation_keeps_the_validators_a_304_sends():
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'body', {'ETag': '"v1"'})
+    assert cache.read('https://example.com/a', revalidated=True, headers={'ETag': '"v2"'}) == 'body'
+    assert cache.conditional_headers(cache.get('https://example.com/a')) == {'If-None-Match': '"v2"'}
+    cache.read('https://example.com/a', revalidated=True, headers={})
+    assert cache.get('https://example.com/a')['etag'] == '"v2"'
+
+
+def test_reading_an_evicted_entry_after_a_304_misses():
+    cache = ResponseCache()
+    cache.store('https://example.com/a', 'body', {'ETag': '"v1"'})
+    cache.remove('https://example.com/a')
+    assert cache.read('https://example.com/a', revalidated=True) is None
+
+
+def test_falls_back_to_a_full_get_when_the_entry_is_evicted_during_revalidation():
+    conditional = []
+    scrapers = []
+
+    async def handler(request):
+        conditional.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            scrapers[0].http_client.response_cache.remove(str(request.url))  # evicted while the 304 is in flight
+            return web.Response(status=304)
+        return web.Response(text='<html>page</html>', content_type='text/html', headers={'ETag': '"v1"'})
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        scraper = make_scraper(base_url)
+        scrapers.append(scraper)
+        try:
+            return [await scraper.fetch_page(base_url + '/jobs') for _ in range(2)]
+        finally:
+            await scraper._close_session()
+            await runner.cleanup()
+
+    assert run(scenario()) == ['<html>page</html>', '<html>page</html>']
+    assert conditional == [None, '"v1"', None]
@@ -0,0 +1,55 @@
+import time
+from src.utils.seen_index import SeenIndex
+from tests.helpers import make_job
+
+DAY = 24 * 3600
+
+
+def test_jobs_are_new_until_committed():
+    index = SeenIndex()
+    jobs = [make_job(link='https://example.com/jobs/1'), make_job(title='Data Engineer', link='https://example.com/jobs/2')]
+    assert index.filter_new(jobs) == jobs
+    assert index.filter_new(jobs) == jobs  # the save failed, nothing was committed
+    index.commit()
+    assert index.filter_new(jobs) == []
+
+
+def test_first_of_several_duplicates_wins():
+    first = make_job(link='https://example.com/jobs/1', source='Dice')
+    syndicated = make_job(link='https://other.example.com/post/9', source='BuiltIn')
+    tracked = make_job(title='Renamed', link='https://www.example.com/jobs/1/?utm_source=feed')
+    assert SeenIndex().filter_new([first, syndicated, tracked]) == [first]
+
+
+def test_same_role_in_another_city_is_new():
+    index = SeenIndex()
+    index.filter_new([make_job(location='Austin, TX', link='https://example.com/jobs/1')])
+    index.commit()
+    other_city = make_job(location='Denver, CO', link='https://example.com/jobs/2')
+    assert index.filter_new([other_city]) == [other_city]
+
+
+def test_index_is_saved_and_loaded():
+    job = make_job()
+    index = SeenIndex()
+    index.filter_new([job])
+    index.commit()
+    assert SeenIndex().filter_new([job]) == []
+
+
+def test_fingerprints_expire_while_listed_links_stay_seen(monkeypatch):
+    clock = [1_700_000_000.0]
+    monkeypatch.setattr(time, 'time', lambda: clock[0])
+    listed = make_job(link='https://example.com/jobs/1')
+    reposted = make_job(link='https://example.com/jobs/2')
+
+    index = SeenIndex()
+    index.filter_new([listed])
+    index.commit()
+
+    clock[0] += 10 * DAY
+    assert index.filter_new([listed, reposted]) == []
+    index.commit()
+
+    clock[0] += 5 * DAY  # the fingerprint was last recorded 15 days ago, the link 5
+    assert index.filter_new([listed, reposted]) == [reposted]
@@ -0,0 +1,95 @@
+import dataclasses
+import pytest
+from aiohttp import web
+from src.scrapers.spec_scraper import SpecScraper, load_source_specs
+from src.utils.html_parser import PARSER_BACKENDS, _available, make_soup
+from tests.helpers import search_page, serve, run
+
+SOURCES = 'config/sources.yaml'
+
+
+@pytest.fixture
+def dice(request):
+    specs = load_source_specs(str(request.config.rootpath / SOURCES))
+    spec = next(spec for spec in specs if spec.name == 'Dice')
+    scraper = SpecScraper(spec)
+    scraper.rate_limit_delay = 0.001
+    return scraper
+
+
+@pytest.mark.parametrize('backend', [backend for backend in PARSER_BACKENDS if _available(backend)])
+@pytest.mark.parametrize('partial', [False, True])
+def test_backends_extract_the_same_jobs(dice, backend, partial):
+    dice.parser_backend = backend
+    dice.parse_only = ('div', 'card') if partial else None
+    jobs = list(dice._parse_rows(search_page(5), {}))
+    assert [job.title for job in jobs] == [f'Software Engineer {index}' for index in range(5)]
+    assert {job.link for job in jobs} == {f'https://example.com/jobs/{index}' for index in range(5)}
+    assert all(job.is_remote and job.company == 'Acme' and job.source == 'Dice' for job in jobs)
+
+
+def test_one_impossible_date_does_not_lose_the_page(dice):
+    html = search_page(3).replace('10 minutes ago', '2024-02-30', 1)
+    jobs = dice._parse_jobs(make_soup(html))
+    assert len(jobs) == 3
+
+
+def test_a_failing_card_is_skipped_and_the_rest_kept(dice, monkeypatch):
+    build = SpecScraper._job_from_card
+
+    def flaky(self, card, now, **context):
+        if card['title'].endswith('1'):
+            raise ValueError('bad card')
+        return build(self, card, now, **context)
+
+    monkeypatch.setattr(SpecScraper, '_job_from_card', flaky)
+    jobs = dice._parse_jobs(make_soup(search_page(3)))
+    assert [job.title for job in jobs] == ['Software Engineer 0', 'Software Engineer 2']
+
+
+def test_paginates_until_an_empty_page(dice):
+    requested = []
+
+    async def handler(request):
+        page = int(request.query.get('page', 1))
+        requested.append(page)
+        return web.Response(text=search_page(3) if page <= 2 else '<html></html>', content_type='text/html')
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        dice.spec = dataclasses.replace(dice.spec, search_url=base_url + '/jobs?q={query}', max_pages=5)
+        try:
+            return await dice.scrape_jobs(['Software Engineer'])
+        finally:
+            await dice._close_session()
+            await runner.cleanup()
+
+    jobs = run(scenario())
+    assert len(jobs) == 6
+    assert requested == [1, 2, 3]
+    assert dice.page_stats['stops'] == {'empty': 1}
+
+
+def test_stops_after_a_page_of_stale_postings(dice):
+    requested = []
+
+    async def handler(request):
+        page = int(request.query.get('page', 1))
+        requested.append(page)
+        posted = '3 hours ago' if page == 2 else '10 minutes ago'
+        return web.Response(text=search_page(3, posted=posted, title=f'Page {page} Engineer {{index}}'),
+                            content_type='text/html')
+
+    async def scenario():
+        runner, base_url = await serve(handler)
+        dice.spec = dataclasses.replace(dice.spec, search_url=base_url + '/jobs?q={query}', max_pages=5)
+        try:
+            return await dice.scrape_jobs(['Software Engineer'])
+        finally:
+            await dice._close_session()
+            await runner.cleanup()
+
+    jobs = run(scenario())
+    assert requested == [1, 2]  # page 3 would have fresh postings again, but is never fetched
+    assert len(jobs) == 6 and not any(job.title.startswith('Page 3') for job in jobs)
+    assert dice.page_stats['stops'] == {'stale': 1}
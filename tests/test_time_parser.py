@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta
+import pytest
+from src.utils.time_parser import parse_time
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('3 hours ago', NOW - timedelta(hours=3)),
+    ('an hour ago', NOW - timedelta(hours=1)),
+    ('45 mins ago', NOW - timedelta(minutes=45)),
+    ('2d ago', NOW - timedelta(days=2)),
+    ('Just now', NOW),
+    ('Posted yesterday', NOW - timedelta(days=1)),
+    ('2026-03-09T08:30:00', datetime(2026, 3, 9, 8, 30)),
+])
+def test_parses_relative_and_absolute_times(text, expected):
+    assert parse_time(text, NOW) == expected
+
+
+@pytest.mark.parametrize('value', [
+    '2024-02-30', '2024-13-01T00:00:00Z', '99999999999999999999', 'recently', '', None, -5, 1e30
+])
+def test_unknown_or_impossible_values_give_now(value):
+    assert parse_time(value, NOW) == NOW
+
+
+def test_epoch_seconds_and_milliseconds_agree():
+    assert parse_time(1700000000, NOW) == parse_time(1700000000000, NOW) == datetime.fromtimestamp(1700000000)
@@ -0,0 +1,10 @@
+from src.utils.url_utils import canonical_url
+
+
+def test_links_to_the_same_posting_compare_equal():
+    assert canonical_url('https://www.Example.com/jobs/1/?utm_source=x&b=2&a=1&gclid=z') == \
+        canonical_url(' http://example.com/jobs/1?a=1&b=2 ') == '//example.com/jobs/1?a=1&b=2'
+
+
+def test_keeps_parameters_that_identify_the_posting():
+    assert canonical_url('https://example.com/view?jobid=1') != canonical_url('https://example.com/view?jobid=2')